@@ -1,7 +1,9 @@
-import requests
-from bs4 import BeautifulSoup
+import ordinance_http_client
+import ordinance_parser
 import urllib.parse
 import json
+from concurrent.futures import ThreadPoolExecutor
+from ordinance_scraper_constant import Constant
 
 
 def url_to_search(administrative_code, search_keyword):
@@ -45,31 +47,26 @@ def get_ordinance_link(administrative_code, search_keyword):
            '&category=LAW'
            f'&srchKwd={encoded_search_keyword}')
 
-    # 요청 헤더 설정
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
-
     #################################################
     # 2.requests로 요청하여 beautifulsoup로 크롤링
     #################################################
     # 웹페이지 요청
-    req = requests.get(url, headers=headers)
-    # BeautifulSoup로 파싱
-    soup = BeautifulSoup(req.text, "html.parser")
+    html = ordinance_http_client.get_text(url)
+    # BeautifulSoup로 파싱 (검색결과 영역만)
+    soup = ordinance_parser.make_search_soup(html)
     # 조례 제목 불러오기 조회가 안될경우 None retrun
-    ordinance_element = soup.select_one('#container > div.inner > div > div.search-result-list > div > a > strong')
+    ordinance_element = ordinance_parser.select_one(soup, 'region_ordinance_title')
     if ordinance_element is None:
         return None
     ordinance_title = ordinance_element.get_text()[367:-12]
     # 조례에 관한 정보 불러오기
-    ordinance_info = soup.select_one('#container > div.inner > div > div.search-result-list > div > a > span').get_text()
+    ordinance_info = ordinance_parser.select_one(soup, 'region_ordinance_info').get_text()
     # 조례 제개정일 불러오기
     ordinance_update_date = ordinance_info.split(' ')[2]
     # 조례 관리담당부서 불러오기
     ordinance_department = ' '.join(ordinance_info.split(' ')[3:])
     # 조례 페이지 파라미터 불러오기
-    ordinance_page_parameters = soup.select_one('#container > div.inner > div > div.search-result-list > div > div > a').get('onclick')
+    ordinance_page_parameters = ordinance_parser.select_one(soup, 'region_ordinance_link').get('onclick')
     # 원하는 파라미터 추출
     ordinance_page_parameters = (
         ordinance_page_parameters[ordinance_page_parameters.find("s('") + 3:
@@ -112,12 +109,13 @@ class Elis:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         }
 
-    def verify_and_fetch(self, dict_to_search, search_keyword):
+    def verify_and_fetch(self, dict_to_search, search_keyword, max_workers=Constant.REGION_WORKERS):
         """
         시군구별 조례를 조회 하여 각 정보를 딕셔너리형태로 리턴
         해당없는 조례는 None retrun
         :param dict_to_search: 조회할 딕셔너리값 ex) {"경북 봉화군": "47":"920"}
         :param search_keyword: 조회할 키워드 ex) {실종자 수색}
+        :param max_workers: 동시에 조회할 스레드 수 (1 이하이면 순차 조회)
         :return: 조회된 값
                 ex) {"경북 봉화군" : {"title": "실종자 수색 지원 조례",  조례제목
                                     "update_date": "2024.12.01"     제개정일
@@ -127,15 +125,25 @@ class Elis:
         # 비교할 시군구 초기 변수선언
         self.admin_code_dict_to_compeare = {}
 
-        for admin, code in dict_to_search.items():
-            # 시군구별 순차적으로 조회하여 추가
-            info = get_ordinance_link(code, search_keyword)
+        admins = list(dict_to_search.keys())
+        codes = list(dict_to_search.values())
+
+        if max_workers is None or max_workers <= 1:
+            # 시군구별 순차적으로 조회
+            infos = [get_ordinance_link(code, search_keyword) for code in codes]
+        else:
+            # 시군구별 병렬 조회 (map은 입력 순서대로 결과를 돌려주므로 출력 순서가 유지됨)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                infos = list(executor.map(get_ordinance_link, codes, [search_keyword] * len(codes)))
+
+        for admin, info in zip(admins, infos):
             self.admin_code_dict_to_compeare[admin] = info
             if info is not None:
                 print(admin, info['title'])
             else:
                 print(admin, '조례없음')
         print(self.admin_code_dict_to_compeare)
+        return self.admin_code_dict_to_compeare
 
 
 if __name__ == '__main__':
@@ -1,7 +1,7 @@
 # from selenium import webdriver
 # from selenium.webdriver.chrome.options import Options
 import urllib.parse
-import requests
+import ordinance_http_client
 from bs4 import BeautifulSoup
 from collections import Counter  # 요소의 개수를 쉽게 계산할 수 있는 Counter 모듈 불러오기
 import xlwrite
@@ -188,7 +188,7 @@ class OpenCrawler:
         url = 'https://www.elis.go.kr/main/totSrchList?ctpvCd=&sggCd=&curPage=1&srchKwd='
 
         # 웹페이지 요청
-        req = requests.get(url + encode_url(self.keyword), headers=self.headers)
+        req = ordinance_http_client.get(url + encode_url(self.keyword))
         # BeautifulSoup로 파싱
         soup = BeautifulSoup(req.text, "html.parser")
 
@@ -213,9 +213,9 @@ class OpenCrawler:
         for page_number in range(numbers_page):
 
             # 검색웹페이지 요청
-            req = requests.get(f'https://www.elis.go.kr/main/totSrchList?ctpvCd=&sggCd=&'
-                               f'curPage={page_number + 1}'
-                               f'&srchKwd={encode_url(self.keyword)}', headers=self.headers)
+            req = ordinance_http_client.get(f'https://www.elis.go.kr/main/totSrchList?ctpvCd=&sggCd=&'
+                                            f'curPage={page_number + 1}'
+                                            f'&srchKwd={encode_url(self.keyword)}')
             # BeautifulSoup로 파싱
             soup = BeautifulSoup(req.text, "html.parser")
 
@@ -251,7 +251,7 @@ class OpenCrawler:
         for ordinanace_admin, ordinanace_info in self.admin_ordinance_dict.items():
             print(f'{ordinanace_admin} 조회 중')
             # 조례 페이지 요청
-            req = requests.get(ordinanace_info['page_address'], headers=self.headers)
+            req = ordinance_http_client.get(ordinanace_info['page_address'])
             # BeautifulSoup로 파싱
             soup = BeautifulSoup(req.text, "html.parser")
 
@@ -1,8 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
+import ordinance_http_client
+import ordinance_parser
+from ordinance_clause_extractor import extract_paragraph_lines
 import urllib.parse
 import json
 from ttkwidgets import CheckboxTreeview
@@ -53,31 +54,26 @@ def get_ordinance_link(administrative_code, search_keyword):
            '&category=LAW'
            f'&srchKwd={encoded_search_keyword}')
 
-    # 요청 헤더 설정
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
-
     #################################################
     # 2.requests로 요청하여 beautifulsoup로 크롤링
     #################################################
     # 웹페이지 요청
-    req = requests.get(url, headers=headers)
-    # BeautifulSoup로 파싱
-    soup = BeautifulSoup(req.text, "html.parser")
+    html = ordinance_http_client.get_text(url)
+    # BeautifulSoup로 파싱 (검색결과 영역만)
+    soup = ordinance_parser.make_search_soup(html)
     # 조례 제목 불러오기 조회가 안될경우 None retrun
-    ordinance_element = soup.select_one('#container > div.inner > div > div.search-result-list > div > a > strong')
+    ordinance_element = ordinance_parser.select_one(soup, 'region_ordinance_title')
     if ordinance_element is None:
         return None
     ordinance_title = ordinance_element.get_text()[367:-12]
     # 조례에 관한 정보 불러오기
-    ordinance_info = soup.select_one('#container > div.inner > div > div.search-result-list > div > a > span').get_text()
+    ordinance_info = ordinance_parser.select_one(soup, 'region_ordinance_info').get_text()
     # 조례 제개정일 불러오기
     ordinance_update_date = ordinance_info.split(' ')[2]
     # 조례 관리담당부서 불러오기
     ordinance_department = ' '.join(ordinance_info.split(' ')[3:])
     # 조례 페이지 파라미터 불러오기
-    ordinance_page_parameters = soup.select_one('#container > div.inner > div > div.search-result-list > div > div > a').get('onclick')
+    ordinance_page_parameters = ordinance_parser.select_one(soup, 'region_ordinance_link').get('onclick')
     # 원하는 파라미터 추출
     ordinance_page_parameters = (
         ordinance_page_parameters[ordinance_page_parameters.find("s('") + 3:
@@ -133,21 +129,10 @@ def get_text_excluding_child_p(element):
 def parse_paragraph(p_tag):
     """
     1) 현재 <p> 태그가 가진 텍스트(자식 <p> 제외)를 추출
-    2) 자식 <p>를 순회하며 재귀적으로 같은 작업을 수행
+    2) 자식 <p>를 순서대로 같은 방식으로 처리 (재귀 대신 반복문, ordinance_clause_extractor 사용)
     3) 각 결과를 줄바꿈을 넣어 리스트로 반환
     """
-    lines = []
-    # 1) 우선 부모 <p> 자체 텍스트
-    parent_text = get_text_excluding_child_p(p_tag)
-    if parent_text:
-        lines.append(parent_text)
-
-    # 2) 자식 <p>들에 대해 재귀 파싱
-    #    recursive=False 로 해야 '직계 자식'만 순회 (손자 이상의 <p> 중복 방지)
-    for child_p in p_tag.find_all('p', recursive=False):
-        lines.extend(parse_paragraph(child_p))
-
-    return lines
+    return extract_paragraph_lines(p_tag)
 
 
 def get_ordinance_clause_titles(ordinance_url):
@@ -163,23 +148,14 @@ def get_ordinance_clause_titles(ordinance_url):
             - article_number_to_url (dict): 조항 번호(정수) -> URL 경로(문자열) 매핑.
     """
 
-    # 브라우저처럼 보이도록 요청 헤더를 설정합니다.
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        )
-    }
-
-    # 지정한 URL에 GET 요청을 보내 웹페이지의 HTML을 가져옵니다.
-    response = requests.get(ordinance_url, headers=headers)
+    # 공용 세션(커넥션 풀, 기본 헤더, 디스크 캐시 포함)으로 웹페이지의 HTML을 가져옵니다.
+    html = ordinance_http_client.get_text(ordinance_url)
 
     # BeautifulSoup를 사용해 HTML 텍스트를 파싱합니다.
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = ordinance_parser.make_detail_soup(html)
 
     # CSS 선택자를 사용해 네비게이션 내의 조 항목(a 태그) 요소들을 찾습니다.
-    clause_link_elements = soup.select('#cms-lnb > ul > li.curr > ul > li.curr > ul > li > a')
+    clause_link_elements = ordinance_parser.select(soup, 'clause_link_elements')
 
     # 조 제목과 조항 번호에 대응하는 URL 정보를 저장할 딕셔너리를 초기화합니다.
     clause_title_to_url = {}
@@ -1,6 +1,6 @@
-import difflib
 import re
 import json
+import clause_diff
 
 
 def create_tabbed_comparison_html(clause_data):
@@ -16,6 +16,9 @@ def create_tabbed_comparison_html(clause_data):
     # 조항 목록 (탭으로 표시될 항목들)
     clause_titles = list(clause_data.keys())
 
+    # 차이 강조 결과 재사용 (같은 내용의 문단은 차이를 한 번만 계산)
+    highlight_cache = clause_diff.HighlightCache()
+
     # HTML 문서의 기본 구조와 스타일 설정
     html_output = """
     <!DOCTYPE html>
@@ -200,7 +203,7 @@ def create_tabbed_comparison_html(clause_data):
 
                 # 첫 번째 시군구가 아닌 경우 차이점 강조
                 if city_name != base_city and city_text and base_text:
-                    city_text_highlighted = highlight_differences(base_text, city_text)
+                    city_text_highlighted = highlight_cache.highlight(base_text, city_text)
                 else:
                     city_text_highlighted = city_text
 
@@ -250,12 +253,14 @@ def create_tabbed_comparison_html(clause_data):
     </html>
     """
 
+    print(f"차이 계산 {highlight_cache.misses}회, 재사용 {highlight_cache.hits}회")
     return html_output
 
 
 def highlight_differences(base_text, compare_text):
     """
     두 텍스트 간의 차이점을 강조 표시하는 함수
+    차이 계산은 clause_diff 에 맡김 (기본 단어 단위 Myers, clause_diff.set_engine 으로 변경)
 
     Args:
         base_text (str): 기준 텍스트
@@ -264,18 +269,7 @@ def highlight_differences(base_text, compare_text):
     Returns:
         str: 차이점이 강조 표시된, 비교 텍스트의 HTML
     """
-    # 단어 단위로 비교하여 차이점 강조 표시
-    s = difflib.SequenceMatcher(None, base_text, compare_text)
-    result = ""
-
-    for tag, i1, i2, j1, j2 in s.get_opcodes():
-        if tag == 'equal':  # 동일한 부분
-            result += compare_text[j1:j2]
-        elif tag in ['replace', 'insert']:  # 대체되거나 삽입된 부분
-            result += f'<span class="diff">{compare_text[j1:j2]}</span>'
-        # 'delete' 태그는 비교 텍스트에 없는 부분이므로 처리하지 않음
-
-    return result
+    return clause_diff.highlight_differences(base_text, compare_text)
 
 
 # 테스트 데이터: 여러 시군구의 조례 내용을 담은 구조화된 딕셔너리
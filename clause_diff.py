@@ -0,0 +1,258 @@
+import difflib
+import hashlib
+import html
+import re
+from ordinance_scraper_constant import Constant
+
+# rapidfuzz 는 선택 (설치되어 있으면 C++ 구현으로 단어 단위 차이 계산)
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:
+    Indel = None
+
+# ------ 상수 선언 ------
+_TOKEN = re.compile(r'\s+|\w+\s*|[^\w\s]\s*')  # 뒤 공백을 포함한 단어, 기호 (이어 붙이면 원문과 같음)
+_engine = Constant.DIFF_ENGINE  # 현재 차이 계산 방식
+
+
+# ------ 함수 목록 ------
+def tokenize(text):
+    """
+    단어 단위 토큰 분리 (뒤 공백은 앞 토큰에 붙여 공백끼리 맞춰지지 않도록 하고, 이어 붙이면 원문과 같음)
+    ex) '제2조(정의) 이 조례' -> ['제2조', '(', '정의', ') ', '이 ', '조례']
+    """
+    return _TOKEN.findall(text)
+
+
+def set_engine(engine):
+    """
+    차이 계산 방식 선택
+    :param engine: 'myers' (단어 단위 Myers), 'rapidfuzz' (단어 단위, rapidfuzz 필요), 'difflib' (기존 글자 단위)
+    """
+    global _engine
+    if engine not in ('myers', 'rapidfuzz', 'difflib'):
+        raise ValueError(f'지원하지 않는 차이 계산 방식 : {engine}')
+    if engine == 'rapidfuzz' and Indel is None:
+        raise ImportError('rapidfuzz 가 설치되어 있지 않습니다 (pip install rapidfuzz)')
+    _engine = engine
+
+
+def get_engine():
+    return _engine
+
+
+def myers_opcodes(base_tokens, compare_tokens, max_cost=Constant.DIFF_MAX_COST):
+    """
+    Myers O(ND) 차이 계산 (삽입/삭제만 사용하는 최소 편집)
+    앞뒤 공통 부분은 먼저 잘라내고, 편집 거리가 max_cost 를 넘으면 남은 가운데를 통째로 replace 로 본다
+    :param base_tokens: 기준 토큰 리스트
+    :param compare_tokens: 비교 토큰 리스트
+    :param max_cost: 최대 편집 거리 (비교 한 번의 작업량 상한)
+    :return: difflib 과 같은 형식의 opcodes [(tag, i1, i2, j1, j2)]
+    """
+    # 앞뒤 공통 부분
+    n, m = len(base_tokens), len(compare_tokens)
+    prefix = 0
+    while prefix < n and prefix < m and base_tokens[prefix] == compare_tokens[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < n - prefix and suffix < m - prefix and \
+            base_tokens[n - 1 - suffix] == compare_tokens[m - 1 - suffix]:
+        suffix += 1
+
+    a = base_tokens[prefix:n - suffix]
+    b = compare_tokens[prefix:m - suffix]
+    opcodes = []
+    if prefix:
+        opcodes.append(('equal', 0, prefix, 0, prefix))
+    if a or b:
+        middle = _myers_middle(a, b, max_cost)
+        if middle is None:
+            middle = [('replace' if a and b else 'delete' if a else 'insert', 0, len(a), 0, len(b))]
+        for tag, i1, i2, j1, j2 in middle:
+            opcodes.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+    if suffix:
+        opcodes.append(('equal', n - suffix, n, m - suffix, m))
+    return opcodes
+
+
+def get_opcodes(base_text, compare_text, engine=None, max_cost=Constant.DIFF_MAX_COST):
+    """
+    차이 계산
+    :return: (비교 텍스트 조각 리스트, opcodes) - opcodes 의 j 인덱스는 조각 리스트 기준
+    """
+    engine = engine or _engine
+    if engine == 'difflib':
+        return compare_text, difflib.SequenceMatcher(None, base_text, compare_text).get_opcodes()
+
+    # 비교는 뒤 공백을 뺀 단어로 (문장 끝 단어도 같은 단어로 맞춤), 출력은 원래 조각으로
+    compare_pieces = tokenize(compare_text)
+    base_tokens = [piece.rstrip() or piece for piece in tokenize(base_text)]
+    compare_tokens = [piece.rstrip() or piece for piece in compare_pieces]
+    if engine == 'rapidfuzz':
+        return compare_pieces, [tuple(opcode) for opcode in Indel.opcodes(base_tokens, compare_tokens)]
+    return compare_pieces, myers_opcodes(base_tokens, compare_tokens, max_cost)
+
+
+def highlight_differences(base_text, compare_text, engine=None, max_cost=Constant.DIFF_MAX_COST, escape=False):
+    """
+    두 텍스트 간의 차이점을 강조 표시 (before/test.py 의 highlight_differences 와 같은 <span class="diff"> 표시)
+    단어 단위 방식은 변경된 단어 사이의 공백도 한 강조 구간에 포함한다
+    :param base_text: 기준 텍스트
+    :param compare_text: 비교할 텍스트
+    :param engine: 차이 계산 방식 (None 이면 set_engine 으로 선택한 방식)
+    :param max_cost: 비교 한 번의 최대 편집 거리 (단어 단위 방식)
+    :param escape: 원문으로 비교하고 출력하는 구간마다 HTML escape (강조 구간이 &gt; 같은 엔티티를 자르지 않음)
+    :return: 차이점이 강조 표시된, 비교 텍스트의 HTML
+    """
+    pieces, opcodes = get_opcodes(base_text, compare_text, engine, max_cost)
+
+    # 비교 텍스트 쪽 구간을 (강조 여부, 시작, 끝) 으로 모음 ('delete' 는 비교 텍스트에 없으므로 제외)
+    segments = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if j1 == j2:
+            continue
+        changed = tag != 'equal'
+        # 강조 구간 사이의 공백만 있는 같은 구간은 강조 구간에 붙임
+        if segments and (changed or pieces[j1:j2] and all(piece.isspace() for piece in pieces[j1:j2])) \
+                and segments[-1][0]:
+            segments[-1][2] = j2
+            continue
+        if segments and segments[-1][0] == changed:
+            segments[-1][2] = j2
+            continue
+        segments.append([changed, j1, j2])
+
+    result = []
+    for changed, start, end in segments:
+        text = ''.join(pieces[start:end])
+        # 강조 구간 끝의 공백은 강조하지 않음
+        if changed:
+            stripped = text.rstrip()
+            result.append(f'<span class="diff">{_escape(stripped, escape)}</span>' if stripped else '')
+            result.append(text[len(stripped):])
+        else:
+            result.append(_escape(text, escape))
+    return ''.join(result)
+
+
+def get_content_hash(text):
+    """
+    문단 내용 해시 (같은 문단 찾기용, 16바이트)
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+# ------ 클래스 선언 ------
+class HighlightCache:
+    """
+    차이 강조 결과 재사용
+    표준안을 그대로 쓴 시군구가 많으면 같은 (기준 문단, 비교 문단) 쌍이 반복되므로
+    내용 해시로 묶어 차이는 고유한 문단마다 한 번만 계산하고 강조 HTML 을 재사용한다
+    """
+
+    def __init__(self, engine=None, max_cost=Constant.DIFF_MAX_COST, escape=False):
+        """
+        :param escape: 강조 결과를 HTML escape (highlight_differences 의 escape)
+        """
+        self.engine = engine
+        self.max_cost = max_cost
+        self.escape = escape
+        self._cache = {}  # {(기준 해시, 비교 해시): 강조 HTML}
+        self.hits = 0
+        self.misses = 0
+
+    def highlight(self, base_text, compare_text):
+        """
+        highlight_differences 와 같지만 같은 쌍은 한 번만 계산
+        기준 문단과 같은 문단은 차이가 없으므로 계산하지 않고 그대로 반환
+        """
+        if compare_text == base_text:
+            self.hits += 1
+            return _escape(compare_text, self.escape)
+        key = (get_content_hash(base_text), get_content_hash(compare_text))
+        highlighted = self._cache.get(key)
+        if highlighted is None:
+            self.misses += 1
+            highlighted = self._cache[key] = highlight_differences(base_text, compare_text, self.engine, self.max_cost,
+                                                                   self.escape)
+        else:
+            self.hits += 1
+        return highlighted
+
+
+# ------ 내부함수 목록 ------
+def _escape(text, escape):
+    return html.escape(text, quote=False) if escape else text
+
+
+def _myers_middle(a, b, max_cost):
+    """
+    Myers 알고리즘 (편집 거리 d 마다 대각선 k 별로 가장 멀리 간 x 를 V 에 보관하고 역추적)
+    :return: opcodes, 편집 거리가 max_cost 를 넘으면 None
+    """
+    n, m = len(a), len(b)
+    offset = min(n + m, max_cost) + 1
+    v = [0] * (2 * offset + 1)
+    trace = []  # d 별 V (대각선 -d .. d)
+    for d in range(offset):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]  # 아래로 이동 (삽입)
+            else:
+                x = v[offset + k - 1] + 1  # 오른쪽으로 이동 (삭제)
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                trace.append(v[offset - d:offset + d + 1])
+                return _backtrack(trace, n, m)
+        trace.append(v[offset - d:offset + d + 1])
+    return None
+
+
+def _backtrack(trace, n, m):
+    # 마지막 d 부터 거꾸로 올라가며 (같은 구간, 편집) 복원
+    steps = []
+    x, y = n, m
+    for d in range(len(trace) - 1, 0, -1):
+        previous = trace[d - 1]
+        k = x - y
+        if k == -d or (k != d and previous[k - 1 + d - 1] < previous[k + 1 + d - 1]):
+            previous_k = k + 1  # 삽입으로 온 경우
+        else:
+            previous_k = k - 1  # 삭제로 온 경우
+        previous_x = previous[previous_k + d - 1]
+        previous_y = previous_x - previous_k
+
+        # 편집 직후 위치에서 (x, y) 까지는 같은 토큰
+        if previous_k == k + 1:
+            start_x, start_y = previous_x, previous_y + 1
+            edit = ('insert', previous_x, previous_x, previous_y, previous_y + 1)
+        else:
+            start_x, start_y = previous_x + 1, previous_y
+            edit = ('delete', previous_x, previous_x + 1, previous_y, previous_y)
+        if x > start_x:
+            steps.append(('equal', start_x, x, start_y, y))
+        steps.append(edit)
+        x, y = previous_x, previous_y
+    if x > 0:
+        steps.append(('equal', 0, x, 0, y))
+
+    # 앞에서부터 정리 (이어지는 삽입/삭제는 replace 하나로)
+    opcodes = []
+    for step in reversed(steps):
+        _append_opcode(opcodes, *step)
+    return opcodes
+
+
+def _append_opcode(opcodes, tag, i1, i2, j1, j2):
+    if opcodes:
+        last_tag, last_i1, last_i2, last_j1, last_j2 = opcodes[-1]
+        if last_tag == tag or (last_tag != 'equal' and tag != 'equal'):
+            merged_tag = tag if last_tag == tag else 'replace'
+            opcodes[-1] = (merged_tag, last_i1, i2, last_j1, j2)
+            return
+    opcodes.append((tag, i1, i2, j1, j2))
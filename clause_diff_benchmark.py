@@ -0,0 +1,71 @@
+import difflib
+import random
+import time
+import clause_diff
+
+
+# ------ 함수 목록 ------
+def legacy_highlight_differences(base_text, compare_text):
+    """
+    기존 highlight_differences (before/test.py)
+    글자 단위 difflib.SequenceMatcher 로 비교하는 방식 (비교 기준)
+    """
+    s = difflib.SequenceMatcher(None, base_text, compare_text)
+    result = ""
+
+    for tag, i1, i2, j1, j2 in s.get_opcodes():
+        if tag == 'equal':
+            result += compare_text[j1:j2]
+        elif tag in ['replace', 'insert']:
+            result += f'<span class="diff">{compare_text[j1:j2]}</span>'
+
+    return result
+
+
+def make_region_texts(number_of_words, number_of_regions, seed=0):
+    """
+    표준안 문단 하나와 시군구마다 일부 단어를 바꾼 문단 생성
+    :param number_of_words: 문단 단어 수
+    :param number_of_regions: 시군구 수
+    :return: (기준 문단, [시군구 문단, ...])
+    """
+    rnd = random.Random(seed)
+    words = ['시장은', '지원', '조례', '필요한', '사항을', '정할', '수', '있다', '예산의', '범위에서', '주민의', '안전',
+             '공용차량을', '공유하여', '이동수단으로', '활용하거나', '여가활동에', '이용할', '「공유재산', '및', '물품관리법」']
+    base_words = [rnd.choice(words) for _ in range(number_of_words)]
+
+    region_texts = []
+    for _ in range(number_of_regions):
+        region_words = list(base_words)
+        for _ in range(max(1, number_of_words // 20)):  # 약 5% 단어 변경
+            position = rnd.randrange(len(region_words))
+            region_words[position] = rnd.choice(words) + rnd.choice(['시', '군', '구'])
+        region_texts.append(' '.join(region_words))
+    return ' '.join(base_words), region_texts
+
+
+def benchmark(number_of_words, number_of_regions=266):
+    """
+    시군구 전체 문단을 기준 문단과 비교하는 시간 (기존 글자 단위 vs 단어 단위)
+    """
+    base_text, region_texts = make_region_texts(number_of_words, number_of_regions)
+
+    def measure(func):
+        start = time.perf_counter()
+        for region_text in region_texts:
+            func(base_text, region_text)
+        return time.perf_counter() - start
+
+    legacy = measure(legacy_highlight_differences)
+    myers = measure(lambda base, compare: clause_diff.highlight_differences(base, compare, engine='myers'))
+    line = (f'단어 {number_of_words:5d}개 x {number_of_regions}개 시군구 | 기존 {legacy * 1000:9.1f} ms | '
+            f'Myers {myers * 1000:8.1f} ms | {legacy / myers:6.1f}배')
+    if clause_diff.Indel is not None:
+        rapidfuzz = measure(lambda base, compare: clause_diff.highlight_differences(base, compare, engine='rapidfuzz'))
+        line += f' | rapidfuzz {rapidfuzz * 1000:8.1f} ms'
+    print(line)
+
+
+if __name__ == '__main__':
+    for words in (50, 200, 1000):
+        benchmark(words)
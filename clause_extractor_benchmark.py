@@ -0,0 +1,128 @@
+import random
+import time
+from bs4 import BeautifulSoup
+import ordinance_parser
+from ordinance_scraper import get_ordinance_clause
+
+
+# ------ 함수 목록 ------
+def legacy_get_ordinance_clause(soup):
+    """
+    기존 get_ordinance_clause (before/CrawlerTool - 복사본.py)
+    <p> 마다 문자열로 바꿔 split 하고 BeautifulSoup 로 다시 파싱하는 방식 (비교 기준)
+    """
+    ordinance_clause_dict = {}
+    clause_elements = soup.select('#cms-lnb > ul > li > ul > li.curr > ul > li')
+
+    for clause_element in clause_elements:
+        clause_title = clause_element.get_text()
+        if '(' not in clause_title:
+            continue
+        if len(clause_title) > 30:
+            clause_title = clause_title[:30]
+        if '<' in clause_title:
+            clause_title = clause_title[clause_title.find('(') + 1:clause_title.find('<')]
+        else:
+            clause_title = clause_title[clause_title.find('(') + 1:clause_title.find(')')]
+
+        clause_id = clause_element.select_one('a').get('href')[1:]
+        clause_container = soup.find(id=clause_id)
+        if not clause_container:
+            continue
+
+        clauses = clause_container.select('p')
+        clause_texts = []
+        for clause in clauses:
+            clause_html = str(clause)
+            try:
+                if '<p class="p-02">' in clause_html and '<p class="p-01">' in clause_html:
+                    first_clause_html = clause_html.split('<p class="p-02">')[0] + '</p>'
+                    first_clause_soup = BeautifulSoup(first_clause_html, "html.parser")
+                    extracted_text = first_clause_soup.get_text().replace('\xa0', ' ')
+                    clause_texts.append(extracted_text[extracted_text.find(') ') + 2:])
+                else:
+                    extracted_text = clause.get_text().replace('\xa0', ' ')
+                    if '제' == extracted_text[0] and ') ' in extracted_text:
+                        clause_texts.append(extracted_text[extracted_text.find(') ') + 2:])
+                    else:
+                        clause_texts.append(extracted_text)
+            except:
+                pass
+        ordinance_clause_dict[clause_title] = clause_texts
+
+    return ordinance_clause_dict
+
+
+def make_ordinance_html(number_of_articles, seed=0):
+    """
+    조례 본문 페이지 형태의 HTML 생성 (조문마다 p-01 안에 항(p-02), 호(p-03) 중첩)
+    :param number_of_articles: 조문 수
+    :return: HTML
+    """
+    rnd = random.Random(seed)
+    words = ['시장은', '지원', '조례', '필요한', '사항을', '정할', '수', '있다', '예산의', '범위에서', '주민의', '안전']
+
+    def sentence():
+        return ' '.join(rnd.choice(words) for _ in range(rnd.randint(12, 40))) + '.'
+
+    menu = []
+    body = []
+    for number in range(1, number_of_articles + 1):
+        title = f'조항제목{number}'
+        menu.append(f'<li><a href="#J{number}">제{number}조({title})</a></li>')
+
+        items = []
+        for item in range(rnd.randint(1, 6)):
+            sub_items = ''.join(f'<p class="p-03">{sub + 1}. {sentence()}</p>'
+                                for sub in range(rnd.randint(0, 4)))
+            items.append(f'<p class="p-02">&#9312; {sentence()}{sub_items}</p>')
+        body.append(f'<div id="J{number}"><p class="p-01"><strong>제{number}조({title})</strong>&nbsp;'
+                    f'{sentence()}{"".join(items)}</p></div>')
+
+    return ('<html><body><div id="cms-lnb"><ul><li><ul><li class="curr"><ul>'
+            + ''.join(menu) +
+            '</ul></li></ul></li></ul></div><div id="content">'
+            + ''.join(body) +
+            '</div></body></html>')
+
+
+def benchmark(number_of_articles, repeat=5):
+    """
+    조례 한 건당 조항 추출 시간 비교 (파싱 시간 제외, 같은 트리에서 측정)
+    현재 백엔드(lxml) 트리의 추출 결과가 html.parser 트리의 기존 방식 결과와 같은지도 확인한다
+    """
+    html = make_ordinance_html(number_of_articles)
+    soup = ordinance_parser.make_detail_soup(html)
+    reference_soup = BeautifulSoup(html, 'html.parser')
+
+    # 결과 일치 확인 (기존 방식은 중첩 <p> 가 유지되는 html.parser 트리 기준)
+    assert get_ordinance_clause(soup) == legacy_get_ordinance_clause(reference_soup)
+    assert get_ordinance_clause(reference_soup) == legacy_get_ordinance_clause(reference_soup)
+
+    # 파싱 시간 비교
+    parse_start = time.perf_counter()
+    ordinance_parser.make_detail_soup(html)
+    backend_parse = time.perf_counter() - parse_start
+    parse_start = time.perf_counter()
+    BeautifulSoup(html, 'html.parser')
+    reference_parse = time.perf_counter() - parse_start
+
+    def measure(func):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(soup)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    legacy = measure(legacy_get_ordinance_clause)
+    single_pass = measure(get_ordinance_clause)
+    print(f'조문 {number_of_articles:4d}개 | 기존 {legacy * 1000:8.1f} ms | '
+          f'단일순회 {single_pass * 1000:8.1f} ms | {legacy / single_pass:5.1f}배 | '
+          f'파싱 {ordinance_parser.get_backend()} {backend_parse * 1000:8.1f} ms, '
+          f'html.parser {reference_parse * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    for articles in (20, 100, 300):
+        benchmark(articles)
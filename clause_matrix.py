@@ -0,0 +1,99 @@
+import numpy as np
+
+
+# ------ 클래스 선언 ------
+class ClauseMatrix:
+    """
+    시군구 x 조항제목 존재 행렬
+    시군구와 조항제목을 정수 코드로 바꾸고 존재 여부를 bool 행렬(presence[시군구, 조항제목])로 보관한다
+    조항별 시군구 수, 정렬, '조항 X 가 없는 시군구' 조회를 딕셔너리 재탐색 없이 행렬 연산으로 처리한다
+    ex) regions = ['경북 봉화군', '전남 곡성군'], titles = ['목적', '정의'], presence = [[True, True], [True, False]]
+    """
+
+    def __init__(self, admin_clause_dict):
+        """
+        :param admin_clause_dict: {시군구: {조항제목: [문단, ...]} 또는 None}
+        """
+        # 시군구 코드 (딕셔너리 순서), 조항제목 코드 (처음 등장한 순서)
+        self.regions = list(admin_clause_dict)
+        self.region_codes = {region: code for code, region in enumerate(self.regions)}
+        self.titles = []
+        self.title_codes = {}
+
+        # 존재하는 (시군구, 조항제목) 좌표 수집
+        row_codes = []
+        column_codes = []
+        self.has_ordinance = np.zeros(len(self.regions), dtype=bool)  # 조례(조항)가 있는 시군구
+        for region_code, clause_dict in enumerate(admin_clause_dict.values()):
+            if not clause_dict:
+                continue
+            self.has_ordinance[region_code] = True
+            for title in clause_dict:
+                title_code = self.title_codes.get(title)
+                if title_code is None:
+                    title_code = self.title_codes[title] = len(self.titles)
+                    self.titles.append(title)
+                row_codes.append(region_code)
+                column_codes.append(title_code)
+
+        self.presence = np.zeros((len(self.regions), len(self.titles)), dtype=bool)
+        self.presence[row_codes, column_codes] = True
+
+    def get_counts(self):
+        """
+        :return: 조항제목별 시군구 수 (titles 순서)
+        """
+        return self.presence.sum(axis=0)
+
+    def get_order_by_count(self):
+        """
+        :return: 시군구 수 내림차순 조항제목 코드 (같은 수는 처음 등장한 순서, Counter 정렬과 같은 순서)
+        """
+        return np.argsort(-self.get_counts(), kind='stable')
+
+    def get_order_by_name(self):
+        """
+        :return: 이름순 조항제목 코드
+        """
+        if not self.titles:
+            return np.zeros(0, dtype=np.intp)
+        return np.argsort(np.array(self.titles), kind='stable')
+
+    def get_sorted_titles_by_count(self):
+        return [self.titles[code] for code in self.get_order_by_count()]
+
+    def get_sorted_titles_by_name(self):
+        return [self.titles[code] for code in self.get_order_by_name()]
+
+    def get_regions_with(self, title):
+        """
+        :return: 조항제목이 있는 시군구 리스트
+        """
+        title_code = self.title_codes.get(title)
+        if title_code is None:
+            return []
+        return [self.regions[code] for code in np.flatnonzero(self.presence[:, title_code])]
+
+    def get_regions_missing(self, title, include_without_ordinance=False):
+        """
+        :param title: 조항제목
+        :param include_without_ordinance: 조례(조항)가 없는 시군구도 포함
+        :return: 조항제목이 없는 시군구 리스트
+        """
+        mask = np.ones(len(self.regions), dtype=bool) if include_without_ordinance else self.has_ordinance.copy()
+        title_code = self.title_codes.get(title)
+        if title_code is not None:
+            mask &= ~self.presence[:, title_code]
+        return [self.regions[code] for code in np.flatnonzero(mask)]
+
+    def get_presence_rows(self, titles):
+        """
+        주어진 조항제목 순서의 존재 행렬 (엑셀 조항제목비교 시트용)
+        :param titles: 조항제목 리스트 (없는 조항제목은 모두 False)
+        :return: bool 행렬 [시군구, len(titles)]
+        """
+        columns = np.array([self.title_codes.get(title, -1) for title in titles], dtype=np.intp)
+        rows = np.zeros((len(self.regions), len(titles)), dtype=bool)
+        known = columns >= 0
+        rows[:, known] = self.presence[:, columns[known]]
+        return rows
@@ -0,0 +1,211 @@
+import logging
+import numpy as np
+from ordinance_scraper_constant import Constant
+
+# ------ 상수 선언 ------
+_CODE_BITS = 21  # 유니코드 코드값 비트 수 (3-gram 까지 uint64 하나에 담음)
+
+
+# ------ 함수 목록 ------
+def get_clause_text(paragraphs):
+    """
+    조항 문단을 하나의 비교용 문자열로 (공백 제외)
+    """
+    return ''.join(''.join(paragraphs).split())
+
+
+def get_ngram_ids(text, ngram_range=Constant.SIMILARITY_NGRAM_RANGE):
+    """
+    문자 n-gram 을 정수 id 로 (코드값을 비트 이동해 이어 붙임, 문자열 조각을 만들지 않음)
+    :param text: 문자열
+    :param ngram_range: (최소 n, 최대 n), 최대 3
+    :return: uint64 numpy 배열 (중복 포함)
+    """
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    ids = []
+    for n in range(ngram_range[0], ngram_range[1] + 1):
+        if len(codes) < n:
+            continue
+        ngram_ids = np.zeros(len(codes) - n + 1, dtype=np.uint64)
+        for offset in range(n):
+            ngram_ids <<= np.uint64(_CODE_BITS)
+            ngram_ids |= codes[offset:len(codes) - n + 1 + offset]
+        ids.append(ngram_ids)
+    return np.concatenate(ids) if ids else np.zeros(0, dtype=np.uint64)
+
+
+def get_tfidf_matrix(texts, ngram_range=Constant.SIMILARITY_NGRAM_RANGE):
+    """
+    문자 n-gram TF-IDF 희소 행렬 (CSR, 행마다 L2 정규화)
+    tf 는 1 + log(횟수), idf 는 log((1 + 문서 수) / (1 + 문서 빈도)) + 1
+    문서 x 전체 n-gram 밀집 행렬을 만들지 않고 문서에 있는 (문서, n-gram) 쌍만 보관한다
+    :param texts: 문자열 리스트
+    :return: (indptr, indices, data, 문서 빈도) - 행 i 의 열 번호 indices[indptr[i]:indptr[i + 1]], 값 data[...]
+    """
+    # 문서마다 n-gram 별 횟수 (정렬된 고유 n-gram) 를 구하고 전체 n-gram 을 열 번호로
+    # 열 번호는 정렬된 n-gram 순서이므로 행 안에서도 열 순서 (CSR 순서)
+    ngram_counts = [np.unique(get_ngram_ids(text, ngram_range), return_counts=True) for text in texts]
+    lengths = np.array([len(ids) for ids, _ in ngram_counts], dtype=np.int64)
+    if lengths.sum() == 0:
+        return (np.zeros(len(texts) + 1, dtype=np.int64), np.zeros(0, dtype=np.int64),
+                np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.int64))
+    vocabulary, indices = np.unique(np.concatenate([ids for ids, _ in ngram_counts]), return_inverse=True)
+    indices = indices.reshape(-1)
+    counts = np.concatenate([counts for _, counts in ngram_counts])
+    rows = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+
+    document_frequency = np.bincount(indices, minlength=len(vocabulary))
+    idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1
+    data = ((1 + np.log(counts)) * idf[indices]).astype(np.float32)
+
+    norms = np.sqrt(np.bincount(rows, weights=data.astype(np.float64) ** 2, minlength=len(texts)))
+    norms[norms == 0] = 1
+    data /= norms[rows].astype(np.float32)
+    indptr = np.concatenate(([0], np.cumsum(lengths)))
+    return indptr, indices, data, document_frequency
+
+
+def get_cosine_matrix(tfidf_matrix):
+    """
+    get_tfidf_matrix 결과의 문서 x 문서 코사인 유사도
+    한 문서에만 있는 n-gram 은 다른 문서와의 유사도에 영향이 없으므로
+    두 문서 이상에 있는 n-gram 열만 밀집 행렬로 모아 행렬곱 한 번으로 계산한다
+    :return: float32 numpy 행렬 [문서, 문서] (빈 문서의 대각선은 0)
+    """
+    indptr, indices, data, document_frequency = tfidf_matrix
+    number_of_rows = len(indptr) - 1
+    rows = np.repeat(np.arange(number_of_rows), np.diff(indptr))
+
+    shared = document_frequency[indices] >= 2
+    shared_columns = np.cumsum(document_frequency >= 2) - 1  # 열 번호 -> 공유 열 번호
+    dense = np.zeros((number_of_rows, int((document_frequency >= 2).sum())), dtype=np.float32)
+    dense[rows[shared], shared_columns[indices[shared]]] = data[shared]
+    matrix = dense @ dense.T
+
+    # 대각선은 모든 열 포함 (정규화했으므로 빈 문서가 아니면 1)
+    np.fill_diagonal(matrix, np.bincount(rows, weights=data.astype(np.float64) ** 2, minlength=number_of_rows))
+    return matrix
+
+
+# ------ 클래스 선언 ------
+class ClauseSimilarity:
+    """
+    조항별 시군구 x 시군구 유사도
+    조항마다 시군구 문단을 문자 n-gram TF-IDF 희소 벡터로 만들고 코사인 유사도 행렬을 구한다
+    같은 문단을 쓰는 시군구가 많으므로 고유한 문단으로 계산한 뒤 시군구로 펼친다 (idf 도 고유한 문단 기준)
+    유사도가 threshold 이상인 시군구끼리 묶은 군집과, 다른 시군구와 유사도 합이 가장 큰 대표(medoid) 시군구를 제공한다
+    """
+
+    def __init__(self, admin_clause_dict, ngram_range=Constant.SIMILARITY_NGRAM_RANGE,
+                 threshold=Constant.SIMILARITY_CLUSTER_THRESHOLD):
+        """
+        :param admin_clause_dict: {시군구: {조항제목: [문단, ...]} 또는 None}
+        :param ngram_range: 문자 n-gram 범위
+        :param threshold: 같은 군집으로 볼 코사인 유사도
+        """
+        self.admin_clause_dict = admin_clause_dict
+        self.ngram_range = ngram_range
+        self.threshold = threshold
+        self._results = {}  # {조항제목: 계산 결과}
+
+    def get_regions(self, clause_title):
+        return [region for region, clause_dict in self.admin_clause_dict.items()
+                if clause_dict and clause_title in clause_dict]
+
+    def get_matrix(self, clause_title):
+        """
+        :return: (시군구 리스트, 코사인 유사도 행렬 [시군구, 시군구])
+        """
+        result = self._analyze(clause_title)
+        inverse = result['inverse']
+        return result['regions'], result['unique_matrix'][np.ix_(inverse, inverse)]
+
+    def get_medoid(self, clause_title):
+        """
+        :return: 가장 전형적인 시군구 (다른 시군구와의 유사도 합이 가장 큼), 시군구가 없으면 None
+        """
+        return self._analyze(clause_title)['medoid']
+
+    def get_clusters(self, clause_title):
+        """
+        :return: [[시군구, ...], ...] (큰 군집부터)
+        """
+        return self._analyze(clause_title)['clusters']
+
+    def analyze_all(self, clause_titles=None):
+        """
+        조항 전체 분석
+        :param clause_titles: 조항제목 리스트 (None 이면 모든 조항)
+        :return: {조항제목: {'medoid': 시군구, 'clusters': [[시군구, ...], ...]}}
+        """
+        if clause_titles is None:
+            clause_titles = list(dict.fromkeys(title for clause_dict in self.admin_clause_dict.values()
+                                               if clause_dict for title in clause_dict))
+        summary = {}
+        for clause_title in clause_titles:
+            result = self._analyze(clause_title)
+            summary[clause_title] = {'medoid': result['medoid'], 'clusters': result['clusters']}
+        logging.info(f'조항 유사도 분석 :\n{len(summary)}개 조항')
+        return summary
+
+    # ------ 내부함수 목록 ------
+    def _analyze(self, clause_title):
+        result = self._results.get(clause_title)
+        if result is not None:
+            return result
+
+        regions = self.get_regions(clause_title)
+
+        # 고유한 문단으로 계산 (inverse : 시군구 -> 고유 문단 번호)
+        # 공백 정리는 고유한 원문마다 한 번만 하고, 정리 후 같아진 문단도 다시 묶음
+        joined_texts = [''.join(self.admin_clause_dict[region][clause_title]) for region in regions]
+        unique_texts, inverse = self._get_unique(joined_texts)
+        unique_texts, clean_inverse = self._get_unique([get_clause_text([text]) for text in unique_texts])
+        inverse = clean_inverse[inverse]
+        unique_matrix = get_cosine_matrix(get_tfidf_matrix(unique_texts, self.ngram_range))
+        np.fill_diagonal(unique_matrix, 1.0)  # 빈 문단도 자기 자신과는 같음
+        multiplicity = np.bincount(inverse, minlength=len(unique_texts)).astype(np.float32)
+
+        # 대표 시군구 : 시군구 전체와의 유사도 합이 가장 큰 문단을 쓰는 첫 시군구
+        medoid = None
+        if regions:
+            best = int(np.argmax(unique_matrix @ multiplicity))
+            medoid = regions[int(np.flatnonzero(inverse == best)[0])]
+
+        result = {
+            'regions': regions,
+            'inverse': inverse,
+            'unique_matrix': unique_matrix,
+            'medoid': medoid,
+            'clusters': self._get_clusters(regions, inverse, unique_matrix),
+        }
+        self._results[clause_title] = result
+        return result
+
+    @staticmethod
+    def _get_unique(texts):
+        """
+        :return: (고유 문자열 리스트 (정렬), 원래 순서 -> 고유 번호 배열)
+        """
+        if not texts:
+            return [], np.zeros(0, dtype=np.intp)
+        unique_texts, inverse = np.unique(np.array(texts, dtype=object), return_inverse=True)
+        return list(unique_texts), inverse.reshape(-1)
+
+    def _get_clusters(self, regions, inverse, unique_matrix):
+        # 유사도가 threshold 이상인 고유 문단끼리 연결 (union-find)
+        parent = list(range(len(unique_matrix)))
+
+        def find(code):
+            while parent[code] != code:
+                parent[code] = parent[parent[code]]
+                code = parent[code]
+            return code
+
+        for code, other in np.argwhere(np.triu(unique_matrix >= self.threshold, 1)):
+            parent[find(int(code))] = find(int(other))
+
+        clusters = {}
+        for region, code in zip(regions, inverse):
+            clusters.setdefault(find(int(code)), []).append(region)
+        return sorted(clusters.values(), key=len, reverse=True)
@@ -0,0 +1,196 @@
+import bisect
+import logging
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from ordinance_scraper_constant import Constant
+
+# ------ 상수 선언 ------
+_IGNORED_CHARACTERS = re.compile(r'[\s\W_]+')  # 공백, 가운뎃점, 쉼표 등 제목 비교에서 무시할 문자
+_TRAILING_DEUNG = re.compile(r'(?:등)+$')  # '지원 등' -> '지원'
+
+
+# ------ 함수 목록 ------
+def normalize_clause_title(clause_title):
+    """
+    조항제목 정규화 (유니코드 정규화, 공백/기호 제거, 끝의 '등' 제거)
+    ex) '지원 대상 등' -> '지원대상', '위원회의 구성ㆍ운영' -> '위원회의구성운영'
+    :param clause_title: 조항제목
+    :return: 정규화한 제목 (모두 지워지면 원래 제목)
+    """
+    normalized = unicodedata.normalize('NFKC', clause_title)
+    normalized = _IGNORED_CHARACTERS.sub('', normalized)
+    normalized = _TRAILING_DEUNG.sub('', normalized)
+    return normalized or clause_title
+
+
+def get_bigrams(normalized_title):
+    """
+    문자 2-gram 집합 (앞뒤 경계 문자 포함, 한 글자 제목도 비교 가능)
+    ex) '목적' -> {'^목', '목적', '적$'}
+    """
+    padded = f'^{normalized_title}$'
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+# ------ 클래스 선언 ------
+class ClauseTitleAligner:
+    """
+    시군구별 조항제목 정렬
+    띄어쓰기, '등' 접미사, 30자 잘림 때문에 따로 생기는 비슷한 조항제목을 하나의 대표 제목으로 묶는다
+
+    1. 정규화한 제목이 같으면 같은 조항
+    2. 잘렸을 수 있는 긴 제목은 다른 제목의 앞부분과 같으면 같은 조항 (정렬 + 이분탐색)
+    3. 문자 2-gram Jaccard 유사도가 CLAUSE_TITLE_SIMILARITY 이상이면 같은 조항
+       (2-gram 역색인 + prefix filtering 으로 공통 2-gram 이 있는 후보끼리만 비교하므로 모든 쌍을 비교하지 않음)
+    같은 시군구에 함께 있는 두 제목은 서로 다른 조항이므로 묶지 않는다
+    대표 제목은 묶음에서 가장 많은 시군구가 쓰는 원래 제목 (같으면 긴 제목)
+    """
+
+    def __init__(self, similarity=Constant.CLAUSE_TITLE_SIMILARITY,
+                 truncated_length=Constant.CLAUSE_TITLE_TRUNCATED_LENGTH):
+        self.similarity = similarity
+        self.truncated_length = truncated_length
+
+        self.canonical_titles = {}  # {원래 제목: 대표 제목}
+        self._parent = []  # union-find (정규화 제목 코드)
+        self._regions = []  # 묶음별 시군구 집합 (묶음 대표 코드에만 유지)
+
+    def fit(self, admin_clause_dict):
+        """
+        조항제목 묶음 계산
+        :param admin_clause_dict: {시군구: {조항제목: [문단, ...]} 또는 None}
+        :return: self
+        """
+        # 정규화 제목별 원래 제목 사용 수, 시군구
+        normalized_titles = []
+        normalized_codes = {}
+        raw_title_counts = []  # [Counter(원래 제목)]
+        self._regions = []
+        raw_to_code = {}
+        for region, clause_dict in admin_clause_dict.items():
+            if not clause_dict:
+                continue
+            for raw_title in clause_dict:
+                code = raw_to_code.get(raw_title)
+                if code is None:
+                    normalized = normalize_clause_title(raw_title)
+                    code = normalized_codes.get(normalized)
+                    if code is None:
+                        code = normalized_codes[normalized] = len(normalized_titles)
+                        normalized_titles.append(normalized)
+                        raw_title_counts.append(Counter())
+                        self._regions.append(set())
+                    raw_to_code[raw_title] = code
+                raw_title_counts[code][raw_title] += 1
+                self._regions[code].add(region)
+        self._parent = list(range(len(normalized_titles)))
+
+        # 잘린 제목 -> 앞부분이 같은 제목
+        self._union_truncated(normalized_titles)
+        # 2-gram 유사 제목
+        self._union_similar(normalized_titles)
+
+        # 묶음별 대표 제목 (가장 많이 쓰는 원래 제목, 같으면 잘리지 않았을 긴 제목)
+        group_counts = defaultdict(Counter)
+        for code, counts in enumerate(raw_title_counts):
+            group_counts[self._find(code)].update(counts)
+        group_titles = {root: max(counts, key=lambda title: (counts[title], len(title)))
+                        for root, counts in group_counts.items()}
+        self.canonical_titles = {raw_title: group_titles[self._find(code)] for raw_title, code in raw_to_code.items()}
+
+        logging.info(f'조항제목 정렬 :\n원래 제목 {len(raw_to_code)}개 -> {len(group_titles)}개')
+        return self
+
+    def align(self, admin_clause_dict):
+        """
+        조항제목을 대표 제목으로 바꾼 조항 딕셔너리 (fit 으로 계산한 묶음 사용)
+        :param admin_clause_dict: {시군구: {조항제목: [문단, ...]} 또는 None}
+        :return: 같은 형식의 새 딕셔너리
+        """
+        aligned = {}
+        for region, clause_dict in admin_clause_dict.items():
+            if not clause_dict:
+                aligned[region] = clause_dict
+                continue
+            # 한 시군구에서 두 제목이 같은 대표 제목이 되면 뒤의 제목은 그대로 둠
+            aligned_clause_dict = {}
+            for title, paragraphs in clause_dict.items():
+                canonical_title = self.canonical_titles.get(title, title)
+                if canonical_title in aligned_clause_dict:
+                    canonical_title = title
+                aligned_clause_dict[canonical_title] = paragraphs
+            aligned[region] = aligned_clause_dict
+        return aligned
+
+    def fit_align(self, admin_clause_dict):
+        return self.fit(admin_clause_dict).align(admin_clause_dict)
+
+    # ------ 내부함수 목록 ------
+    def _find(self, code):
+        parent = self._parent
+        while parent[code] != code:
+            parent[code] = parent[parent[code]]
+            code = parent[code]
+        return code
+
+    def _union(self, code_a, code_b):
+        """
+        두 제목 묶기 (같은 시군구에 함께 있으면 묶지 않음)
+        :return: 묶었으면 True
+        """
+        root_a = self._find(code_a)
+        root_b = self._find(code_b)
+        if root_a == root_b:
+            return True
+        regions_a = self._regions[root_a]
+        regions_b = self._regions[root_b]
+        if len(regions_a) < len(regions_b):
+            root_a, root_b, regions_a, regions_b = root_b, root_a, regions_b, regions_a
+        if not regions_a.isdisjoint(regions_b):
+            return False
+        self._parent[root_b] = root_a
+        regions_a |= regions_b
+        self._regions[root_b] = None
+        return True
+
+    def _union_truncated(self, normalized_titles):
+        # 정렬하면 어떤 제목으로 시작하는 제목들은 그 뒤에 연속으로 놓인다
+        order = sorted(range(len(normalized_titles)), key=normalized_titles.__getitem__)
+        sorted_titles = [normalized_titles[code] for code in order]
+        for position, title in enumerate(sorted_titles):
+            if len(title) < self.truncated_length:
+                continue
+            end = bisect.bisect_left(sorted_titles, title + '\U0010ffff', position + 1)
+            for other_position in range(position + 1, end):
+                self._union(order[position], order[other_position])
+
+    def _union_similar(self, normalized_titles):
+        # 2-gram 을 적게 나오는 순서로 정렬하고 각 제목의 앞쪽 2-gram 만 색인 (prefix filtering)
+        # Jaccard >= t 인 두 집합은 앞쪽 |x| - ceil(t|x|) + 1 개 안에서 반드시 공통 2-gram 을 가진다
+        threshold = self.similarity
+        bigram_sets = [get_bigrams(title) for title in normalized_titles]
+        frequency = Counter(bigram for bigrams in bigram_sets for bigram in bigrams)
+
+        inverted_index = defaultdict(list)
+        for code in sorted(range(len(bigram_sets)), key=lambda code: len(bigram_sets[code])):
+            bigrams = bigram_sets[code]
+            ordered = sorted(bigrams, key=lambda bigram: (frequency[bigram], bigram))
+            prefix = ordered[:len(ordered) - math.ceil(threshold * len(ordered)) + 1]
+
+            # 후보 : 앞쪽 2-gram 을 공유하고 크기 조건(|y| >= t|x|)을 만족하는 이전 제목
+            candidates = set()
+            for bigram in prefix:
+                for other in inverted_index[bigram]:
+                    if len(bigram_sets[other]) >= threshold * len(bigrams):
+                        candidates.add(other)
+            for other in candidates:
+                other_bigrams = bigram_sets[other]
+                intersection = len(bigrams & other_bigrams)
+                jaccard = intersection / (len(bigrams) + len(other_bigrams) - intersection)
+                if jaccard >= threshold:
+                    self._union(code, other)
+
+            for bigram in prefix:
+                inverted_index[bigram].append(code)
@@ -0,0 +1,318 @@
+import html
+import json
+import re
+import clause_diff
+
+# ------ 상수 선언 ------
+_ITEM_NUMBER = re.compile(r'^(\d+\.)')  # 문단 앞 항목 번호 (예: "1.")
+
+# 문서 머리 (스타일은 before/test.py create_tabbed_comparison_html 과 같음)
+_REPORT_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>시군구별 조례 비교</title>
+    <style>
+        body {
+            font-family: 'Malgun Gothic', Arial, sans-serif;
+            padding: 20px;
+            line-height: 1.6;
+            max-width: 1200px;
+            margin: 0 auto;
+            color: #333;
+        }
+        h1 {
+            color: #2c3e50;
+            text-align: center;
+            margin-bottom: 20px;
+        }
+        .subtitle {
+            color: #555;
+            text-align: center;
+            margin-top: -15px;
+            margin-bottom: 30px;
+            font-size: 16px;
+        }
+
+        /* 탭 스타일 */
+        .tabs {
+            display: flex;
+            flex-wrap: wrap;
+            margin-bottom: 20px;
+            border-bottom: 2px solid #4a6ea9;
+        }
+        .tab-button {
+            padding: 10px 20px;
+            background-color: #f0f5ff;
+            border: none;
+            border-radius: 5px 5px 0 0;
+            margin-right: 5px;
+            cursor: pointer;
+            font-weight: bold;
+            color: #2c3e50;
+            font-size: 16px;
+        }
+        .tab-button:hover {
+            background-color: #d0e0ff;
+        }
+        .tab-button.active {
+            background-color: #4a6ea9;
+            color: white;
+        }
+
+        /* 탭 내용 영역 */
+        .tab-content {
+            display: none;
+        }
+        .tab-content.active {
+            display: block;
+        }
+
+        /* 비교 테이블 스타일 */
+        .paragraph-section {
+            border: 1px solid #ddd;
+            border-radius: 8px;
+            overflow: hidden;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.05);
+        }
+        .paragraph-title {
+            background-color: #e0e7f7;
+            padding: 8px 15px;
+            font-weight: bold;
+            color: #2c3e50;
+            border-bottom: 1px solid #ccd7f0;
+        }
+        .diff-row {
+            display: flex;
+            flex-direction: row;
+            border-bottom: 1px solid #e4e4e4;
+        }
+        .diff-row:last-child {
+            border-bottom: none;
+        }
+        .city-column {
+            width: 120px;
+            padding: 15px;
+            background-color: #f0f5ff;
+            font-weight: bold;
+            color: #2c3e50;
+            display: flex;
+            align-items: center;
+            border-right: 1px solid #ddd;
+        }
+        .content-column {
+            flex: 1;
+            padding: 15px;
+            background-color: #f9f9f9;
+            line-height: 1.7;
+        }
+        .diff {
+            background-color: #ffcccc;
+            padding: 2px 4px;
+            border-radius: 3px;
+            display: inline-block;
+        }
+        .item-num {
+            font-weight: bold;
+            margin-right: 5px;
+        }
+
+        /* 반응형 디자인 */
+        @media (max-width: 768px) {
+            .city-column {
+                width: 80px;
+                font-size: 14px;
+                padding: 10px;
+            }
+            .content-column {
+                padding: 10px;
+                font-size: 14px;
+            }
+            .tab-button {
+                padding: 8px 12px;
+                font-size: 14px;
+            }
+        }
+    </style>
+</head>
+<body>
+    <h1>시군구별 조례 비교</h1>
+    <p class="subtitle">조항별 내용 비교 및 차이점 분석</p>
+"""
+
+# 탭을 열 때 그 조항의 JSON 만 읽어서 그리는 스크립트
+_REPORT_SCRIPT = """
+    <script>
+    var cities = JSON.parse(document.getElementById("cities").textContent);
+    var rendered = {};
+
+    function renderTab(index) {
+        var content = document.getElementById("tab-" + index);
+        if (rendered[index]) {
+            return content;
+        }
+        // {"l": [문단 제목], "t": [강조 HTML], "r": [[시군구 번호, [문단별 강조 HTML 번호 또는 -1]]]}
+        var clause = JSON.parse(document.getElementById("clause-" + index).textContent);
+        var parts = [];
+        for (var p = 0; p < clause.l.length; p++) {
+            parts.push('<div class="paragraph-section"><div class="paragraph-title">' + clause.l[p] + '</div>');
+            for (var r = 0; r < clause.r.length; r++) {
+                var textIndex = clause.r[r][1][p];
+                parts.push('<div class="diff-row"><div class="city-column">' + cities[clause.r[r][0]] +
+                           '</div><div class="content-column">' + (textIndex >= 0 ? clause.t[textIndex] : '') +
+                           '</div></div>');
+            }
+            parts.push('</div>');
+        }
+        content.innerHTML = parts.join('');
+        rendered[index] = true;
+        return content;
+    }
+
+    function openTab(button) {
+        var buttons = document.getElementsByClassName("tab-button");
+        for (var i = 0; i < buttons.length; i++) {
+            buttons[i].classList.remove("active");
+        }
+        var contents = document.getElementsByClassName("tab-content");
+        for (var i = 0; i < contents.length; i++) {
+            contents[i].classList.remove("active");
+        }
+        button.classList.add("active");
+        renderTab(button.getAttribute("data-index")).classList.add("active");
+    }
+
+    document.getElementById("tabs").addEventListener("click", function (event) {
+        if (event.target.classList.contains("tab-button")) {
+            openTab(event.target);
+        }
+    });
+    var first = document.querySelector(".tab-button");
+    if (first) {
+        openTab(first);
+    }
+    </script>
+</body>
+</html>
+"""
+
+
+# ------ 함수 목록 ------
+def get_clause_data(sorted_indices, admin_clause_dict, base_regions=None):
+    """
+    조항 딕셔너리(OrdinanceScraper.admin_ordinance_clause_dict)를 비교 보고서 입력 형식으로 변환
+    :param sorted_indices: 조항제목 리스트 (탭 순서)
+    :param admin_clause_dict: {시군구: {조항제목: [문단, ...]} 또는 None}
+    :param base_regions: {조항제목: 비교 기준 시군구} (선택, 예: ClauseSimilarity 의 대표 시군구), 없으면 첫 시군구
+    :return: {조항제목: {'paragraphs': [문단 라벨], 'cities': {시군구: [문단, ...]}}}
+    """
+    base_regions = base_regions or {}
+    clause_data = {}
+    for clause_title in sorted_indices:
+        cities = {region: clause_dict[clause_title] for region, clause_dict in admin_clause_dict.items()
+                  if clause_dict and clause_title in clause_dict}
+        if not cities:
+            continue
+        # 비교 기준 시군구를 맨 앞으로
+        base_region = base_regions.get(clause_title)
+        if base_region in cities:
+            cities = {base_region: cities[base_region], **cities}
+        number_of_paragraphs = max(len(paragraphs) for paragraphs in cities.values())
+        clause_data[clause_title] = {'paragraphs': [f'paragraph{index + 1}' for index in range(number_of_paragraphs)],
+                                     'cities': cities}
+    return clause_data
+
+
+def write_comparison_report(path, clause_data, highlight_cache=None):
+    """
+    조항별 탭 비교 보고서를 파일에 바로 기록
+    조항마다 고유한 문단의 강조 HTML 을 한 번만 담은 압축 JSON 을 쓰고, 탭 내용은 브라우저에서 열 때 그린다
+    문서 전체를 문자열로 만들지 않으므로 작성 시간과 파일 크기는 고유한 문단 수에 비례한다
+    비교 기준은 before/test.py 와 같이 조항마다 첫 번째 시군구
+
+    :param path: 저장할 HTML 파일 경로
+    :param clause_data: {조항제목: {'paragraphs': [문단 라벨], 'cities': {시군구: [문단, ...]}}}
+    :param highlight_cache: clause_diff.HighlightCache(escape=True) (없으면 새로 만듦)
+    :return: highlight_cache (계산/재사용 횟수 확인용)
+    """
+    if highlight_cache is None:
+        highlight_cache = clause_diff.HighlightCache(escape=True)
+
+    # 시군구 이름은 한 번만 기록하고 조항에서는 번호로 참조
+    city_codes = {}
+    for clause in clause_data.values():
+        for city_name in clause['cities']:
+            city_codes.setdefault(city_name, len(city_codes))
+
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(_REPORT_HEAD)
+
+        # 탭 버튼
+        file.write('    <div class="tabs" id="tabs">\n')
+        for index, title in enumerate(clause_data):
+            file.write(f'        <button class="tab-button" data-index="{index}">{html.escape(title)}</button>\n')
+        file.write('    </div>\n')
+
+        # 시군구 목록
+        file.write(f'    <script type="application/json" id="cities">{_dump_json([html.escape(city_name) for city_name in city_codes])}</script>\n')
+
+        # 조항별 빈 탭과 JSON (조항 하나씩 만들어 바로 기록)
+        for index, clause in enumerate(clause_data.values()):
+            file.write(f'    <div id="tab-{index}" class="tab-content"></div>\n')
+            clause_json = _dump_json(_get_clause_payload(clause, city_codes, highlight_cache))
+            file.write(f'    <script type="application/json" id="clause-{index}">{clause_json}</script>\n')
+
+        file.write(_REPORT_SCRIPT)
+    return highlight_cache
+
+
+# ------ 내부함수 목록 ------
+def _dump_json(value):
+    # 공백 없는 JSON (</script> 로 끝나지 않도록 '</' 이스케이프)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+
+
+def _get_clause_payload(clause, city_codes, highlight_cache):
+    """
+    조항 하나의 JSON 데이터
+    :return: {'l': [문단 제목], 't': [고유한 강조 HTML], 'r': [[시군구 번호, [문단별 't' 번호, 없으면 -1]]]}
+    """
+    paragraph_labels = clause['paragraphs']
+    cities_data = clause['cities']
+    city_names = list(cities_data)
+    base_paragraphs = cities_data[city_names[0]]
+
+    labels = ['조항 제목' if label == 'title' or index == 0 else f'항목 {index}'
+              for index, label in enumerate(paragraph_labels)]
+    texts = []
+    text_codes = {}
+    rows = []
+    for city_name in city_names:
+        paragraphs = cities_data[city_name]
+        row = []
+        for index in range(len(paragraph_labels)):
+            city_text = paragraphs[index] if index < len(paragraphs) else ''
+            if not city_text:
+                row.append(-1)
+                continue
+            base_text = base_paragraphs[index] if index < len(base_paragraphs) else ''
+            # 원문으로 비교하고 강조 구간마다 escape (escape 한 문자열을 비교하면 강조가 엔티티를 자를 수 있음)
+            if city_name != city_names[0] and base_text:
+                highlighted = highlight_cache.highlight(base_text, city_text)
+            else:
+                highlighted = html.escape(city_text, quote=False)
+
+            # 조항 번호 강조 (예: "1.", "2." 등)
+            item_number = _ITEM_NUMBER.match(highlighted)
+            if item_number:
+                highlighted = highlighted.replace(item_number.group(1),
+                                                  f'<span class="item-num">{item_number.group(1)}</span>', 1)
+
+            code = text_codes.get(highlighted)
+            if code is None:
+                code = text_codes[highlighted] = len(texts)
+                texts.append(highlighted)
+            row.append(code)
+        rows.append([city_codes[city_name], row])
+    return {'l': labels, 't': texts, 'r': rows}
@@ -0,0 +1,138 @@
+from bs4 import CData, NavigableString
+
+# ------ 상수 선언 ------
+TEXT_TYPES = (NavigableString, CData)  # get_text 가 읽는 문자열 종류 (주석, 스크립트 등 제외)
+P01_ATTRS = {'class': ['p-01']}  # <p class="p-01">
+P02_ATTRS = {'class': ['p-02']}  # <p class="p-02">
+P03_ATTRS = {'class': ['p-03']}  # <p class="p-03">
+
+
+# ------ 함수 목록 ------
+def _finish_clause_text(entry):
+    """
+    닫힌 <p> 의 텍스트를 get_ordinance_clause 규칙대로 정리
+    :param entry: 열린 <p> 정보
+    :return: 조항 문단 텍스트, 버릴 문단이면 None
+    """
+    # 중첩 구조(p-01 안의 p-02) : 첫 p-02 앞까지가 첫 번째 문단
+    if entry['cut'] is not None and entry['has_p01']:
+        extracted_text = ''.join(entry['parts'][:entry['cut']]).replace('\xa0', ' ')
+        return extracted_text[extracted_text.find(') ') + 2:]
+
+    extracted_text = ''.join(entry['parts']).replace('\xa0', ' ')
+    if not extracted_text:
+        return None
+    # '제N조(제목) ' 머리말 제거
+    if '제' == extracted_text[0] and ') ' in extracted_text:
+        return extracted_text[extracted_text.find(') ') + 2:]
+    return extracted_text
+
+
+def extract_clause_texts(clause_container, group_siblings=False):
+    """
+    조항 요소 안의 <p> 문단 텍스트를 한 번의 트리 순회로 추출
+    <p> 마다 문자열로 바꿔 다시 파싱하던 방식과 같은 결과를 만든다
+    - 모든 <p>(중첩 포함)를 문서 순서대로 한 문단씩 만든다
+    - p-01 과 p-02 가 함께 있는 <p> 는 첫 p-02 앞까지의 텍스트만 사용
+    - 그 외 <p> 는 전체 텍스트, '제N조(제목) ' 머리말은 제거, 빈 문단은 버림
+    :param clause_container: 조항 내용 요소
+    :param group_siblings: 형제 p-02 는 앞의 p-01 안에, 형제 p-03 은 앞의 p-02 안에 있는 것으로 묶기
+                           (lxml 은 새 <p> 가 시작되면 열린 <p> 를 닫아 p-01, p-02, p-03 이 형제로 나열되므로
+                           묶으면 html.parser 트리와 같은 결과가 나온다)
+    :return: 문단 텍스트 리스트
+    """
+    entries = []  # 문단 자리 (<p> 시작 순서), 끝난 뒤 텍스트로 변환
+    open_ps = []  # 현재 열려 있는 <p> (바깥 -> 안쪽)
+    sibling_p01 = None  # 형제 p-02 를 묶을 앞의 p-01 (lxml)
+    sibling_p02 = None  # 형제 p-03 을 묶을 앞의 p-02 (lxml)
+    stack = [(iter(clause_container.children), None)]
+
+    while stack:
+        children, entry = stack[-1]
+        node = next(children, None)
+
+        # 자식 순회 끝 -> 요소 닫기
+        if node is None:
+            stack.pop()
+            if entry is not None:
+                open_ps.pop()
+            continue
+
+        # 텍스트 노드 : 열린 모든 <p> 에 추가 (중첩 <p> 의 get_text 는 자식 텍스트를 포함하므로)
+        if node.name is None:
+            if type(node) in TEXT_TYPES:
+                for open_p in open_ps:
+                    open_p['parts'].append(node)
+                    if open_p['group'] is not None:
+                        open_p['group']['parts'].append(node)
+            continue
+
+        if node.name != 'p':
+            stack.append((iter(node.contents), None))
+            continue
+
+        # <p> 시작
+        is_p01 = node.attrs == P01_ATTRS
+        is_p02 = node.attrs == P02_ATTRS
+        new_entry = {'parts': [], 'cut': None, 'has_p01': is_p01, 'group': None}
+
+        # 다른 <p> 안에 있지 않은 <p> : 앞의 형제 p-01, p-02 에 묶기
+        if group_siblings and not open_ps:
+            if is_p02 and sibling_p01 is not None and sibling_p01['cut'] is None:
+                # 앞의 p-01 은 여기까지가 첫 p-02 앞부분
+                sibling_p01['cut'] = len(sibling_p01['parts'])
+            if node.attrs == P03_ATTRS:
+                new_entry['group'] = sibling_p02
+            else:
+                sibling_p02 = new_entry if is_p02 else None
+                if not is_p02:
+                    sibling_p01 = new_entry if is_p01 else None
+
+        if is_p02:
+            # 자신과 바깥 <p> 들은 여기까지가 첫 p-02 앞부분
+            new_entry['cut'] = 0
+            for open_p in open_ps:
+                if open_p['cut'] is None:
+                    open_p['cut'] = len(open_p['parts'])
+        if is_p01:
+            for open_p in open_ps:
+                open_p['has_p01'] = True
+
+        entries.append(new_entry)
+        open_ps.append(new_entry)
+        stack.append((iter(node.contents), new_entry))
+
+    clause_texts = (_finish_clause_text(entry) for entry in entries)
+    return [text for text in clause_texts if text is not None]
+
+
+def extract_paragraph_lines(p_tag):
+    """
+    <p> 와 하위 <p> 의 자기 텍스트를 줄 단위 리스트로 추출 (mian.parse_paragraph 의 반복문 버전)
+    각 <p> 는 자식 <p> 를 제외한 텍스트 한 줄, 자식 <p> 는 그 뒤에 순서대로 이어진다
+    :param p_tag: <p> 요소
+    :return: 줄 리스트
+    """
+    lines = []
+    stack = [p_tag]
+    while stack:
+        tag = stack.pop()
+        text_parts = []
+        child_ps = []
+        for child in tag.children:
+            # child.name 이 None이면 텍스트 노드이므로 그대로 사용
+            if child.name is None:
+                text_parts.append(child.strip())
+            # 자식이 <p>면 별도 줄로 처리
+            elif child.name == 'p':
+                child_ps.append(child)
+            # 그 이외 태그(<strong> 등)는 내부 텍스트만 추출
+            else:
+                text_parts.append(child.get_text(strip=True))
+
+        parent_text = " ".join(t for t in text_parts if t).strip()
+        if parent_text:
+            lines.append(parent_text)
+        # 자식 <p> 를 문서 순서대로 꺼내도록 역순으로 쌓기
+        stack.extend(reversed(child_ps))
+    return lines
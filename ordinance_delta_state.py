@@ -0,0 +1,82 @@
+import json
+import logging
+from pathlib import Path
+from ordinance_detail_store import get_page_parameters
+from ordinance_scraper_constant import Constant
+
+
+# ------ 클래스 선언 ------
+class OrdinanceDeltaState:
+    """
+    증분 조회용 상태 파일
+    지역, 조례제목별로 마지막으로 본 (제개정일, alrNo, histNo) 를 JSON 파일에 보관하고
+    이번 검색결과와 비교하여 새로 생기거나 개정된 조례만 골라낸다
+    ex) {"경북 봉화군\t실종자 수색 지원 조례": {"update_date": "2024.12.01", "alr_no": "123", "hist_no": "4"}}
+    """
+
+    def __init__(self, path=None):
+        # 상태 파일 경로 (기본: cache/delta_state.json)
+        if path is None:
+            cache_dir = Path(Constant.CACHE_DIR)
+            cache_dir.mkdir(exist_ok=True)
+            path = cache_dir / 'delta_state.json'
+        self.path = Path(path)
+
+        # 상태 파일 불러오기
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as file:
+                self.state = json.load(file)
+        else:
+            self.state = {}
+
+    @staticmethod
+    def get_key(admin, info):
+        return f"{admin}\t{info['title']}"
+
+    @staticmethod
+    def get_version(info):
+        """
+        검색결과 조례정보에서 비교할 값 추출
+        :param info: 조례정보 딕셔너리 (title, update_date, department, page_address)
+        :return: {'update_date', 'alr_no', 'hist_no'}
+        """
+        alr_no, hist_no = get_page_parameters(info['page_address']) or (None, None)
+        return {'update_date': info['update_date'], 'alr_no': alr_no, 'hist_no': hist_no}
+
+    def diff(self, admin_ordinance_dict):
+        """
+        검색결과를 마지막 상태와 비교
+        :param admin_ordinance_dict: {지역: 조례정보} 딕셔너리
+        :return: {'new': [지역, ...], 'amended': [...], 'unchanged': [...]}
+        """
+        delta = {'new': [], 'amended': [], 'unchanged': []}
+        for admin, info in admin_ordinance_dict.items():
+            if not info:
+                continue
+            last_version = self.state.get(self.get_key(admin, info))
+            if last_version is None:
+                delta['new'].append(admin)
+            elif last_version != self.get_version(info):
+                delta['amended'].append(admin)
+            else:
+                delta['unchanged'].append(admin)
+
+        logging.info(f"증분 조회 결과 :\n신규 {len(delta['new'])}건, 개정 {len(delta['amended'])}건, "
+                     f"변경없음 {len(delta['unchanged'])}건")
+        return delta
+
+    def update(self, admin_ordinance_dict):
+        """
+        검색결과로 상태 갱신 (저장은 save)
+        :param admin_ordinance_dict: {지역: 조례정보} 딕셔너리
+        """
+        for admin, info in admin_ordinance_dict.items():
+            if info:
+                self.state[self.get_key(admin, info)] = self.get_version(info)
+
+    def save(self):
+        # 임시 파일에 쓴 뒤 교체 (저장 중 종료되어도 기존 상태 유지)
+        temp_path = self.path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.state, file, ensure_ascii=False, indent=4)
+        temp_path.replace(self.path)
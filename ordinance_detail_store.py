@@ -0,0 +1,143 @@
+import json
+import sqlite3
+import threading
+import time
+import urllib.parse
+import zlib
+from collections.abc import Mapping
+from pathlib import Path
+from ordinance_scraper_constant import Constant
+
+
+# ------ 함수 목록 ------
+def get_page_parameters(page_address: str):
+    """
+    조례 페이지 주소에서 (alrNo, histNo) 추출
+    ex) https://www.elis.go.kr/allalr/selectAlrBdtOne?alrNo=123&histNo=4&menuNm=main -> ('123', '4')
+    :param page_address: 조례 페이지 주소
+    :return: (alrNo, histNo), 파라미터가 없으면 None
+    """
+    params = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(page_address).query))
+    if 'alrNo' not in params or 'histNo' not in params:
+        return None
+    return params['alrNo'], params['histNo']
+
+
+# ------ 클래스 선언 ------
+class OrdinanceDetailStore:
+    """
+    조례 본문 페이지 저장소
+    (alrNo, histNo) 는 조례의 특정 연혁(버전)을 가리키므로 내용이 바뀌지 않는다
+    따라서 유효기간 없이 원문 HTML 과 get_ordinance_clause 결과(조항 딕셔너리)를 함께 보관하여
+    검색어, 실행 회차와 관계없이 재사용한다
+    """
+
+    # 조항 딕셔너리 형식 버전 (추출 방식이 바뀌면 올림, 버전이 다른 조항 딕셔너리는 저장된 원문으로 다시 파싱)
+    VERSION = 2
+
+    def __init__(self, path=None):
+        # 저장소 파일 경로 (기본: cache/details.sqlite3)
+        if path is None:
+            cache_dir = Path(Constant.CACHE_DIR)
+            cache_dir.mkdir(exist_ok=True)
+            path = cache_dir / 'details.sqlite3'
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS ordinance_detail (
+                alr_no      TEXT NOT NULL,
+                hist_no     TEXT NOT NULL,
+                html        BLOB NOT NULL,
+                clause_dict TEXT NOT NULL,
+                stored_at   REAL NOT NULL,
+                version     INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (alr_no, hist_no)
+            )''')
+        # 버전 열이 없는 기존 저장소 (lxml 로 파싱한 조항 딕셔너리일 수 있으므로 버전 0)
+        columns = [row[1] for row in self._conn.execute('PRAGMA table_info(ordinance_detail)')]
+        if 'version' not in columns:
+            self._conn.execute('ALTER TABLE ordinance_detail ADD COLUMN version INTEGER NOT NULL DEFAULT 0')
+        self._conn.commit()
+
+    def __contains__(self, key):
+        alr_no, hist_no = key
+        with self._lock:
+            row = self._conn.execute('SELECT 1 FROM ordinance_detail WHERE alr_no = ? AND hist_no = ?',
+                                     (str(alr_no), str(hist_no))).fetchone()
+        return row is not None
+
+    def get_clause_dict(self, alr_no, hist_no):
+        """
+        저장된 조항 딕셔너리 조회 (원문 HTML 은 읽지 않음)
+        :return: 조항 딕셔너리, 없거나 버전이 다르면 None (원문은 get_html 로 다시 파싱)
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT clause_dict, version FROM ordinance_detail WHERE alr_no = ? AND hist_no = ?',
+                                     (str(alr_no), str(hist_no))).fetchone()
+        if row is None or row[1] != self.VERSION:
+            return None
+        return json.loads(row[0])
+
+    def get_html(self, alr_no, hist_no):
+        """
+        저장된 원문 HTML 조회
+        :return: HTML, 없으면 None
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT html FROM ordinance_detail WHERE alr_no = ? AND hist_no = ?',
+                                     (str(alr_no), str(hist_no))).fetchone()
+        if row is None:
+            return None
+        return zlib.decompress(row[0]).decode('utf-8')
+
+    def put(self, alr_no, hist_no, html, clause_dict):
+        """
+        원문 HTML 과 조항 딕셔너리 저장
+        :param alr_no: 조례번호
+        :param hist_no: 연혁번호
+        :param html: 원문 HTML
+        :param clause_dict: get_ordinance_clause 결과
+        """
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO ordinance_detail VALUES (?, ?, ?, ?, ?, ?)',
+                (str(alr_no), str(hist_no), zlib.compress(html.encode('utf-8')),
+                 json.dumps(clause_dict, ensure_ascii=False), time.time(), self.VERSION))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class StoredClauseDict(Mapping):
+    """
+    {지역: 조항 딕셔너리} 읽기 전용 딕셔너리
+    조항 딕셔너리는 메모리에 두지 않고 읽을 때마다 본문 저장소에서 조회한다 (스트리밍 파이프라인 결과용)
+    """
+
+    def __init__(self, detail_store, admin_page_parameters, admin_clause_dict=None):
+        """
+        :param detail_store: OrdinanceDetailStore
+        :param admin_page_parameters: {지역: (alrNo, histNo) 또는 None(조회 실패)} (이 순서대로 순회)
+        :param admin_clause_dict: 저장소에 없는 지역의 조항 딕셔너리 (주소에 alrNo, histNo 가 없는 조례)
+        """
+        self.detail_store = detail_store
+        self.admin_page_parameters = admin_page_parameters
+        self.admin_clause_dict = admin_clause_dict or {}
+
+    def __getitem__(self, admin):
+        if admin in self.admin_clause_dict:
+            return self.admin_clause_dict[admin]
+        page_parameters = self.admin_page_parameters[admin]
+        if page_parameters is None:
+            return None
+        return self.detail_store.get_clause_dict(*page_parameters)
+
+    def __iter__(self):
+        return iter(self.admin_page_parameters)
+
+    def __len__(self):
+        return len(self.admin_page_parameters)
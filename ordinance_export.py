@@ -0,0 +1,159 @@
+import csv
+import json
+import logging
+from itertools import islice
+
+# pyarrow 는 Parquet 저장에만 필요 (없으면 CSV, JSONL 만 사용 가능)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# ------ 상수 선언 ------
+SEARCH_FIELDS = ['region', 'title', 'update_date', 'department', 'page_address']
+CLAUSE_FIELDS = ['region', 'clause_title', 'paragraph_index', 'text']
+PARQUET_BATCH_SIZE = 10000  # Parquet 에 한 번에 기록할 행 수
+
+
+# ------ 함수 목록 ------
+def iter_search_rows(admin_ordinance_dict):
+    """
+    검색결과 딕셔너리(XlWrite.create_admin_search_resurlt 입력)를 행으로 변환
+    조례가 없는 시군구는 region 외에는 None
+    :param admin_ordinance_dict: {시군구: 조례정보 또는 None}
+    :return: 행 딕셔너리 generator
+    """
+    for region, info in admin_ordinance_dict.items():
+        if info:
+            yield {'region': region, 'title': info['title'], 'update_date': info['update_date'],
+                   'department': info['department'], 'page_address': info['page_address']}
+        else:
+            yield {'region': region, 'title': None, 'update_date': None, 'department': None, 'page_address': None}
+
+
+def iter_clause_rows(sorted_indices, admin_clause_dict):
+    """
+    조항 딕셔너리(XlWrite.create_compare_clause_sheet 입력)를 시군구 x 조항 x 문단 행으로 변환
+    조항 순서는 sorted_indices, 시군구 순서는 admin_clause_dict 순서 (엑셀 시트와 같은 순서)
+    :param sorted_indices: 조항제목 리스트
+    :param admin_clause_dict: {시군구: {조항제목: [문단, ...]}}
+    :return: 행 딕셔너리 generator (paragraph_index 는 0부터, 엑셀의 '세부항목 N' 은 N-1)
+    """
+    for clause_title in sorted_indices:
+        for region, clause_dict in admin_clause_dict.items():
+            if not clause_dict or clause_title not in clause_dict:
+                continue
+            for paragraph_index, text in enumerate(clause_dict[clause_title]):
+                yield {'region': region, 'clause_title': clause_title,
+                       'paragraph_index': paragraph_index, 'text': text}
+
+
+def write_csv(path, rows, fieldnames):
+    """
+    CSV 저장 (엑셀에서 한글이 깨지지 않도록 BOM 포함 UTF-8)
+    :return: 저장한 행 수
+    """
+    count = 0
+    with open(path, 'w', encoding='utf-8-sig', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def write_jsonl(path, rows):
+    """
+    JSON Lines 저장 (한 행씩 바로 기록)
+    :return: 저장한 행 수
+    """
+    count = 0
+    with open(path, 'w', encoding='utf-8') as file:
+        for row in rows:
+            file.write(json.dumps(row, ensure_ascii=False))
+            file.write('\n')
+            count += 1
+    return count
+
+
+def write_parquet(path, rows, schema):
+    """
+    Parquet 저장 (PARQUET_BATCH_SIZE 행씩 나눠 기록하므로 전체 행을 메모리에 올리지 않음)
+    :param schema: pyarrow.Schema
+    :return: 저장한 행 수
+    """
+    if pa is None:
+        raise ImportError('Parquet 저장에는 pyarrow 가 필요합니다 (pip install pyarrow)')
+
+    count = 0
+    rows = iter(rows)
+    with pq.ParquetWriter(path, schema, compression='zstd') as writer:
+        while True:
+            batch = list(islice(rows, PARQUET_BATCH_SIZE))
+            if not batch:
+                break
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+
+def get_schemas():
+    """
+    Parquet 스키마 (검색결과, 조항)
+    """
+    search_schema = pa.schema([(field, pa.string()) for field in SEARCH_FIELDS])
+    clause_schema = pa.schema([
+        ('region', pa.string()),
+        ('clause_title', pa.string()),
+        ('paragraph_index', pa.int32()),
+        ('text', pa.string()),
+    ])
+    return search_schema, clause_schema
+
+
+# ------ 클래스 선언 ------
+class OrdinanceExporter:
+    """
+    검색결과, 조항 데이터를 분석용 형식(Parquet, CSV, JSON Lines)으로 저장
+    XlWrite 와 같은 입력을 받으며 파일명은 {base_path}_search.{확장자}, {base_path}_clauses.{확장자}
+    """
+
+    def __init__(self, base_path, formats=('parquet', 'csv', 'jsonl')):
+        """
+        :param base_path: 저장 경로 (확장자 제외)
+        :param formats: 저장할 형식 ('parquet', 'csv', 'jsonl')
+        """
+        self.base_path = base_path
+        self.formats = list(formats)
+
+        # pyarrow 가 없으면 Parquet 은 건너뜀
+        if 'parquet' in self.formats and pa is None:
+            logging.warning('pyarrow 미설치로 Parquet 저장 생략')
+            self.formats.remove('parquet')
+
+    def export_search_result(self, admin_ordinance_dict):
+        for file_format in self.formats:
+            path = f'{self.base_path}_search.{file_format}'
+            count = self._write(file_format, path, lambda: iter_search_rows(admin_ordinance_dict), SEARCH_FIELDS, 0)
+            logging.info(f'검색결과 저장 :\n{path} ({count}행)')
+
+    def export_clauses(self, sorted_indices, admin_clause_dict):
+        for file_format in self.formats:
+            path = f'{self.base_path}_clauses.{file_format}'
+            count = self._write(file_format, path, lambda: iter_clause_rows(sorted_indices, admin_clause_dict),
+                                CLAUSE_FIELDS, 1)
+            logging.info(f'조항 저장 :\n{path} ({count}행)')
+
+    # ------ 내부함수 목록 ------
+    @staticmethod
+    def _write(file_format, path, make_rows, fieldnames, schema_index):
+        if file_format == 'csv':
+            return write_csv(path, make_rows(), fieldnames)
+        if file_format == 'jsonl':
+            return write_jsonl(path, make_rows())
+        if file_format == 'parquet':
+            return write_parquet(path, make_rows(), get_schemas()[schema_index])
+        raise ValueError(f'지원하지 않는 형식 : {file_format}')
@@ -0,0 +1,117 @@
+import html
+import re
+
+# ------ 정규식 미리 컴파일 ------
+# 검색건수 : div.list-top > div.left > p > span
+RESULT_COUNT_PATTERN = re.compile(
+    r'<div[^>]*class="[^"]*\blist-top\b[^"]*"[^>]*>.*?'
+    r'<div[^>]*class="[^"]*\bleft\b[^"]*"[^>]*>.*?'
+    r'<p\b[^>]*>.*?<span\b[^>]*>\s*([\d,]+)\s*</span>',
+    re.DOTALL)
+
+# 검색결과 목록 시작 위치 : div.search-result-list
+RESULT_LIST_PATTERN = re.compile(r'<div[^>]*class="[^"]*\bsearch-result-list\b[^"]*"[^>]*>')
+
+# 검색결과 한 건 : <a onclick="..."> <strong>제목</strong> <span>지역 제개정일 담당부서</span>
+RESULT_ITEM_PATTERN = re.compile(
+    r'<a\b[^>]*?\bonclick="([^"]*)"[^>]*>\s*'
+    r'<strong\b[^>]*>(.*?)</strong>\s*'
+    r'<span\b[^>]*>(.*?)</span>',
+    re.DOTALL)
+
+# onclick 속성의 페이지 파라미터 : ...s('alrNo', 'histNo');
+PAGE_PARAMETERS_PATTERN = re.compile(r"s\('(.*?)', '(.*?)'\);")
+
+# 태그 / 주석 제거용
+COMMENT_PATTERN = re.compile(r'<!--.*?-->', re.DOTALL)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+# ------ 함수 목록 ------
+def html_to_text(fragment: str) -> str:
+    """
+    HTML 조각에서 텍스트만 추출 (BeautifulSoup get_text 와 같은 결과)
+    :param fragment: HTML 조각
+    :return: 텍스트
+    """
+    return html.unescape(TAG_PATTERN.sub('', COMMENT_PATTERN.sub('', fragment)))
+
+
+def extract_result_count(page_html: str):
+    """
+    검색 페이지에서 총 검색건수 추출
+    :param page_html: 검색 페이지 HTML
+    :return: 검색건수, 없으면 None
+    """
+    match = RESULT_COUNT_PATTERN.search(page_html)
+    if match is None:
+        return None
+    return int(match.group(1).replace(',', ''))
+
+
+def extract_page_parameters(onclick: str):
+    """
+    onclick 속성에서 (alrNo, histNo) 추출
+    :param onclick: onclick 속성값 ex) fnDetail('123', '4');
+    :return: (alrNo, histNo), 없으면 None
+    """
+    match = PAGE_PARAMETERS_PATTERN.search(html.unescape(onclick))
+    if match is None:
+        return None
+    return match.group(1), match.group(2)
+
+
+def extract_search_results(page_html: str):
+    """
+    검색 페이지에서 검색결과 목록 추출 (DOM 생성 없이 정규식으로)
+    :param page_html: 검색 페이지 HTML
+    :return: [{'title_text', 'info_text', 'page_parameters'}, ...] (페이지 내 순서 유지)
+    """
+    start = RESULT_LIST_PATTERN.search(page_html)
+    if start is None:
+        return []
+
+    results = []
+    for match in RESULT_ITEM_PATTERN.finditer(page_html, start.end()):
+        onclick, title_html, info_html = match.groups()
+        results.append({
+            'title_text': html_to_text(title_html),
+            'info_text': html_to_text(info_html),
+            'page_parameters': extract_page_parameters(onclick),
+        })
+    return results
+
+
+def get_ordinance_info_list(page_html: str, search_keyword: str):
+    """
+    검색 페이지에서 키워드와 일치하는 조례정보 리스트 추출
+    ordinance_scraper.get_ordinance_info 와 같은 형식을 돌려준다
+    :param page_html: 검색 페이지 HTML
+    :param search_keyword: 검색어
+    :return: [[지역, 제목, 제개정일, 담당부서, 페이지주소], ...]
+    """
+    keyword_list = search_keyword.split(' ')
+    ordinance_info_list = []
+
+    for result in extract_search_results(page_html):
+        # 조례 제목 (DOM 경로와 같은 방식으로 자름)
+        ordinance_title = result['title_text'][367:-12]
+
+        # 키워드 중에 조례에 하나라도 포함 되지 않으면 넘김
+        if any(word not in ordinance_title for word in keyword_list):
+            continue
+        if result['page_parameters'] is None:
+            continue
+
+        # 조례관련정보 작성
+        info_words = result['info_text'].split(' ')
+        if len(info_words) < 3:
+            continue
+        alr_no, hist_no = result['page_parameters']
+        ordinance_page = (f"https://www.elis.go.kr/allalr/"
+                          f"selectAlrBdtOne?alrNo={alr_no}"
+                          f"&histNo={hist_no}&menuNm=main")
+
+        ordinance_info_list.append([' '.join(info_words[:2]), ordinance_title,
+                                    info_words[2], ' '.join(info_words[3:]), ordinance_page])
+    return ordinance_info_list
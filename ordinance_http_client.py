@@ -0,0 +1,228 @@
+import logging
+import threading
+import time
+from contextlib import nullcontext
+import requests
+from requests.adapters import HTTPAdapter
+from ordinance_scraper_constant import Constant
+from ordinance_response_cache import ResponseCache
+from ordinance_rate_limiter import RateLimiter, get_backoff_delay, parse_retry_after
+
+# ------ 모듈 변수 ------
+_session = None  # 공용 세션
+_session_lock = threading.Lock()  # 세션 생성 잠금 (스레드 동시 생성 방지)
+_response_cache = None  # 디스크 응답 캐시
+_cache_enabled = True  # 응답 캐시 사용 여부
+_rate_limiter = None  # 공용 요청 속도 제한
+_rate_limit_enabled = True  # 요청 속도 제한 사용 여부
+
+
+# ------ 함수 목록 ------
+def create_session(pool_size: int = Constant.HTTP_POOL_SIZE) -> requests.Session:
+    """
+    keep-alive 커넥션 풀을 가진 세션을 만드는 함수
+    :param pool_size: 호스트당 유지할 커넥션 수
+    :return: 기본 헤더(Constant.HEADERS)가 설정된 requests.Session
+    """
+    session = requests.Session()
+
+    # 커넥션 풀 설정 (같은 호스트로 가는 요청은 TCP/TLS 연결을 재사용)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    # 기본 요청 헤더 설정
+    session.headers.update(Constant.HEADERS)
+    return session
+
+
+def configure(pool_size: int = Constant.HTTP_POOL_SIZE):
+    """
+    공용 세션의 커넥션 풀 크기를 변경하는 함수 (기존 세션은 닫고 새로 생성)
+    :param pool_size: 호스트당 유지할 커넥션 수
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = create_session(pool_size)
+    logging.debug(f'HTTP 커넥션 풀 크기 :\n{pool_size}')
+
+
+def get_session() -> requests.Session:
+    """
+    공용 세션 반환 (없으면 기본 설정으로 생성)
+    :return: requests.Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """
+    공용 세션으로 GET 요청 (속도 제한, 재시도 포함)
+    연결 오류와 Constant.RETRY_STATUS 응답은 지수 백오프 + jitter 로 재시도하고,
+    Retry-After 가 있으면 그 시간 동안 속도 제한의 모든 요청을 멈춘다 (속도 제한이 없으면 이 요청만 기다림)
+    재시도를 모두 실패하면 연결 오류는 예외를, 오류 응답은 마지막 응답을 반환한다
+    :param url: 요청할 URL
+    :param kwargs: requests.get 과 같은 인자
+    :return: requests.Response
+    """
+    kwargs.setdefault('timeout', Constant.HTTP_TIMEOUT)
+    rate_limiter = get_rate_limiter()
+
+    attempt = 0
+    while True:
+        response = None
+        error = None
+        with rate_limiter.slot() if rate_limiter is not None else nullcontext():
+            # 응답 시간은 자리, 토큰 대기를 빼고 요청만 측정 (대기 시간이 혼잡으로 잡히지 않도록)
+            start = time.monotonic()
+            try:
+                response = get_session().get(url, **kwargs)
+                latency = time.monotonic() - start
+            except (requests.ConnectionError, requests.Timeout) as request_error:
+                error = request_error
+
+        # 성공 (재시도 대상이 아닌 응답)
+        if response is not None and response.status_code not in Constant.RETRY_STATUS:
+            if rate_limiter is not None:
+                rate_limiter.record_success(latency)
+            return response
+
+        # 실패 기록 (429/503 은 요청 제한으로 보고 초당 요청 수도 줄임)
+        if rate_limiter is not None:
+            if response is not None and response.status_code in (429, 503):
+                rate_limiter.record_throttle()
+            else:
+                rate_limiter.record_failure()
+
+        reason = f'{error!r}' if error is not None else f'응답 코드 {response.status_code}'
+        if attempt >= Constant.RETRY_MAX_ATTEMPTS:
+            logging.error(f'요청 실패 ({attempt}회 재시도) :\n{url}\n{reason}')
+            if error is not None:
+                raise error
+            return response
+
+        delay = get_backoff_delay(attempt)
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                # 서버가 허용한 시각보다 먼저 보내지 않음 (RETRY_MAX_DELAY 로 줄이지 않음)
+                if rate_limiter is not None:
+                    rate_limiter.defer(retry_after)
+                else:
+                    delay = max(delay, retry_after)
+        logging.warning(f'요청 재시도 {attempt + 1}회 ({delay:.1f}초 후) :\n{url}\n{reason}')
+        time.sleep(delay)
+        attempt += 1
+
+
+def get_rate_limiter():
+    """
+    공용 요청 속도 제한 반환 (사용하지 않으면 None)
+    :return: RateLimiter 또는 None
+    """
+    global _rate_limiter
+    if not _rate_limit_enabled:
+        return None
+    if _rate_limiter is None:
+        with _session_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter()
+    return _rate_limiter
+
+
+def set_rate_limiter(rate_limiter):
+    """
+    공용 요청 속도 제한 교체
+    :param rate_limiter: RateLimiter, None 이면 속도 제한 사용 안함 (재시도는 유지)
+    """
+    global _rate_limiter, _rate_limit_enabled
+    _rate_limiter = rate_limiter
+    _rate_limit_enabled = rate_limiter is not None
+
+
+def get_response_cache():
+    """
+    공용 응답 캐시 반환 (사용하지 않으면 None)
+    :return: ResponseCache 또는 None
+    """
+    global _response_cache
+    if not _cache_enabled:
+        return None
+    if _response_cache is None:
+        with _session_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache()
+    return _response_cache
+
+
+def set_response_cache(cache):
+    """
+    공용 응답 캐시 교체
+    :param cache: ResponseCache, None 이면 캐시 사용 안함
+    """
+    global _response_cache, _cache_enabled
+    _response_cache = cache
+    _cache_enabled = cache is not None
+
+
+def get_text(url: str, use_cache: bool = True) -> str:
+    """
+    URL의 응답 본문 반환 (디스크 캐시 경유)
+    1. 유효기간 내 캐시가 있으면 요청 없이 반환
+    2. 만료된 캐시는 ETag/Last-Modified 로 조건부 요청, 304 이면 캐시 재사용
+    3. 그 외에는 새로 요청하여 캐시에 저장
+    재시도 후에도 오류 응답이면 requests.HTTPError (오류 페이지를 본문으로 처리하지 않음)
+    :param url: 요청할 URL
+    :param use_cache: 캐시 사용 여부
+    :return: 응답 본문
+    """
+    cache = get_response_cache() if use_cache else None
+    if cache is None:
+        response = get(url)
+        response.raise_for_status()
+        return response.text
+
+    entry = cache.lookup(url)
+    if entry is not None and entry['fresh']:
+        return entry['body']
+
+    # 조건부 요청 헤더 작성
+    headers = {}
+    if entry is not None:
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    response = get(url, headers=headers)
+    if response.status_code == 304 and entry is not None:
+        logging.debug(f'캐시 재검증 (304) :\n{url}')
+        cache.revalidated(url)
+        return entry['body']
+
+    # 재시도 후에도 오류 응답이면 오류 페이지를 본문으로 쓰지 않고 예외
+    response.raise_for_status()
+
+    # 정상 응답만 캐시에 저장
+    cache.store(url, response.text,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'))
+    return response.text
+
+
+def close():
+    """
+    공용 세션 닫기
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
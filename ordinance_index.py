@@ -0,0 +1,429 @@
+import json
+import logging
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from ordinance_detail_store import get_page_parameters
+from ordinance_scraper_constant import Constant
+
+# ------ 상수 선언 ------
+_WORD = re.compile(r'[^\W_]+')  # FTS5 unicode61 이 하나의 토큰으로 보는 문자 (문자, 숫자)
+
+
+# ------ 함수 목록 ------
+def load_administrative_codes(path=None):
+    """
+    시군구 코드 파일(administrative_code.json) 불러오기
+    :param path: 파일 경로 (기본: Constant.ADMINISTRATIVE_CODE_FILE)
+    :return: {시군구명: (ctpvCd, sggCd)} ex) {"경북 봉화군": ("47", "920")}
+    """
+    if path is None:
+        path = Path(__file__).resolve().parent / Constant.ADMINISTRATIVE_CODE_FILE
+    with open(path, 'r', encoding='utf-8') as file:
+        administrative_code_dict = json.load(file)
+
+    return {admin: tuple(code)
+            for region_dict in administrative_code_dict.values()
+            for admin, code in region_dict.items()}
+
+
+def get_bigram_text(text):
+    """
+    FTS 색인용 문자 bigram 토큰 문자열 (한 글자 단어는 그대로)
+    대부분 두 글자인 한국어 검색어(지원, 수색)도 색인으로 찾을 수 있도록 글자 두 개씩 토큰으로 만든다
+    ex) '실종자 수색 및 지원' -> '실종 종자 수색 및 지원'
+    :param text: 원문
+    :return: 공백으로 구분된 bigram
+    """
+    tokens = []
+    for word in _WORD.findall(text):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[position:position + 2] for position in range(len(word) - 1))
+    return ' '.join(tokens)
+
+
+def split_keyword(keyword):
+    """
+    검색어를 FTS 검색어(두 글자 이상)와 직접 비교할 한 글자 단어로 나누기
+    두 글자 이상 단어는 bigram 구(phrase)로 찾고 (이어지는 bigram 이므로 부분 문자열 일치와 같음)
+    bigram 색인으로 찾을 수 없는 한 글자 단어만 instr 로 거른다
+    ex) '실종자 지원' -> ('"실종 종자" AND "지원"', [])
+    :param keyword: 공백으로 구분된 검색어
+    :return: (FTS MATCH 식 또는 None, 한 글자 단어 리스트)
+    """
+    words = _WORD.findall(keyword) if keyword else []
+    match = ' AND '.join(f'"{get_bigram_text(word)}"' for word in words if len(word) >= 2) or None
+    short_words = [word for word in words if len(word) < 2]
+    return match, short_words
+
+
+# ------ 클래스 선언 ------
+class OrdinanceIndex:
+    """
+    조례 로컬 색인 (SQLite)
+    - region : 시군구 (ctpvCd, sggCd)
+    - ordinance : 조례 (alrNo), 현재 버전
+    - version : 조례 연혁 (histNo, 제개정일)
+    - clause / paragraph : 버전별 조항, 문단
+    - ordinance_fts / clause_fts : 조례제목, 조항제목+조항내용 FTS5 색인 (get_bigram_text 로 만든 문자 bigram)
+    """
+
+    def __init__(self, path=None):
+        # 색인 파일 경로 (기본: cache/ordinance_index.sqlite3)
+        if path is None:
+            cache_dir = Path(Constant.CACHE_DIR)
+            cache_dir.mkdir(exist_ok=True)
+            path = cache_dir / 'ordinance_index.sqlite3'
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA foreign_keys=ON')
+
+        # 이전 trigram 색인은 두 글자 검색어를 찾지 못하므로 bigram 색인으로 다시 만듦
+        row = self._conn.execute("SELECT sql FROM sqlite_master WHERE name = 'ordinance_fts'").fetchone()
+        rebuild_fts = row is not None and 'trigram' in row[0]
+        if rebuild_fts:
+            self._conn.executescript('DROP TABLE ordinance_fts; DROP TABLE IF EXISTS clause_fts;')
+
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS region (
+                region_id INTEGER PRIMARY KEY,
+                name      TEXT NOT NULL UNIQUE,
+                ctpv_cd   TEXT,
+                sgg_cd    TEXT
+            );
+            CREATE INDEX IF NOT EXISTS region_code ON region (ctpv_cd, sgg_cd);
+
+            CREATE TABLE IF NOT EXISTS ordinance (
+                ordinance_id       INTEGER PRIMARY KEY,
+                region_id          INTEGER NOT NULL REFERENCES region (region_id),
+                alr_no             TEXT NOT NULL UNIQUE,
+                title              TEXT NOT NULL,
+                department         TEXT,
+                current_version_id INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS ordinance_region ON ordinance (region_id);
+
+            CREATE TABLE IF NOT EXISTS version (
+                version_id   INTEGER PRIMARY KEY,
+                ordinance_id INTEGER NOT NULL REFERENCES ordinance (ordinance_id),
+                hist_no      TEXT NOT NULL,
+                update_date  TEXT,
+                page_address TEXT,
+                UNIQUE (ordinance_id, hist_no)
+            );
+
+            CREATE TABLE IF NOT EXISTS clause (
+                clause_id  INTEGER PRIMARY KEY,
+                version_id INTEGER NOT NULL REFERENCES version (version_id),
+                position   INTEGER NOT NULL,
+                title      TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS clause_version ON clause (version_id);
+
+            CREATE TABLE IF NOT EXISTS paragraph (
+                paragraph_id INTEGER PRIMARY KEY,
+                clause_id    INTEGER NOT NULL REFERENCES clause (clause_id),
+                position     INTEGER NOT NULL,
+                text         TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS paragraph_clause ON paragraph (clause_id);
+
+            CREATE VIRTUAL TABLE IF NOT EXISTS ordinance_fts USING fts5(title, tokenize='unicode61');
+            CREATE VIRTUAL TABLE IF NOT EXISTS clause_fts USING fts5(title, body, tokenize='unicode61');
+        ''')
+        if rebuild_fts:
+            self._rebuild_fts()
+        self._conn.commit()
+
+        # 시군구 코드가 없으면 administrative_code.json 에서 불러오기
+        if self._conn.execute('SELECT COUNT(*) FROM region').fetchone()[0] == 0:
+            self.load_regions()
+
+    def load_regions(self, path=None):
+        """
+        시군구 코드 파일을 region 테이블에 반영
+        :param path: administrative_code.json 경로
+        """
+        with self._lock:
+            for admin, (ctpv_cd, sgg_cd) in load_administrative_codes(path).items():
+                self._conn.execute(
+                    'INSERT INTO region (name, ctpv_cd, sgg_cd) VALUES (?, ?, ?) '
+                    'ON CONFLICT (name) DO UPDATE SET ctpv_cd = excluded.ctpv_cd, sgg_cd = excluded.sgg_cd',
+                    (admin, ctpv_cd, sgg_cd))
+            self._conn.commit()
+
+    def add_ordinance(self, admin, info, clause_dict, commit=True):
+        """
+        조례 한 건(버전) 저장, 이미 있는 버전이면 조례정보만 갱신
+        :param admin: 시군구명 ex) 경북 봉화군
+        :param info: 조례정보 딕셔너리 (title, update_date, department, page_address)
+        :param clause_dict: get_ordinance_clause 결과 {조항제목: [문단, ...]}, None 이면(조회 실패) 저장하지 않음
+        :param commit: 바로 커밋할지 여부 (여러 건을 모아 저장할 때 False)
+        :return: version_id, 페이지 파라미터가 없거나 저장하지 않으면 None
+        """
+        # 조항 조회에 실패한 조례는 빈 버전으로 남기지 않음 (같은 버전은 다시 저장되지 않으므로)
+        if clause_dict is None:
+            logging.warning(f'조항 없음으로 저장 안함 :\n{admin} {info["title"]}')
+            return None
+        page_parameters = get_page_parameters(info['page_address'])
+        if page_parameters is None:
+            logging.warning(f'조례 페이지 파라미터 없음 :\n{admin} {info["title"]}')
+            return None
+        alr_no, hist_no = page_parameters
+
+        with self._lock:
+            region_id = self._get_region_id(admin)
+
+            # 조례 저장 (제목, 담당부서는 최신 값으로 갱신)
+            self._conn.execute(
+                'INSERT INTO ordinance (region_id, alr_no, title, department) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT (alr_no) DO UPDATE SET region_id = excluded.region_id, '
+                'title = excluded.title, department = excluded.department',
+                (region_id, alr_no, info['title'], info['department']))
+            ordinance_id = self._conn.execute('SELECT ordinance_id FROM ordinance WHERE alr_no = ?',
+                                              (alr_no,)).fetchone()[0]
+            self._conn.execute('INSERT OR REPLACE INTO ordinance_fts (rowid, title) VALUES (?, ?)',
+                               (ordinance_id, get_bigram_text(info['title'])))
+
+            # 버전 저장 (이미 있는 버전이면 조항은 그대로)
+            row = self._conn.execute('SELECT version_id FROM version WHERE ordinance_id = ? AND hist_no = ?',
+                                     (ordinance_id, hist_no)).fetchone()
+            if row is None:
+                version_id = self._conn.execute(
+                    'INSERT INTO version (ordinance_id, hist_no, update_date, page_address) VALUES (?, ?, ?, ?)',
+                    (ordinance_id, hist_no, info['update_date'], info['page_address'])).lastrowid
+                self._insert_clauses(version_id, clause_dict)
+            else:
+                version_id = row[0]
+
+            self._conn.execute('UPDATE ordinance SET current_version_id = ? WHERE ordinance_id = ?',
+                               (version_id, ordinance_id))
+            if commit:
+                self._conn.commit()
+        return version_id
+
+    def add_search_result(self, admin_ordinance_dict, admin_ordinance_clause_dict):
+        """
+        검색결과와 조항 딕셔너리를 한 번에 저장
+        :param admin_ordinance_dict: {시군구: 조례정보}
+        :param admin_ordinance_clause_dict: {시군구: 조항 딕셔너리 또는 None(조회 실패)}
+        """
+        for admin, info in admin_ordinance_dict.items():
+            # 조항 조회에 실패한 지역은 다음 실행에서 다시 저장
+            if info and admin_ordinance_clause_dict.get(admin) is not None:
+                self.add_ordinance(admin, info, admin_ordinance_clause_dict[admin], commit=False)
+        self.commit()
+        logging.info(f'조례 색인 저장 :\n{len(admin_ordinance_dict)}건')
+
+    def search_ordinances(self, keyword):
+        """
+        조례제목 검색 (현재 버전 기준)
+        시군구에 맞는 조례가 여러 건이면 가장 짧은 제목(검색어에 가장 가까운), 최근 제개정일, 조례번호 순으로 첫 건
+        :param keyword: 공백으로 구분된 검색어 (모든 단어 포함)
+        :return: {시군구: 조례정보} (OrdinanceScraper.admin_ordinance_dict 형식, 시군구 순 정렬)
+        """
+        match, short_words = split_keyword(keyword)
+        sql = ('SELECT r.name, o.title, v.update_date, o.department, v.page_address '
+               'FROM ordinance_fts f '
+               'JOIN ordinance o ON o.ordinance_id = f.rowid '
+               'JOIN region r ON r.region_id = o.region_id '
+               'JOIN version v ON v.version_id = o.current_version_id '
+               'WHERE 1 = 1')
+        params = []
+        if match:
+            sql += ' AND ordinance_fts MATCH ?'
+            params.append(match)
+        for word in short_words:
+            sql += ' AND instr(o.title, ?) > 0'
+            params.append(word)
+
+        with self._lock:
+            rows = self._conn.execute(
+                sql + ' ORDER BY r.name, length(o.title), v.update_date DESC, CAST(o.alr_no AS INTEGER), o.alr_no',
+                params).fetchall()
+        admin_ordinance_dict = {}
+        for admin, title, update_date, department, page_address in rows:
+            admin_ordinance_dict.setdefault(admin, {'title': title, 'update_date': update_date,
+                                                    'department': department, 'page_address': page_address})
+        return admin_ordinance_dict
+
+    def search_clauses(self, ordinance_keyword=None, clause_title_keyword=None, text_keyword=None):
+        """
+        조항 검색 (현재 버전 기준)
+        ex) 실종자 조례 중 '지원' 조항에 '수색'이 들어간 시군구
+            search_clauses(ordinance_keyword='실종자', clause_title_keyword='지원', text_keyword='수색')
+        :param ordinance_keyword: 조례제목 검색어
+        :param clause_title_keyword: 조항제목 검색어
+        :param text_keyword: 조항내용 검색어
+        :return: [{'region', 'ctpv_cd', 'sgg_cd', 'ordinance_title', 'clause_title'}, ...]
+        """
+        sql = ('SELECT r.name, r.ctpv_cd, r.sgg_cd, o.title, c.title '
+               'FROM clause_fts cf '
+               'JOIN clause c ON c.clause_id = cf.rowid '
+               'JOIN ordinance o ON o.current_version_id = c.version_id '
+               'JOIN region r ON r.region_id = o.region_id '
+               'WHERE 1 = 1')
+        params = []
+
+        # 조항 FTS 조건 (컬럼 지정)
+        clause_matches = []
+        for column, keyword in (('title', clause_title_keyword), ('body', text_keyword)):
+            match, short_words = split_keyword(keyword)
+            if match:
+                clause_matches.append(f'{column} : ({match})')
+            for word in short_words:
+                if column == 'title':
+                    sql += ' AND instr(c.title, ?) > 0'
+                else:
+                    sql += (' AND EXISTS (SELECT 1 FROM paragraph p '
+                            'WHERE p.clause_id = c.clause_id AND instr(p.text, ?) > 0)')
+                params.append(word)
+        if clause_matches:
+            sql += ' AND clause_fts MATCH ?'
+            params.append(' AND '.join(clause_matches))
+
+        # 조례제목 조건
+        if ordinance_keyword:
+            match, short_words = split_keyword(ordinance_keyword)
+            if match:
+                sql += ' AND o.ordinance_id IN (SELECT rowid FROM ordinance_fts WHERE ordinance_fts MATCH ?)'
+                params.append(match)
+            for word in short_words:
+                sql += ' AND instr(o.title, ?) > 0'
+                params.append(word)
+
+        with self._lock:
+            rows = self._conn.execute(sql + ' ORDER BY r.name, c.position', params).fetchall()
+        return [{'region': region, 'ctpv_cd': ctpv_cd, 'sgg_cd': sgg_cd,
+                 'ordinance_title': ordinance_title, 'clause_title': clause_title}
+                for region, ctpv_cd, sgg_cd, ordinance_title, clause_title in rows]
+
+    def get_clause_dict(self, version_id):
+        """
+        버전의 조항 딕셔너리 (get_ordinance_clause 형식)
+        :param version_id: 버전 ID
+        :return: {조항제목: [문단, ...]}
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT c.title, p.text FROM clause c '
+                'LEFT JOIN paragraph p ON p.clause_id = c.clause_id '
+                'WHERE c.version_id = ? ORDER BY c.position, p.position', (version_id,)).fetchall()
+        clause_dict = {}
+        for clause_title, text in rows:
+            paragraphs = clause_dict.setdefault(clause_title, [])
+            if text is not None:
+                paragraphs.append(text)
+        return clause_dict
+
+    def get_admin_ordinance_clause_dict(self, admin_ordinance_dict):
+        """
+        검색결과 시군구들의 현재 버전 조항 딕셔너리
+        :param admin_ordinance_dict: {시군구: 조례정보}
+        :return: {시군구: 조항 딕셔너리}
+        """
+        admin_ordinance_clause_dict = {}
+        for admin, info in admin_ordinance_dict.items():
+            page_parameters = get_page_parameters(info['page_address'])
+            if page_parameters is None:
+                admin_ordinance_clause_dict[admin] = {}
+                continue
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT v.version_id FROM version v JOIN ordinance o ON o.ordinance_id = v.ordinance_id '
+                    'WHERE o.alr_no = ? AND v.hist_no = ?', page_parameters).fetchone()
+            admin_ordinance_clause_dict[admin] = self.get_clause_dict(row[0]) if row else {}
+        return admin_ordinance_clause_dict
+
+    def iter_current_ordinances(self):
+        """
+        현재 버전이 있는(폐지되지 않은) 모든 조례 (유사 조례 벡터 색인 작성용)
+        :return: (조례번호, 시군구명, 조례제목, 조항 딕셔너리) generator
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT o.alr_no, r.name, o.title, o.current_version_id FROM ordinance o '
+                'JOIN region r ON r.region_id = o.region_id '
+                'WHERE o.current_version_id IS NOT NULL ORDER BY o.ordinance_id').fetchall()
+        for alr_no, admin, title, version_id in rows:
+            yield alr_no, admin, title, self.get_clause_dict(version_id)
+
+    def get_current_version(self, alr_no):
+        """
+        조례의 현재 버전 (증분 갱신 비교용)
+        :param alr_no: 조례번호
+        :return: (histNo, 제개정일), 없으면 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT v.hist_no, v.update_date FROM ordinance o '
+                'JOIN version v ON v.version_id = o.current_version_id WHERE o.alr_no = ?',
+                (str(alr_no),)).fetchone()
+        return tuple(row) if row else None
+
+    def retire_missing(self, admin, alr_nos):
+        """
+        시군구 전체 목록에 더 이상 없는 조례를 현재 버전 없음(폐지)으로 표시
+        :param admin: 시군구명
+        :param alr_nos: 이번 목록에 있는 조례번호 집합
+        :return: 폐지 처리된 조례 수
+        """
+        alr_nos = {str(alr_no) for alr_no in alr_nos}
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT o.ordinance_id, o.alr_no FROM ordinance o JOIN region r ON r.region_id = o.region_id '
+                'WHERE r.name = ? AND o.current_version_id IS NOT NULL', (admin,)).fetchall()
+            retired = [(ordinance_id,) for ordinance_id, alr_no in rows if alr_no not in alr_nos]
+            self._conn.executemany('UPDATE ordinance SET current_version_id = NULL WHERE ordinance_id = ?', retired)
+            self._conn.commit()
+        return len(retired)
+
+    def commit(self):
+        with self._lock:
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ------ 내부함수 목록 ------
+    def _get_region_id(self, admin):
+        # 시군구 ID 조회 (코드 파일에 없는 시군구는 코드 없이 추가)
+        row = self._conn.execute('SELECT region_id FROM region WHERE name = ?', (admin,)).fetchone()
+        if row is not None:
+            return row[0]
+        return self._conn.execute('INSERT INTO region (name) VALUES (?)', (admin,)).lastrowid
+
+    def _insert_clauses(self, version_id, clause_dict):
+        for position, (clause_title, paragraphs) in enumerate(clause_dict.items()):
+            clause_id = self._conn.execute(
+                'INSERT INTO clause (version_id, position, title) VALUES (?, ?, ?)',
+                (version_id, position, clause_title)).lastrowid
+            self._conn.executemany(
+                'INSERT INTO paragraph (clause_id, position, text) VALUES (?, ?, ?)',
+                [(clause_id, paragraph_position, text) for paragraph_position, text in enumerate(paragraphs)])
+            self._conn.execute('INSERT INTO clause_fts (rowid, title, body) VALUES (?, ?, ?)',
+                               (clause_id, get_bigram_text(clause_title), get_bigram_text('\n'.join(paragraphs))))
+
+    def _rebuild_fts(self):
+        # 조례제목, 조항 FTS 색인을 원본 테이블로 다시 작성
+        logging.info('조례 색인 FTS 다시 작성 (bigram)')
+        self._conn.executemany('INSERT INTO ordinance_fts (rowid, title) VALUES (?, ?)',
+                               ((ordinance_id, get_bigram_text(title)) for ordinance_id, title in
+                                self._conn.execute('SELECT ordinance_id, title FROM ordinance').fetchall()))
+        rows = self._conn.execute(
+            'SELECT c.clause_id, c.title, p.text FROM clause c '
+            'LEFT JOIN paragraph p ON p.clause_id = c.clause_id ORDER BY c.clause_id, p.position').fetchall()
+        clauses = {}
+        for clause_id, clause_title, text in rows:
+            clause = clauses.setdefault(clause_id, (clause_title, []))
+            if text is not None:
+                clause[1].append(text)
+        self._conn.executemany('INSERT INTO clause_fts (rowid, title, body) VALUES (?, ?, ?)',
+                               ((clause_id, get_bigram_text(clause_title), get_bigram_text('\n'.join(paragraphs)))
+                                for clause_id, (clause_title, paragraphs) in clauses.items()))
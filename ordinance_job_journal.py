@@ -0,0 +1,142 @@
+import json
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from ordinance_scraper_constant import Constant
+
+# ------ 상수 선언 ------
+_UNSAFE_FILENAME = re.compile(r'[\\/:*?"<>|\s]+')  # 파일 이름에 쓸 수 없는 문자
+
+
+# ------ 클래스 선언 ------
+class JobJournal:
+    """
+    수집 작업 기록 (write-ahead journal)
+    끝난 작업을 JSON Lines 파일에 한 줄씩 덧붙이고 줄마다 fsync 하여, 중간에 종료되어도 이어서 실행할 수 있게 한다
+    - start : 조회할 검색 페이지 수 (스냅샷은 시군구별 총 조례 건수)
+    - page : 끝난 검색 페이지와 추출한 조례정보 리스트 (이어서 실행할 때 다시 요청하지 않음, 스냅샷은 시군구별)
+    - detail : 새로 받아 본문 저장소에 넣은 (alrNo, histNo)
+    - region : 조항 조회가 끝난 지역 (스냅샷은 색인 저장까지 끝난 시군구)
+    - done : 작업 완료 (이어서 실행해도 처음부터 다시 시작)
+    마지막 줄이 쓰는 도중 끊겼으면 그 줄만 잘라내고 이어서 기록한다
+    ex) {"type": "page", "page": 3, "ordinances": [["경북 봉화군", "...조례", "2024.12.01", "...", "https://..."]]}
+    ex) {"type": "page", "region": "경북 봉화군", "page": 3, "ordinances": [...]}
+    """
+
+    def __init__(self, search_keyword, resume=False, path=None):
+        """
+        :param search_keyword: 검색어 (검색어마다 기록 파일 하나)
+        :param resume: 기존 기록 이어서 실행 (False 면 기록을 비우고 새로 시작)
+        :param path: 기록 파일 경로 (기본: cache/journal/{검색어}.jsonl)
+        """
+        if path is None:
+            path = Path(Constant.CACHE_DIR) / 'journal' / f"{_UNSAFE_FILENAME.sub('_', search_keyword.strip())}.jsonl"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._reset()
+
+        mode = 'w'
+        if resume and self.path.exists():
+            if self._load():
+                logging.info(f'이전 작업이 완료되어 새로 시작 :\n{self.path}')
+                self._reset()
+            else:
+                logging.info(f'작업 기록 이어서 실행 :\n검색 페이지 {len(self.pages) + len(self.region_pages)}개, '
+                             f'지역 {len(self.regions)}개, 본문 {len(self.details)}건 완료')
+                mode = 'a'
+        self._file = open(self.path, mode, encoding='utf-8')
+
+    def record_start(self, numbers_page):
+        self.numbers_page = numbers_page
+        self._append({'type': 'start', 'numbers_page': numbers_page})
+
+    def record_region_start(self, admin, result_count):
+        self.region_result_counts[admin] = result_count
+        self._append({'type': 'start', 'region': admin, 'result_count': result_count})
+
+    def record_page(self, page_number, ordinance_info_list):
+        self.pages[page_number] = ordinance_info_list
+        self._append({'type': 'page', 'page': page_number, 'ordinances': ordinance_info_list})
+
+    def record_region_page(self, admin, page_number, ordinance_info_list):
+        self.region_pages[(admin, page_number)] = ordinance_info_list
+        self._append({'type': 'page', 'region': admin, 'page': page_number, 'ordinances': ordinance_info_list})
+
+    def record_detail(self, alr_no, hist_no):
+        self.details.add((str(alr_no), str(hist_no)))
+        self._append({'type': 'detail', 'alr_no': str(alr_no), 'hist_no': str(hist_no)})
+
+    def record_region(self, admin):
+        self.regions.add(admin)
+        self._append({'type': 'region', 'admin': admin})
+
+    def finish(self):
+        """
+        작업 완료 기록 후 파일 닫기
+        """
+        self._append({'type': 'done'})
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    # ------ 내부함수 목록 ------
+    def _reset(self):
+        self.numbers_page = None
+        self.pages = {}  # {페이지 번호: 조례정보 리스트}
+        self.region_result_counts = {}  # {시군구: 총 조례 건수} (스냅샷)
+        self.region_pages = {}  # {(시군구, 페이지 번호): 조례정보 리스트} (스냅샷)
+        self.details = set()  # {(alrNo, histNo)}
+        self.regions = set()
+
+    def _append(self, record):
+        # 한 줄 쓰고 디스크까지 기록 (다음 작업으로 넘어가기 전에 남김)
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def _load(self):
+        """
+        기록 파일 읽기
+        :return: 작업 완료 기록이 있으면 True
+        """
+        # 쓰는 도중 끊긴 마지막 줄은 잘라냄 (이어 쓰는 기록이 그 줄에 붙지 않도록)
+        with open(self.path, 'rb+') as file:
+            data = file.read()
+            if data and not data.endswith(b'\n'):
+                line_end = data.rfind(b'\n') + 1
+                logging.warning(f'작업 기록의 끊긴 마지막 줄 삭제 :\n{data[line_end:][:100]!r}')
+                file.truncate(line_end)
+
+        finished = False
+        with open(self.path, 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 손상된 줄
+                    logging.warning(f'작업 기록의 손상된 줄 무시 :\n{line[:100]}')
+                    continue
+                if record['type'] == 'start' and 'region' in record:
+                    self.region_result_counts[record['region']] = record['result_count']
+                elif record['type'] == 'start':
+                    self.numbers_page = record['numbers_page']
+                elif record['type'] == 'page' and 'region' in record:
+                    self.region_pages[(record['region'], record['page'])] = record['ordinances']
+                elif record['type'] == 'page':
+                    self.pages[record['page']] = record['ordinances']
+                elif record['type'] == 'detail':
+                    self.details.add((record['alr_no'], record['hist_no']))
+                elif record['type'] == 'region':
+                    self.regions.add(record['admin'])
+                elif record['type'] == 'done':
+                    finished = True
+        return finished
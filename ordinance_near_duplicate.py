@@ -0,0 +1,150 @@
+import logging
+import re
+import zlib
+from collections import defaultdict
+import numpy as np
+from ordinance_scraper_constant import Constant
+
+# ------ 상수 선언 ------
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.iinfo(np.uint64).max
+_WHITESPACE = re.compile(r'\s+')
+
+
+# ------ 함수 목록 ------
+def get_ordinance_text(clause_dict):
+    """
+    조항 딕셔너리(get_ordinance_clause 결과)를 하나의 본문으로 합침 (공백은 비교에서 제외)
+    :param clause_dict: {조항제목: [문단, ...]}
+    :return: 본문 문자열
+    """
+    return _WHITESPACE.sub('', ''.join(title + ''.join(paragraphs) for title, paragraphs in clause_dict.items()))
+
+
+def get_shingles(text, shingle_size=Constant.MINHASH_SHINGLE_SIZE):
+    """
+    문자 n-gram(shingle) 해시 배열
+    :return: 중복 없는 crc32 해시 numpy 배열 (uint64)
+    """
+    if len(text) < shingle_size:
+        shingles = {text} if text else set()
+    else:
+        shingles = {text[i:i + shingle_size] for i in range(len(text) - shingle_size + 1)}
+    return np.fromiter((zlib.crc32(shingle.encode('utf-8')) for shingle in shingles),
+                       dtype=np.uint64, count=len(shingles))
+
+
+# ------ 클래스 선언 ------
+class NearDuplicateDetector:
+    """
+    MinHash + LSH 로 표준안을 베껴 만든 조례 묶음(템플릿 가족) 찾기
+    1. 조례 본문을 문자 n-gram 집합으로 보고 해시 함수 num_perm 개의 최솟값(MinHash 서명) 계산
+       (두 서명에서 값이 같은 비율 ≈ 두 집합의 Jaccard 유사도)
+    2. 서명을 bands 개 구간으로 나눠 구간이 같은 조례끼리만 후보 쌍 (모든 쌍을 비교하지 않음)
+    3. 후보 쌍 중 추정 유사도가 threshold 이상이면 같은 가족 (union-find)
+    가족에 속하지 않은 조례는 outlier (독자적으로 작성한 조례)
+    """
+
+    def __init__(self, num_perm=Constant.MINHASH_NUM_PERM, bands=Constant.MINHASH_BANDS,
+                 threshold=Constant.MINHASH_THRESHOLD, shingle_size=Constant.MINHASH_SHINGLE_SIZE, seed=1):
+        if num_perm % bands:
+            raise ValueError('num_perm 은 bands 로 나누어 떨어져야 합니다')
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+
+        # 해시 함수 (a * x + b) mod p (a < 2^31, x < 2^32 이므로 uint64 에서 넘치지 않음)
+        generator = np.random.default_rng(seed)
+        self._a = generator.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._b = generator.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+        self.regions = []
+        self.signatures = np.zeros((0, num_perm), dtype=np.uint64)
+
+    def get_signature(self, text):
+        """
+        MinHash 서명
+        :return: uint64 numpy 배열 (num_perm)
+        """
+        shingles = get_shingles(text, self.shingle_size)
+        if len(shingles) == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        # [num_perm, shingle 수] 한 번에 계산 (2^61 - 1 나머지는 나눗셈 대신 비트 접기)
+        hashes = np.outer(self._a, shingles)
+        hashes += self._b[:, None]
+        hashes = (hashes & _MERSENNE_PRIME) + (hashes >> np.uint64(61))
+        return hashes.min(axis=1)
+
+    def fit(self, admin_clause_dict):
+        """
+        시군구별 조례 서명 계산
+        :param admin_clause_dict: {시군구: {조항제목: [문단, ...]} 또는 None}
+        :return: self
+        """
+        self.regions = [region for region, clause_dict in admin_clause_dict.items() if clause_dict]
+        signatures = [self.get_signature(get_ordinance_text(admin_clause_dict[region])) for region in self.regions]
+        self.signatures = np.array(signatures, dtype=np.uint64).reshape(len(self.regions), self.num_perm)
+        return self
+
+    def get_candidate_pairs(self):
+        """
+        LSH 구간이 하나라도 같은 시군구 쌍
+        같은 버킷 안에서는 첫 조례, 바로 앞 조례와만 짝지음 (가족은 union-find 로 이어지므로 버킷이 커도 선형)
+        :return: {(i, j)} (i < j, regions 의 인덱스)
+        """
+        candidate_pairs = set()
+        for band in range(self.bands):
+            buckets = defaultdict(list)
+            band_signatures = self.signatures[:, band * self.rows:(band + 1) * self.rows]
+            for code, band_signature in enumerate(band_signatures):
+                buckets[band_signature.tobytes()].append(code)
+            for codes in buckets.values():
+                for position in range(1, len(codes)):
+                    candidate_pairs.add((codes[0], codes[position]))
+                    candidate_pairs.add((codes[position - 1], codes[position]))
+        return candidate_pairs
+
+    def get_similarity(self, code, other):
+        """
+        추정 Jaccard 유사도 (서명에서 값이 같은 비율)
+        """
+        return float(np.mean(self.signatures[code] == self.signatures[other]))
+
+    def get_families(self):
+        """
+        템플릿 가족과 outlier
+        :return: {'families': [[시군구, ...], ...] (큰 가족부터), 'outliers': [시군구, ...]}
+        """
+        parent = list(range(len(self.regions)))
+
+        def find(code):
+            while parent[code] != code:
+                parent[code] = parent[parent[code]]
+                code = parent[code]
+            return code
+
+        candidate_pairs = self.get_candidate_pairs()
+        for code, other in candidate_pairs:
+            if self.get_similarity(code, other) >= self.threshold:
+                parent[find(code)] = find(other)
+
+        groups = defaultdict(list)
+        for code, region in enumerate(self.regions):
+            groups[find(code)].append(region)
+        families = sorted((group for group in groups.values() if len(group) > 1), key=len, reverse=True)
+        outliers = [group[0] for group in groups.values() if len(group) == 1]
+
+        logging.info(f'유사 조례 묶음 :\n후보 쌍 {len(candidate_pairs)}개, 가족 {len(families)}개, '
+                     f'outlier {len(outliers)}개')
+        return {'families': families, 'outliers': outliers}
+
+
+def find_template_families(admin_clause_dict):
+    """
+    조항 딕셔너리에서 템플릿 가족 찾기
+    :param admin_clause_dict: {시군구: {조항제목: [문단, ...]} 또는 None}
+    :return: {'families': [[시군구, ...], ...], 'outliers': [시군구, ...]}
+    """
+    return NearDuplicateDetector().fit(admin_clause_dict).get_families()
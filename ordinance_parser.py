@@ -0,0 +1,90 @@
+import logging
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from ordinance_scraper_constant import Constant
+
+# ------ 파서 백엔드 선택 ------
+# lxml 이 설치되어 있으면 lxml(C 구현), 없으면 내장 html.parser 사용
+try:
+    import lxml  # noqa: F401
+    _backend = Constant.PARSER_BACKEND
+except ImportError:
+    _backend = 'html.parser'
+
+# ------ 선택자 미리 컴파일 ------
+# select 호출마다 CSS 선택자를 다시 컴파일하지 않도록 import 시 한 번만 컴파일
+SELECTOR = {name: soupsieve.compile(css) for name, css in Constant.SELECTOR.items()}
+
+# 검색 페이지 부분 파싱 조건 (검색결과 목록, 검색건수 영역만)
+SEARCH_PAGE_STRAINER = SoupStrainer('div', class_=Constant.SEARCH_PAGE_PARTS)
+
+
+# ------ 함수 목록 ------
+def set_backend(backend: str):
+    """
+    파서 백엔드 변경
+    :param backend: 'lxml' 또는 'html.parser'
+    """
+    global _backend
+    if backend == 'lxml':
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            logging.warning('lxml 미설치로 html.parser 사용')
+            backend = 'html.parser'
+    _backend = backend
+
+
+def get_backend() -> str:
+    return _backend
+
+
+def make_soup(html: str, parse_only=None) -> BeautifulSoup:
+    """
+    현재 파서 백엔드로 HTML 파싱
+    :param html: HTML 문자열
+    :param parse_only: bs4.SoupStrainer (지정한 부분만 파싱)
+    :return: BeautifulSoup 객체
+    """
+    return BeautifulSoup(html, _backend, parse_only=parse_only)
+
+
+def make_detail_soup(html: str) -> BeautifulSoup:
+    """
+    조례 본문 페이지 파싱 (현재 파서 백엔드)
+    lxml 은 항(p-02) 안의 호(p-03)를 형제로 나열하므로 get_ordinance_clause 가 앞 문단에 묶어서 추출한다
+    :param html: 조례 본문 페이지 HTML
+    :return: BeautifulSoup 객체
+    """
+    return make_soup(html)
+
+
+def make_search_soup(html: str) -> BeautifulSoup:
+    """
+    검색 페이지 부분 파싱
+    div.list-top(검색건수), div.search-result-list(검색결과) 하위만 트리로 만들고 나머지는 버린다
+    부분 트리에는 #container 등 상위 요소가 없으므로 'search_page_' 선택자를 사용한다
+    :param html: 검색 페이지 HTML
+    :return: BeautifulSoup 객체
+    """
+    return make_soup(html, parse_only=SEARCH_PAGE_STRAINER)
+
+
+def select(tag, name: str):
+    """
+    미리 컴파일된 선택자로 요소 리스트 조회
+    :param tag: 조회할 BeautifulSoup 요소
+    :param name: Constant.SELECTOR 의 키
+    :return: 요소 리스트
+    """
+    return SELECTOR[name].select(tag)
+
+
+def select_one(tag, name: str):
+    """
+    미리 컴파일된 선택자로 첫 번째 요소 조회
+    :param tag: 조회할 BeautifulSoup 요소
+    :param name: Constant.SELECTOR 의 키
+    :return: 요소, 없으면 None
+    """
+    return SELECTOR[name].select_one(tag)
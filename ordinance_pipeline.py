@@ -0,0 +1,276 @@
+import logging
+import queue
+import threading
+import ordinance_http_client
+import ordinance_parser
+from logging_config import setup_logging
+from ordinance_detail_store import StoredClauseDict, get_page_parameters
+from ordinance_index import OrdinanceIndex
+from ordinance_scraper import EmptyOrdinancePageError, OrdinanceScraper, get_ordinance_clause
+from ordinance_scraper_constant import Constant
+
+# ------ 상수 선언 ------
+_STOP = object()  # 단계 종료 신호
+
+
+# ------ 클래스 선언 ------
+class IndexSink:
+    """
+    파이프라인 결과를 OrdinanceIndex 에 바로 저장하는 출력 단계
+    결과를 메모리에 모으지 않으므로 검색결과 수와 관계없이 메모리 사용량이 일정하다
+    """
+
+    def __init__(self, ordinance_index=None, commit_every=50):
+        self.ordinance_index = ordinance_index if ordinance_index is not None else OrdinanceIndex()
+        self.commit_every = commit_every  # 몇 건마다 커밋할지
+        self.count = 0
+
+    def write(self, admin, info, clause_dict, position=None):
+        self.ordinance_index.add_ordinance(admin, info, clause_dict, commit=False)
+        self.count += 1
+        if self.count % self.commit_every == 0:
+            self.ordinance_index.commit()
+
+    def close(self):
+        self.ordinance_index.commit()
+        logging.info(f'색인 저장 완료 :\n{self.count}건')
+
+
+class ResultSink:
+    """
+    파이프라인 결과를 OrdinanceScraper 와 같은 검색결과, 조항 딕셔너리로 모으는 출력 단계 (엑셀, 보고서 작성용)
+    같은 시군구의 조례가 여러 건이면 순차 검색과 같이 검색 순서상 마지막 조례를 남긴다
+    조항 딕셔너리는 본문 저장소에 있으므로 (alrNo, histNo) 만 남기고,
+    admin_ordinance_clause_dict 는 읽을 때 저장소에서 조회하는 StoredClauseDict 이다 (결과 수와 관계없이 메모리 일정)
+    조회에 실패한 시군구는 순차 조회와 같이 조항 딕셔너리가 None 이다
+    """
+
+    def __init__(self, detail_store, next_sink=None):
+        """
+        :param detail_store: 파이프라인이 조항 딕셔너리를 저장하는 OrdinanceDetailStore
+        :param next_sink: 결과를 함께 넘길 출력 단계 (ex. IndexSink)
+        """
+        self.detail_store = detail_store
+        self.next_sink = next_sink
+        self.admin_ordinance_dict = {}
+        self.admin_ordinance_clause_dict = None  # close 후 StoredClauseDict
+        self.failed_admins = []  # close 후 조항 딕셔너리가 None 인 시군구 (나중 조례로 대체된 실패는 제외)
+        self._page_parameters = {}  # {시군구: (alrNo, histNo) 또는 None(조회 실패)}
+        self._clause_dicts = {}  # {시군구: 조항 딕셔너리} (주소에 alrNo, histNo 가 없어 저장소에 없는 조례)
+        self._positions = {}  # {시군구: 검색 순서}
+
+    def write(self, admin, info, clause_dict, position=None):
+        if self.next_sink is not None:
+            self.next_sink.write(admin, info, clause_dict, position)
+        if admin in self._positions and position is not None and position < self._positions[admin]:
+            return
+        self._positions[admin] = position if position is not None else len(self._positions)
+        self.admin_ordinance_dict[admin] = info
+        self._clause_dicts.pop(admin, None)
+        page_parameters = get_page_parameters(info['page_address']) if clause_dict is not None else None
+        self._page_parameters[admin] = page_parameters
+        if clause_dict is not None and page_parameters is None:
+            self._clause_dicts[admin] = clause_dict
+
+    def close(self):
+        # 시군구 순 정렬 (순차 검색 결과와 같은 순서)
+        self.admin_ordinance_dict = dict(sorted(self.admin_ordinance_dict.items()))
+        self.failed_admins = [admin for admin in self.admin_ordinance_dict
+                              if self._page_parameters[admin] is None and admin not in self._clause_dicts]
+        self.admin_ordinance_clause_dict = StoredClauseDict(
+            self.detail_store, {admin: self._page_parameters[admin] for admin in self.admin_ordinance_dict},
+            self._clause_dicts)
+        if self.next_sink is not None:
+            self.next_sink.close()
+
+
+class OrdinancePipeline:
+    """
+    검색 -> 본문 요청 -> 조항 파싱 -> 출력 스트리밍 파이프라인
+    단계 사이를 크기가 제한된 큐로 연결하여 요청, 파싱, 저장이 동시에 진행되고
+    큐가 차면 앞 단계가 기다리므로 메모리에는 큐 크기만큼의 조례만 올라간다
+
+    검색 -(ordinance_queue)-> 본문 요청 스레드 N개 -(html_queue)-> 파싱 스레드 M개 -(result_queue)-> 출력
+    출력 순서는 처리 완료 순서이며, 같은 시군구의 조례가 여러 건이면 모두 출력한다 (position 은 검색 순서)
+    재시도 후에도 실패한 검색 페이지, 본문은 scraper.failed_pages / failed_admins 에 기록하고 계속 진행한다
+    (본문 조회에 실패한 조례는 조항 딕셔너리 None 으로 출력)
+    scraper.journal 이 있으면 순차 조회와 같이 페이지 수, 검색 페이지, 본문, 지역을 기록하고 기록된 검색 페이지는 다시 요청하지 않는다
+    """
+
+    def __init__(self, sink, fetch_workers=Constant.PIPELINE_FETCH_WORKERS,
+                 parse_workers=Constant.PIPELINE_PARSE_WORKERS, queue_size=Constant.PIPELINE_QUEUE_SIZE,
+                 scraper=None):
+        """
+        :param sink: write(admin, info, clause_dict, position), close() 를 가진 출력 단계
+        :param fetch_workers: 본문 요청 스레드 수
+        :param parse_workers: 조항 파싱 스레드 수
+        :param queue_size: 단계 사이 큐 크기
+        :param scraper: 검색 페이지 추출, 조례 본문 저장소를 쓸 OrdinanceScraper (기본: 새로 생성)
+        """
+        self.scraper = scraper if scraper is not None else OrdinanceScraper()
+        self.sink = sink
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers
+        self.ordinance_queue = queue.Queue(maxsize=queue_size)
+        self.html_queue = queue.Queue(maxsize=queue_size)
+        self.result_queue = queue.Queue(maxsize=queue_size)
+        self._fetch_stopped = 0  # 끝난 본문 요청 스레드 수
+        self._stop_lock = threading.Lock()
+
+    def run(self, search_keyword):
+        """
+        파이프라인 실행 (출력 단계는 호출한 스레드에서 실행)
+        :param search_keyword: 검색어
+        :return: 출력한 조례 수
+        """
+        logging.info('스트리밍 파이프라인 시작')
+
+        threads = [threading.Thread(target=self._search_stage, args=(search_keyword,), daemon=True)]
+        threads += [threading.Thread(target=self._fetch_stage, daemon=True) for _ in range(self.fetch_workers)]
+        threads += [threading.Thread(target=self._parse_stage, daemon=True) for _ in range(self.parse_workers)]
+        for thread in threads:
+            thread.start()
+
+        # 출력 단계 : 파싱 스레드가 모두 끝날 때까지
+        written = 0
+        stopped = 0
+        try:
+            while stopped < self.parse_workers:
+                item = self.result_queue.get()
+                if item is _STOP:
+                    stopped += 1
+                    continue
+                self.sink.write(*item)
+                written += 1
+                admin, _, clause_dict, _ = item
+                journal = self.scraper.journal
+                if journal is not None and clause_dict is not None and admin not in journal.regions:
+                    journal.record_region(admin)
+        finally:
+            self.sink.close()
+
+        for thread in threads:
+            thread.join()
+        logging.info(f'스트리밍 파이프라인 종료 :\n{written}건')
+        return written
+
+    # ------ 내부함수 목록 ------
+    def _search_stage(self, search_keyword):
+        # 검색 페이지를 순서대로 조회하며 조례를 바로 다음 단계로 넘김
+        self.scraper.failed_pages = []
+        self.scraper.failed_admins = []
+        position = 0
+        try:
+            journal = self.scraper.journal
+            numbers_page = self.scraper.get_numbers_page(search_keyword) or 0
+            for page_number in range(1, numbers_page + 1):
+                # 이어서 실행 : 끝난 페이지는 기록된 조례정보 사용
+                if journal is not None and page_number in journal.pages:
+                    ordinance_info_list = journal.pages[page_number]
+                else:
+                    logging.info(f'{page_number} 페이지 조회중')
+                    # 페이지 하나가 실패해도 기록하고 다음 페이지로
+                    try:
+                        html = ordinance_http_client.get_text(
+                            self.scraper.get_search_page_url(search_keyword, page_number))
+                        ordinance_info_list = self.scraper.parse_search_page(html, search_keyword)
+                    except Exception as error:
+                        logging.error(f'{page_number} 페이지 조회 실패 :\n{error!r}')
+                        self.scraper.failed_pages.append(page_number)
+                        continue
+                    if journal is not None:
+                        journal.record_page(page_number, ordinance_info_list)
+                for ordinance_info in ordinance_info_list:
+                    self.ordinance_queue.put((position, ordinance_info[0], {
+                        'title': ordinance_info[1],
+                        'update_date': ordinance_info[2],
+                        'department': ordinance_info[3],
+                        'page_address': ordinance_info[4]
+                    }))
+                    position += 1
+        except Exception as error:
+            logging.error(f'검색 단계 오류 :\n{error!r}')
+        finally:
+            for _ in range(self.fetch_workers):
+                self.ordinance_queue.put(_STOP)
+
+    def _fetch_stage(self):
+        # 조례 본문 요청 (저장소에 있는 버전은 요청, 파싱 모두 생략)
+        while True:
+            item = self.ordinance_queue.get()
+            if item is _STOP:
+                break
+            position, admin, info = item
+            try:
+                page_parameters = get_page_parameters(info['page_address'])
+                clause_dict = None
+                if page_parameters is not None:
+                    clause_dict = self.scraper.detail_store.get_clause_dict(*page_parameters)
+                if clause_dict:
+                    self.html_queue.put((position, admin, info, page_parameters, None, clause_dict, False))
+                    continue
+                # 조항 딕셔너리 버전이 다르면 저장된 원문으로 다시 파싱 (요청 없음)
+                # 빈 조항 딕셔너리는 오류 페이지를 저장한 것이므로 새로 요청
+                html = None
+                if page_parameters is not None and clause_dict is None:
+                    html = self.scraper.detail_store.get_html(*page_parameters)
+                from_store = html is not None
+                if html is None:
+                    html = ordinance_http_client.get_text(info['page_address'], use_cache=False)
+                self.html_queue.put((position, admin, info, page_parameters, html, None, from_store))
+            except Exception as error:
+                logging.error(f'{admin} 본문 요청 오류 :\n{error!r}')
+                self.scraper.failed_admins.append(admin)
+                self.result_queue.put((admin, info, None, position))
+
+        # 파싱 스레드 종료 신호는 마지막 요청 스레드가 보냄
+        with self._stop_lock:
+            self._fetch_stopped += 1
+            if self._fetch_stopped == self.fetch_workers:
+                for _ in range(self.parse_workers):
+                    self.html_queue.put(_STOP)
+
+    def _parse_stage(self):
+        # 조항 파싱 후 저장소에 보관하고 출력 단계로 넘김
+        while True:
+            item = self.html_queue.get()
+            if item is _STOP:
+                break
+            position, admin, info, page_parameters, html, clause_dict, from_store = item
+            try:
+                if clause_dict is None:
+                    clause_dict = get_ordinance_clause(ordinance_parser.make_detail_soup(html))
+                    # 저장된 원문이 오류 페이지면 새로 요청, 그래도 조항이 없으면 저장하지 않고 실패 처리
+                    if not clause_dict and from_store:
+                        html = ordinance_http_client.get_text(info['page_address'], use_cache=False)
+                        clause_dict = get_ordinance_clause(ordinance_parser.make_detail_soup(html))
+                    if not clause_dict:
+                        raise EmptyOrdinancePageError(f"조항 없는 조례 페이지 : {info['page_address']}")
+                    if page_parameters is not None:
+                        self.scraper.detail_store.put(*page_parameters, html, clause_dict)
+                        if self.scraper.journal is not None:
+                            self.scraper.journal.record_detail(*page_parameters)
+                self.result_queue.put((admin, info, clause_dict, position))
+            except Exception as error:
+                logging.error(f'{admin} 조항 파싱 오류 :\n{error!r}')
+                self.scraper.failed_admins.append(admin)
+                self.result_queue.put((admin, info, None, position))
+        self.result_queue.put(_STOP)
+
+
+def run_streaming_process(search_keyword, sink=None):
+    """
+    검색어로 스트리밍 파이프라인 실행
+    :param search_keyword: 검색어
+    :param sink: 출력 단계 (기본: IndexSink)
+    :return: 출력한 조례 수
+    """
+    pipeline = OrdinancePipeline(sink if sink is not None else IndexSink())
+    return pipeline.run(search_keyword)
+
+
+if __name__ == '__main__':
+    setup_logging(log_filename=f'logs.log')
+    keyword = '농어촌민박 지원'
+
+    run_streaming_process(keyword)
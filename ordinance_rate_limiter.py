@@ -0,0 +1,192 @@
+import email.utils
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from ordinance_scraper_constant import Constant
+
+
+# ------ 함수 목록 ------
+def parse_retry_after(value):
+    """
+    Retry-After 헤더 해석 (초 또는 HTTP 날짜)
+    :param value: 헤더 값
+    :return: 기다릴 초, 해석할 수 없으면 None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def get_backoff_delay(attempt, base_delay=Constant.RETRY_BASE_DELAY, max_delay=Constant.RETRY_MAX_DELAY):
+    """
+    지수 백오프 + full jitter (0 ~ base * 2^attempt 사이 임의 시간, 최대 max_delay)
+    여러 스레드가 동시에 실패해도 같은 시각에 다시 몰리지 않도록 한다
+    :param attempt: 재시도 횟수 (0부터)
+    :return: 기다릴 초
+    """
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+# ------ 클래스 선언 ------
+class TokenBucket:
+    """
+    토큰 버킷 (초당 rate 개 요청, 최대 capacity 개까지 몰아서 허용)
+    """
+
+    def __init__(self, rate=Constant.RATE_LIMIT_RATE, capacity=Constant.RATE_LIMIT_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        토큰 하나 사용 (없으면 생길 때까지 대기)
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def set_rate(self, rate):
+        with self._lock:
+            self.rate = rate
+
+
+class AimdController:
+    """
+    AIMD(additive increase, multiplicative decrease) 동시 요청 수 조절
+    - 응답이 빠르면(latency_target 이하) 동시 요청 수 한도만큼 성공할 때마다 한도 +1
+    - 응답이 느리거나 오류/429/503 이면 한도 x decrease_factor (cooldown 동안 한 번만)
+    """
+
+    def __init__(self, initial=Constant.AIMD_INITIAL_CONCURRENCY, minimum=Constant.AIMD_MIN_CONCURRENCY,
+                 maximum=Constant.AIMD_MAX_CONCURRENCY, latency_target=Constant.AIMD_LATENCY_TARGET,
+                 decrease_factor=Constant.AIMD_DECREASE_FACTOR, cooldown=Constant.AIMD_COOLDOWN):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self._in_flight >= int(self.limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self):
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def on_success(self, latency):
+        """
+        :param latency: 응답 시간(초)
+        :return: 한도를 줄였으면 True
+        """
+        if latency > self.latency_target:
+            return self.on_congestion()
+        with self._condition:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+        return False
+
+    def on_congestion(self):
+        """
+        혼잡 신호 (느린 응답, 오류, 429/503)
+        :return: 한도를 줄였으면 True
+        """
+        with self._condition:
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return False
+            self._last_decrease = now
+            self.limit = max(self.minimum, self.limit * self.decrease_factor)
+        logging.info(f'동시 요청 수 감소 :\n{self.limit:.1f}')
+        return True
+
+
+class RateLimiter:
+    """
+    공용 요청 속도 제한 (ordinance_http_client.get 에서 모든 요청이 거침)
+    토큰 버킷으로 초당 요청 수를, AIMD 로 동시 요청 수를 제한하고
+    429/503 을 받으면 초당 요청 수도 절반으로 줄였다가 성공이 이어지면 천천히 다시 올린다
+    Retry-After 를 받으면 그 시각까지 모든 스레드의 요청을 멈춘다 (defer)
+    """
+
+    def __init__(self, rate=Constant.RATE_LIMIT_RATE, max_rate=Constant.RATE_LIMIT_MAX_RATE,
+                 min_rate=Constant.RATE_LIMIT_MIN_RATE):
+        self.bucket = TokenBucket(rate)
+        self.controller = AimdController()
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self._not_before = 0.0  # 이 시각(time.monotonic) 전에는 요청하지 않음 (Retry-After)
+        self._not_before_lock = threading.Lock()
+
+    @contextmanager
+    def slot(self):
+        """
+        요청 한 건 (동시 요청 자리를 얻고, Retry-After 시각까지 기다린 뒤 토큰을 얻어 실행)
+        """
+        self.controller.acquire()
+        try:
+            # 기다리는 동안 다른 응답이 시각을 늦출 수 있으므로 다시 확인
+            while True:
+                with self._not_before_lock:
+                    wait = self._not_before - time.monotonic()
+                if wait <= 0:
+                    break
+                time.sleep(wait)
+            self.bucket.acquire()
+            yield
+        finally:
+            self.controller.release()
+
+    def defer(self, seconds):
+        """
+        서버가 요청한 시간(Retry-After) 동안 모든 요청을 멈춤 (이미 더 늦은 시각이면 그대로)
+        :param seconds: 기다릴 초
+        """
+        with self._not_before_lock:
+            self._not_before = max(self._not_before, time.monotonic() + seconds)
+        logging.warning(f'Retry-After 로 요청 중지 :\n{seconds:.1f}초')
+
+    def record_success(self, latency):
+        self.controller.on_success(latency)
+        # 초당 요청 수 : 성공마다 조금씩 증가
+        if self.bucket.rate < self.max_rate:
+            self.bucket.set_rate(min(self.max_rate, self.bucket.rate + 1 / self.bucket.rate))
+
+    def record_failure(self):
+        # 연결 오류, 5xx
+        self.controller.on_congestion()
+
+    def record_throttle(self):
+        # 429/503 : 동시 요청 수와 초당 요청 수 모두 감소
+        if self.controller.on_congestion():
+            self.bucket.set_rate(max(self.min_rate, self.bucket.rate * Constant.AIMD_DECREASE_FACTOR))
+            logging.warning(f'요청 제한 응답으로 속도 감소 :\n초당 {self.bucket.rate:.1f}건')
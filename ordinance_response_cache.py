@@ -0,0 +1,169 @@
+import logging
+import sqlite3
+import threading
+import time
+import urllib.parse
+import zlib
+from pathlib import Path
+from ordinance_scraper_constant import Constant
+
+
+# ------ 함수 목록 ------
+def get_url_class(url: str) -> str:
+    """
+    URL 종류 구하기 (종류별로 캐시 유효기간이 다름)
+    :param url: 요청 URL
+    :return: 'search'(검색 페이지), 'detail'(조례 본문 페이지), 'other'
+    """
+    path = urllib.parse.urlsplit(url).path
+    if path.endswith('/totSrchList'):
+        return 'search'
+    if path.endswith('/selectAlrBdtOne'):
+        return 'detail'
+    return 'other'
+
+
+def normalize_url(url: str) -> str:
+    """
+    캐시 키로 쓸 URL 정규화
+    검색어 인코딩 방식(quote / quote_plus, 공백 / '+')이나 파라미터 순서가 달라도 같은 키가 나오도록 한다
+    값은 다시 인코딩하므로 값 안의 '&', '=', '+' 가 다른 파라미터와 섞이지 않는다
+    ex) https://www.elis.go.kr/main/totSrchList?ctpvCd=47&sggCd=920&curPage=1&category=LAW&srchKwd=%EC%8B%A4
+        -> www.elis.go.kr/main/totSrchList?category=LAW&ctpvCd=47&curPage=1&sggCd=920&srchKwd=%EC%8B%A4
+    :param url: 요청 URL
+    :return: 정규화된 키
+    """
+    parts = urllib.parse.urlsplit(url)
+    params = dict(urllib.parse.parse_qsl(parts.query, keep_blank_values=True))
+
+    if get_url_class(url) == 'search':
+        # 검색어의 연속 공백은 하나로 통일 (parse_qsl 이 '+', %20 을 모두 공백으로 디코딩)
+        params['srchKwd'] = ' '.join(params.get('srchKwd', '').split())
+        params.setdefault('ctpvCd', '')
+        params.setdefault('sggCd', '')
+        params.setdefault('curPage', '1')
+
+    query = urllib.parse.urlencode(sorted(params.items()))
+    return f'{parts.netloc.lower()}{parts.path}?{query}'
+
+
+# ------ 클래스 선언 ------
+class ResponseCache:
+    """
+    디스크(SQLite) 기반 HTTP 응답 캐시
+    - 정규화된 URL을 키로 사용
+    - URL 종류별 유효기간(Constant.CACHE_TTL), 만료 시 ETag/Last-Modified 로 조건부 요청
+    - 전체 크기가 max_bytes 를 넘으면 가장 오래 사용하지 않은 항목부터 삭제(LRU)
+    """
+
+    def __init__(self, path=None, max_bytes=Constant.CACHE_MAX_BYTES, ttl=None):
+        # 캐시 파일 경로 (기본: cache/responses.sqlite3)
+        if path is None:
+            cache_dir = Path(Constant.CACHE_DIR)
+            cache_dir.mkdir(exist_ok=True)
+            path = cache_dir / 'responses.sqlite3'
+
+        self.max_bytes = max_bytes
+        self.ttl = ttl if ttl is not None else Constant.CACHE_TTL
+
+        # 스레드 풀/asyncio 스레드에서 함께 쓰므로 연결 하나를 잠금으로 보호
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS response (
+                key           TEXT PRIMARY KEY,
+                url_class     TEXT NOT NULL,
+                body          BLOB NOT NULL,
+                etag          TEXT,
+                last_modified TEXT,
+                stored_at     REAL NOT NULL,
+                accessed_at   REAL NOT NULL,
+                size          INTEGER NOT NULL
+            )''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS response_accessed_at ON response (accessed_at)')
+        self._conn.commit()
+
+        # 현재 캐시 전체 크기
+        self._total_bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM response').fetchone()[0]
+
+    def lookup(self, url):
+        """
+        캐시 항목 조회
+        :param url: 요청 URL
+        :return: dict(body, etag, last_modified, fresh) 또는 None
+        """
+        key = normalize_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT url_class, body, etag, last_modified, stored_at FROM response WHERE key = ?',
+                (key,)).fetchone()
+            if row is None:
+                return None
+            url_class, body, etag, last_modified, stored_at = row
+
+            # 사용시간 갱신 (LRU)
+            now = time.time()
+            self._conn.execute('UPDATE response SET accessed_at = ? WHERE key = ?', (now, key))
+            self._conn.commit()
+
+        return {
+            'body': zlib.decompress(body).decode('utf-8'),
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh': now - stored_at < self.ttl.get(url_class, 0),
+        }
+
+    def store(self, url, text, etag=None, last_modified=None):
+        """
+        응답 저장 (같은 키가 있으면 교체)
+        :param url: 요청 URL
+        :param text: 응답 본문
+        :param etag: 응답 ETag 헤더
+        :param last_modified: 응답 Last-Modified 헤더
+        """
+        key = normalize_url(url)
+        body = zlib.compress(text.encode('utf-8'), 1)
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute('SELECT size FROM response WHERE key = ?', (key,)).fetchone()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO response VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, get_url_class(url), body, etag, last_modified, now, now, len(body)))
+            self._total_bytes += len(body) - (old[0] if old else 0)
+            self._evict()
+            self._conn.commit()
+
+    def revalidated(self, url):
+        """
+        조건부 요청 결과 304(변경없음)일 때 저장시각 갱신
+        :param url: 요청 URL
+        """
+        with self._lock:
+            self._conn.execute('UPDATE response SET stored_at = ? WHERE key = ?', (time.time(), normalize_url(url)))
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM response')
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ------ 내부함수 목록 ------
+    def _evict(self):
+        # 최대 크기를 넘으면 오래 사용하지 않은 항목부터 삭제
+        if self._total_bytes <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in self._conn.execute('SELECT key, size FROM response ORDER BY accessed_at').fetchall():
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._conn.execute('DELETE FROM response WHERE key = ?', (key,))
+            self._total_bytes -= size
+            evicted += 1
+        logging.debug(f'캐시 항목 삭제(LRU) :\n{evicted}')
@@ -1,13 +1,27 @@
 # from selenium import webdriver
 # from selenium.webdriver.chrome.options import Options
 # noinspection SpellCheckingInspection
+import argparse
+import asyncio
 import logging
 # noinspection SpellCheckingInspection
 import urllib.parse
 import requests
-from bs4 import BeautifulSoup
-from collections import Counter  # 요소의 개수를 쉽게 계산할 수 있는 Counter 모듈 불러오기
 import xlwrite
+import ordinance_http_client
+import ordinance_parser
+import ordinance_fast_extract
+from ordinance_clause_extractor import extract_clause_texts
+from ordinance_detail_store import OrdinanceDetailStore, get_page_parameters
+from ordinance_delta_state import OrdinanceDeltaState
+from ordinance_index import OrdinanceIndex
+from ordinance_job_journal import JobJournal
+from ordinance_export import OrdinanceExporter
+from ordinance_near_duplicate import find_template_families
+from clause_matrix import ClauseMatrix
+from clause_title_align import ClauseTitleAligner
+import compare_report
+from clause_similarity import ClauseSimilarity
 from logging_config import setup_logging
 from ordinance_scraper_constant import Constant
 
@@ -22,9 +36,127 @@ def encode_url(text: str) -> str:
     return urllib.parse.quote_plus(text)
 
 
+def get_ordinance_info(ordinance_element, search_keyword):
+    """
+    조례 정보 조회
+    :param ordinance_element: 검색된 조례 요소
+    :param search_keyword: 검색어
+    :return: 조례정보 리스트 리턴, 조례제목과 불일치시 None 리턴
+    """
+    # 조례 제목
+    ordinance_title = ordinance_parser.select_one(ordinance_element, 'ordinance_title').get_text()[367:-12]
+
+    # 키워드 중에 조례에 하나라도 포함 되지 않으면 None 리턴
+    keyword_list = search_keyword.split(' ')
+    if any(word not in ordinance_title for word in keyword_list):
+        return None
+
+    # 조례관련정보 작성
+    ordinance_info = ordinance_parser.select_one(ordinance_element, 'ordinance_info').get_text()
+    ordinance_admin = ' '.join(ordinance_info.split(' ')[:2])
+    ordinance_update_date = ordinance_info.split(' ')[2]
+    ordinance_department = ' '.join(ordinance_info.split(' ')[3:])
+    # 페이지 주소 찾기
+    ordinance_page_parameters = ordinance_parser.select_one(ordinance_element, 'ordinance_link').get('onclick')
+    ordinance_page_parameters = (
+        ordinance_page_parameters[ordinance_page_parameters.find("s('") + 3:
+                                  ordinance_page_parameters.find("', ")],
+        ordinance_page_parameters[ordinance_page_parameters.find("', '") + 4:
+                                  ordinance_page_parameters.find("');")])
+    ordinance_page = (f"https://www.elis.go.kr/allalr/"
+                      f"selectAlrBdtOne?alrNo={ordinance_page_parameters[0]}"
+                      f"&histNo={ordinance_page_parameters[1]}&menuNm=main")
+
+    return [ordinance_admin, ordinance_title,
+            ordinance_update_date, ordinance_department, ordinance_page]
+
+
+def get_ordinance_clause(soup):
+    """
+    HTML에서 조례 조항을 추출하여 딕셔너리로 반환하는 함수.
+    조항 내용 요소는 id 색인으로 한 번에 찾고, 문단은 extract_clause_texts 로 한 번의 순회로 추출한다.
+
+    :param soup: BeautifulSoup 객체 (조례 페이지의 HTML을 파싱한 객체)
+    :return: 조례 조항을 포함하는 딕셔너리
+             예: { "제1조": ["내용1", "내용2"], "제2조": ["내용3", "내용4"] }
+    """
+
+    # 조항 요소 리스트 가져오기
+    clause_elements = ordinance_parser.select(soup, 'clause_elements_list')
+
+    # (조항 제목, 조항 ID) 리스트
+    clause_title_ids = []
+
+    for clause_element in clause_elements:
+        # 조항 제목 추출
+        clause_title = clause_element.get_text()
+
+        # 조항제목이 없을경우 넘기기
+        if '(' not in clause_title:
+            continue
+
+        # ------ 엑셀 시트제목 작성시 오류 방지 ------
+        # 조항 제목이 30자 이상이면 30자로 맞추기
+        if len(clause_title) > 30:
+            clause_title = clause_title[:30]
+        # 조항 제목에 개정등의 불필요문자 있으면 끊기
+        if '<' in clause_title:
+            clause_title = clause_title[clause_title.find('(') + 1:clause_title.find('<')]
+        else:
+            clause_title = clause_title[clause_title.find('(') + 1:clause_title.find(')')]
+
+        # 조항 ID 추출
+        clause_id = clause_element.find('a').get('href')[1:]
+        clause_title_ids.append((clause_title, clause_id))
+
+    # 조항 내용 요소 색인 (조항마다 문서 전체를 다시 찾지 않도록 한 번만 순회, 같은 id는 처음 요소)
+    clause_ids = {clause_id for _, clause_id in clause_title_ids}
+    clause_containers = {}
+    for element in soup.find_all(id=True):
+        if element['id'] in clause_ids:
+            clause_containers.setdefault(element['id'], element)
+
+    # lxml 트리는 중첩 <p> 가 형제로 나열되므로 항, 호를 앞 문단에 묶어서 추출
+    group_siblings = soup.builder.NAME == 'lxml'
+
+    ordinance_clause_dict = {}
+    for clause_title, clause_id in clause_title_ids:
+        # 해당 조항의 내용을 가져오기
+        clause_container = clause_containers.get(clause_id)
+        if not clause_container:
+            continue
+
+        # 조항 데이터를 딕셔너리에 저장
+        ordinance_clause_dict[clause_title] = extract_clause_texts(clause_container, group_siblings)
+
+    return ordinance_clause_dict
+
+
+def get_sorted_indices_by_count(admin_clause_titles):
+    # ---------- 조항 많은것 부터 내림차순으로 정렬 ----------
+    # 시군구 x 조항제목 행렬에서 열 합계로 등장 횟수 계산 (같은 횟수는 처음 등장한 순서)
+    return ClauseMatrix(admin_clause_titles).get_sorted_titles_by_count()
+
+
+def get_sorted_indices_by_name(admin_clause_titles):
+    # 중복을 제거한 조항제목을 이름(알파벳/한글순) 기준으로 정렬
+    return ClauseMatrix(admin_clause_titles).get_sorted_titles_by_name()
+
+
 # ------ 클래스 선언 ------
+class EmptyOrdinancePageError(requests.RequestException):
+    """
+    조례 본문 페이지에서 조항을 하나도 추출하지 못함 (정상 응답으로 온 오류, 점검 페이지 등)
+    (alrNo, histNo) 저장소에 넣으면 다시 요청하지 않으므로 요청 실패와 같이 처리한다
+    """
+
+
 class OrdinanceScraper:
-    def __init__(self):
+    def __init__(self, fast_extract=True, validate_fast_extract=False):
+        """
+        :param fast_extract: 검색 페이지를 DOM 생성 없이 정규식으로 추출
+        :param validate_fast_extract: 정규식 추출 결과를 DOM 추출 결과와 비교 (검증 모드, DOM 결과 사용)
+        """
         logging.info('OrdinanceScraper 클래스 실행')
 
         # ----- 상수 선언 ----
@@ -32,6 +164,19 @@ class OrdinanceScraper:
         self.headers = Constant.HEADERS
 
         # ----- 인스턴스 변수선언 ----
+        self.xlwrite = None
+        self.sorted_indices_by_name = None
+        self.sorted_indices_by_count = None
+        self.clause_matrix = None  # 시군구 x 조항제목 존재 행렬
+        self.admin_ordinance_dict = None  # 조례 딕셔너리 None값 선언
+        self.admin_ordinance_clause_dict = None  # 조례 세부조항 딕셔너리 None값 선언
+        self.ordinance_delta = None  # 증분 조회 결과 (신규/개정/변경없음 지역 리스트)
+        self.detail_store = OrdinanceDetailStore()  # 조례 본문 저장소 (alrNo, histNo 별 영구 보관)
+        self.fast_extract = fast_extract  # 검색 페이지 정규식 추출 사용 여부
+        self.validate_fast_extract = validate_fast_extract  # 정규식 추출 검증 모드
+        self.failed_pages = []  # 재시도 후에도 조회 실패한 검색 페이지 번호
+        self.failed_admins = []  # 재시도 후에도 조항 조회 실패한 지역
+        self.journal = None  # 작업 기록 (run_process 에서 생성, 이어서 실행용)
 
 
 
@@ -41,79 +186,432 @@ class OrdinanceScraper:
         logging.info('조례리스트 검색시작')
 
         # 조회할 페이지수 구하기
-        numbers_page = self._get_numbers_page_to_find(search_keyword)
+        numbers_page = self.get_numbers_page(search_keyword)
         if not numbers_page:
             logging.critical('조회할 페이지 수 실패로 프로그램 종료')
             exit()
 
         # 조례 딕셔너리 선언
         admin_ordinance_dict = dict()
+        self.failed_pages = []
 
         for page_number in range(numbers_page):
 
-            # 검색웹페이지 요청
-            req = requests.get(f'https://www.elis.go.kr/main/totSrchList?ctpvCd=&sggCd=&'
-                               f'curPage={page_number + 1}'
-                               f'&srchKwd={urllib.parse.quote_plus(search_keyword)}', headers=self.headers)
-            # BeautifulSoup로 파싱
-            soup = BeautifulSoup(req.text, "html.parser")
+            # 이어서 실행 : 끝난 페이지는 기록된 조례정보 사용
+            if self.journal is not None and page_number + 1 in self.journal.pages:
+                self._merge_ordinance_info_list(admin_ordinance_dict, self.journal.pages[page_number + 1])
+                continue
+
+            # 검색웹페이지 요청 (재시도 후에도 실패하면 기록하고 다음 페이지로)
+            try:
+                html = ordinance_http_client.get_text(self.get_search_page_url(search_keyword, page_number + 1))
+            except requests.RequestException as error:
+                logging.error(f'{page_number + 1} 페이지 조회 실패 :\n{error!r}')
+                self.failed_pages.append(page_number + 1)
+                continue
 
             logging.info(f'{page_number + 1} 페이지 조회중')
 
+            # 페이지 내 조례정보를 딕셔너리에 추가
+            ordinance_info_list = self.parse_search_page(html, search_keyword)
+            if self.journal is not None:
+                self.journal.record_page(page_number + 1, ordinance_info_list)
+            self._merge_ordinance_info_list(admin_ordinance_dict, ordinance_info_list)
+
+        self.admin_ordinance_dict = dict(sorted(admin_ordinance_dict.items()))
+
+    def get_admin_ordinance_dict_in_search_page_async(self, search_keyword,
+                                                      concurrency=Constant.SEARCH_CONCURRENCY):
+        """
+        검색 페이지를 asyncio로 동시에 조회하여 조례 딕셔너리 작성
+        결과는 페이지 순서대로 병합하므로 순차 조회와 같은 딕셔너리가 만들어진다
+        :param search_keyword: 검색어
+        :param concurrency: 동시에 요청할 최대 페이지 수
+        """
+        logging.info('조례리스트 비동기 검색시작')
+
+        # 조회할 페이지수 구하기
+        numbers_page = self.get_numbers_page(search_keyword)
+        if not numbers_page:
+            logging.critical('조회할 페이지 수 실패로 프로그램 종료')
+            exit()
+
+        # 페이지 순서대로 조례정보 리스트 받기
+        self.failed_pages = []
+        page_results = asyncio.run(self._crawl_search_pages(search_keyword, numbers_page, concurrency))
+
+        # 조례 딕셔너리 선언
+        admin_ordinance_dict = dict()
+        for ordinance_info_list in page_results:
+            self._merge_ordinance_info_list(admin_ordinance_dict, ordinance_info_list)
+
+        self.failed_pages.sort()
+        self.admin_ordinance_dict = dict(sorted(admin_ordinance_dict.items()))
+
+    def get_ordinance_clause_dict(self, incremental=False):
+        """
+        검색된 조례의 조항 딕셔너리 작성
+        :param incremental: 증분 조회 (마지막 상태와 비교하여 신규/개정/변경없음 지역 구분)
+                            신규/개정 조례도 본문 저장소를 거치므로 저장된 (alrNo, histNo) 는 다시 요청하지 않고,
+                            개정된 조례는 histNo 가 바뀌어 저장소에 없으므로 새로 요청한다
+        """
+        logging.info('조례 조항 조회시작')
+
+        # 시군구 조례조항딕셔너리 선언
+        self.admin_ordinance_clause_dict = {}
+
+        # 순차적으로 딕셔너리에서 조회 (재시도 후에도 실패한 지역은 None 으로 두고 기록)
+        self.failed_admins = []
+        for ordinance_admin, ordinance_info in self.admin_ordinance_dict.items():
+            logging.info(f'{ordinance_admin} 조회 중')
+            try:
+                self.admin_ordinance_clause_dict[ordinance_admin] = self.get_ordinance_clause_by_page(
+                    ordinance_info['page_address'])
+                if self.journal is not None and ordinance_admin not in self.journal.regions:
+                    self.journal.record_region(ordinance_admin)
+            except requests.RequestException as error:
+                logging.error(f'{ordinance_admin} 조항 조회 실패 :\n{error!r}')
+                self.failed_admins.append(ordinance_admin)
+                self.admin_ordinance_clause_dict[ordinance_admin] = None
 
-            # 페이지 내에서 조례요소 리스트로 만들기
-            ordinance_elements_list = soup.select(self.selector['ordinance_elements_list'])
-        #
-        #     # 조례리스트 순차적으로 조회
-        #     for ordinance_element in ordinance_elements_list:
-        #         # 조례 정보 검색
-        #         try:
-        #             ordinance_info = get_ordinance_info(ordinance_element, self.keyword)
-        #         except:
-        #             ordinance_info = None
-        #
-        #         # 제목과 키워들 불일치 None 값이므로 넘김
-        #         if ordinance_info is None:
-        #             continue
-        #
-        #         # 딕녀너리 작성
-        #         admin_ordinance_dict[ordinance_info[0]] = {
-        #             'title': ordinance_info[1],
-        #             'update_date': ordinance_info[2],
-        #             'department': ordinance_info[3],
-        #             'page_address': ordinance_info[4]
-        #         }
-        # self.admin_ordinance_dict = dict(sorted(admin_ordinance_dict.items()))
-
-
-    def run_process(self, search_keyword):
-
-        # 조례 검색
-        self.get_admin_ordinance_dict_in_search_page(search_keyword)
+        if incremental:
+            self._update_ordinance_delta()
+
+        self._set_clause_matrix()
+
+    def get_admin_ordinance_clause_dict_in_snapshot(self, search_keyword):
+        """
+        전국 스냅샷(ordinance_snapshot.OrdinanceSnapshot 으로 수집한 색인)에서 검색 (요청 없음)
+        :param search_keyword: 검색어 (모든 단어가 조례제목에 포함)
+        """
+        logging.info('스냅샷에서 조례 검색')
+
+        ordinance_index = OrdinanceIndex()
+        self.admin_ordinance_dict = ordinance_index.search_ordinances(search_keyword)
+        self.admin_ordinance_clause_dict = ordinance_index.get_admin_ordinance_clause_dict(self.admin_ordinance_dict)
+        ordinance_index.close()
+
+        self._set_clause_matrix()
+
+    def get_admin_ordinance_clause_dict_in_pipeline(self, search_keyword, save_index=True, incremental=False):
+        """
+        스트리밍 파이프라인(ordinance_pipeline)으로 검색, 본문 요청, 조항 파싱을 동시에 진행하여 조항 딕셔너리 작성
+        조항 딕셔너리는 본문 저장소에서 읽는 StoredClauseDict 이고 (ResultSink), save_index 이면 받는 대로 로컬 색인에도 저장한다
+        :param search_keyword: 검색어
+        :param save_index: 로컬 색인 저장 여부
+        :param incremental: 증분 조회 (get_ordinance_clause_dict 의 incremental)
+        """
+        # ordinance_pipeline 이 이 모듈을 import 하므로 함수 안에서 import
+        from ordinance_pipeline import IndexSink, OrdinancePipeline, ResultSink
+
+        sink = ResultSink(self.detail_store, IndexSink() if save_index else None)
+        OrdinancePipeline(sink, scraper=self).run(search_keyword)
+        self.admin_ordinance_dict = sink.admin_ordinance_dict
+        self.admin_ordinance_clause_dict = sink.admin_ordinance_clause_dict
+        self.failed_admins = sink.failed_admins
+        if self.failed_pages or self.failed_admins:
+            logging.warning(f'조회 실패 :\n검색 페이지 {sorted(self.failed_pages)}, 지역 {self.failed_admins}')
+
+        if incremental:
+            self._update_ordinance_delta()
+
+        self._set_clause_matrix()
+
+    def align_clause_titles(self):
+        """
+        시군구마다 조금씩 다른 조항제목(띄어쓰기, '등', 30자 잘림)을 대표 제목으로 맞춤
+        """
+        aligner = ClauseTitleAligner()
+        self.admin_ordinance_clause_dict = aligner.fit_align(self.admin_ordinance_clause_dict)
+        self._set_clause_matrix()
+
+    def run_process(self, search_keyword, use_async=False, incremental=False, save_index=True, use_snapshot=False,
+                    large_workbook=False, export_formats=None, align_titles=False, html_report=False, resume=False,
+                    use_pipeline=False, template_families=False):
+        if use_pipeline and use_async:
+            raise ValueError('use_pipeline 은 검색 단계가 이미 다른 단계와 동시에 진행되므로 use_async 와 함께 쓸 수 없음')
+
+        # 스냅샷에서 검색 (검색, 조항 모두 로컬 색인)
+        if use_snapshot:
+            self.get_admin_ordinance_clause_dict_in_snapshot(search_keyword)
+            if align_titles:
+                self.align_clause_titles()
+            self.xlwrite = xlwrite.XlWrite(search_keyword, large_workbook=large_workbook)
+            self.xlwrite.create_admin_search_resurlt(self.admin_ordinance_dict)
+            self.xlwrite.create_compare_clause_titles_sheet(self.sorted_indices_by_name, self.admin_ordinance_clause_dict,
+                                                           self.clause_matrix)
+            self.xlwrite.create_compare_clause_sheet(self.sorted_indices_by_name, self.admin_ordinance_clause_dict)
+            self.xlwrite.xl_workbook.close()
+            self._export(search_keyword, export_formats)
+            self._write_report(search_keyword, html_report)
+            self._log_template_families(template_families)
+            return
+
+        # 작업 기록 (resume 이면 이전 실행에서 끝난 페이지, 지역은 다시 요청하지 않음)
+        self.journal = JobJournal(search_keyword, resume=resume)
+
+        if use_pipeline:
+            # 스트리밍 파이프라인 (검색, 본문 요청, 조항 파싱, 색인 저장이 동시에 진행)
+            self.get_admin_ordinance_clause_dict_in_pipeline(search_keyword, save_index=save_index,
+                                                             incremental=incremental)
+        else:
+            # 조례 검색
+            if use_async:
+                self.get_admin_ordinance_dict_in_search_page_async(search_keyword)
+            else:
+                self.get_admin_ordinance_dict_in_search_page(search_keyword)
+            self.get_ordinance_clause_dict(incremental=incremental)
+            # 로컬 색인 저장 (오프라인 검색용)
+            if save_index:
+                ordinance_index = OrdinanceIndex()
+                ordinance_index.add_search_result(self.admin_ordinance_dict, self.admin_ordinance_clause_dict)
+                ordinance_index.close()
         # 엑셀 작성
-        # self.xlwrite = xlwrite.XlWrite(self.keyword)
-        # self.xlwrite.create_admin_search_resurlt(self.admin_ordinance_dict)
-        # self.get_ordinance_clause_dict()
-        # self.xlwrite.create_compare_clause_titles_sheet(self.sorted_indices_by_name, self.admin_ordinance_clause_dict)
-        # self.xlwrite.create_compare_clause_sheet(self.sorted_indices_by_name, self.admin_ordinance_clause_dict)
-        # self.xlwrite.xl_workbook.close()
+        self.xlwrite = xlwrite.XlWrite(search_keyword, large_workbook=large_workbook)
+        self.xlwrite.create_admin_search_resurlt(self.admin_ordinance_dict)
+        # 조항제목 정렬 (색인에는 원래 제목 저장)
+        if align_titles:
+            self.align_clause_titles()
+        # 분석용 파일 저장 (Parquet, CSV, JSON Lines)
+        self._export(search_keyword, export_formats)
+        self.xlwrite.create_compare_clause_titles_sheet(self.sorted_indices_by_name, self.admin_ordinance_clause_dict,
+                                                           self.clause_matrix)
+        self.xlwrite.create_compare_clause_sheet(self.sorted_indices_by_name, self.admin_ordinance_clause_dict)
+        self.xlwrite.xl_workbook.close()
+        # 조항별 탭 비교 보고서 (HTML)
+        self._write_report(search_keyword, html_report)
+        # 표준안을 베낀 조례 묶음(템플릿 가족)과 독자적으로 작성한 조례(outlier)
+        self._log_template_families(template_families)
+        if self.journal is not None:
+            self.journal.finish()
+            self.journal = None
 
-    # ------ 내부함수 목록 ------
-    def _get_numbers_page_to_find(self, search_keyword):
-        url = 'https://www.elis.go.kr/main/totSrchList?ctpvCd=&sggCd=&curPage=1&srchKwd='
+    @staticmethod
+    def get_search_page_url(search_keyword, page_number):
+        """
+        검색 페이지 URL
+        :param search_keyword: 검색어
+        :param page_number: 페이지 번호 (1부터)
+        :return: URL주소
+        """
+        return (f'https://www.elis.go.kr/main/totSrchList?ctpvCd=&sggCd=&'
+                f'curPage={page_number}'
+                f'&srchKwd={urllib.parse.quote_plus(search_keyword)}')
+
+    def parse_search_page(self, html, search_keyword):
+        """
+        검색 페이지 HTML에서 키워드와 일치하는 조례정보 리스트 추출
+        :param html: 검색 페이지 HTML
+        :param search_keyword: 검색어
+        :return: get_ordinance_info 결과 리스트 (페이지 내 순서 유지)
+        """
+        if not self.fast_extract:
+            return self._parse_search_page_dom(html, search_keyword)
+
+        # 정규식 추출 (DOM 생성 안함)
+        ordinance_info_list = ordinance_fast_extract.get_ordinance_info_list(html, search_keyword)
+        if not self.validate_fast_extract:
+            return ordinance_info_list
+
+        # 검증 모드 : DOM 추출 결과와 비교
+        dom_ordinance_info_list = self._parse_search_page_dom(html, search_keyword)
+        if ordinance_info_list != dom_ordinance_info_list:
+            logging.warning(f'정규식 추출 결과 불일치\n'
+                            f'정규식 : {ordinance_info_list}\nDOM : {dom_ordinance_info_list}')
+        return dom_ordinance_info_list
+
+    def get_ordinance_clause_by_page(self, page_address):
+        """
+        조례 페이지의 조항 딕셔너리 조회
+        이미 저장된 (alrNo, histNo) 버전이면 요청/파싱 없이 저장소에서 반환
+        조항을 하나도 추출하지 못하면 (오류, 점검 페이지) 저장하지 않고 EmptyOrdinancePageError
+        :param page_address: 조례 페이지 주소
+        :return: 조항 딕셔너리
+        """
+        page_parameters = get_page_parameters(page_address)
+        clause_dict = None
+        if page_parameters is not None:
+            clause_dict = self.detail_store.get_clause_dict(*page_parameters)
+            if clause_dict:
+                return clause_dict
+            # 조항 딕셔너리 버전이 다르면 저장된 원문으로 다시 파싱 (요청 없음)
+            # 빈 조항 딕셔너리는 오류 페이지를 저장한 것이므로 새로 요청
+            html = self.detail_store.get_html(*page_parameters) if clause_dict is None else None
+            clause_dict = get_ordinance_clause(ordinance_parser.make_detail_soup(html)) if html is not None else None
+
+        if not clause_dict:
+            # 조례 페이지 요청 (본문은 저장소에 영구 보관하므로 응답 캐시는 사용하지 않음)
+            html = ordinance_http_client.get_text(page_address, use_cache=False)
+            # BeautifulSoup로 파싱
+            soup = ordinance_parser.make_detail_soup(html)
+            clause_dict = get_ordinance_clause(soup)
+            if not clause_dict:
+                raise EmptyOrdinancePageError(f'조항 없는 조례 페이지 : {page_address}')
+
+        if page_parameters is not None:
+            self.detail_store.put(*page_parameters, html, clause_dict)
+            if self.journal is not None:
+                self.journal.record_detail(*page_parameters)
+        return clause_dict
+
+    def get_result_count(self, html):
+        """
+        검색 페이지의 총 검색건수
+        :param html: 검색 페이지 HTML
+        :return: 검색건수, 없으면 None
+        """
+        if self.fast_extract:
+            # 정규식 추출 (DOM 생성 안함)
+            result_count = ordinance_fast_extract.extract_result_count(html)
+            if not self.validate_fast_extract:
+                return result_count
 
-        # 웹페이지 요청
-        req = requests.get(url + urllib.parse.quote_plus(search_keyword), headers=self.headers)
         # BeautifulSoup로 파싱
-        soup = BeautifulSoup(req.text, "html.parser")
+        soup = ordinance_parser.make_search_soup(html)
 
         # 총 검색된 조례 갯수 구하기
         # element = soup.select_one('#container > div > div > div.list-top > div.left > p > span')
-        element = soup.select_one(self.selector['searched_ordinance_count'])
-        if not element:
+        element = ordinance_parser.select_one(soup, 'search_page_ordinance_count')
+        dom_result_count = int(element.get_text().replace(',', '')) if element else None
+
+        # 검증 모드 : DOM 추출 결과와 비교
+        if self.fast_extract and result_count != dom_result_count:
+            logging.warning(f'정규식 검색건수 불일치\n정규식 : {result_count}, DOM : {dom_result_count}')
+        return dom_result_count
+
+    def get_numbers_page(self, search_keyword):
+        """
+        조회할 검색 페이지 수 (작업 기록이 있으면 기록된 페이지 수를 요청 없이 사용하고, 새로 구하면 기록)
+        :param search_keyword: 검색어
+        :return: 페이지 수, 실패하면 False
+        """
+        if self.journal is not None and self.journal.numbers_page is not None:
+            return self.journal.numbers_page
+        numbers_page = self._get_numbers_page_to_find(search_keyword)
+        if numbers_page and self.journal is not None:
+            self.journal.record_start(numbers_page)
+        return numbers_page
+
+    # ------ 내부함수 목록 ------
+    def _update_ordinance_delta(self):
+        # 증분 조회 : 마지막 상태와 비교하고 상태 저장 (실패한 지역은 다음 조회에서 다시 비교하도록 제외)
+        delta_state = OrdinanceDeltaState()
+        self.ordinance_delta = delta_state.diff(self.admin_ordinance_dict)
+        logging.info(f"증분 조회 :\n신규 {len(self.ordinance_delta['new'])}건, "
+                     f"개정 {len(self.ordinance_delta['amended'])}건, "
+                     f"변경없음 {len(self.ordinance_delta['unchanged'])}건")
+        delta_state.update({admin: info for admin, info in self.admin_ordinance_dict.items()
+                            if admin not in self.failed_admins})
+        delta_state.save()
+
+    def _set_clause_matrix(self):
+        # 조항 딕셔너리로 존재 행렬을 한 번 만들고 정렬 순서를 구함
+        self.clause_matrix = ClauseMatrix(self.admin_ordinance_clause_dict)
+        self.sorted_indices_by_count = self.clause_matrix.get_sorted_titles_by_count()
+        self.sorted_indices_by_name = self.clause_matrix.get_sorted_titles_by_name()
+
+    def _write_report(self, search_keyword, html_report):
+        if not html_report:
+            return
+        # 조항마다 가장 전형적인(대표) 시군구를 비교 기준으로
+        similarity = ClauseSimilarity(self.admin_ordinance_clause_dict)
+        base_regions = {title: result['medoid'] for title, result in similarity.analyze_all().items()}
+        clause_data = compare_report.get_clause_data(self.sorted_indices_by_count, self.admin_ordinance_clause_dict,
+                                                     base_regions)
+        highlight_cache = compare_report.write_comparison_report(f'{search_keyword}.html', clause_data)
+        logging.info(f'비교 보고서 저장 :\n{search_keyword}.html (차이 계산 {highlight_cache.misses}회, '
+                     f'재사용 {highlight_cache.hits}회)')
+
+    def _log_template_families(self, template_families):
+        if not template_families:
+            return
+        result = find_template_families(self.admin_ordinance_clause_dict)
+        for number, family in enumerate(result['families'], start=1):
+            logging.info(f'템플릿 가족 {number} ({len(family)}개) :\n{", ".join(family)}')
+        logging.info(f'outlier ({len(result["outliers"])}개) :\n{", ".join(result["outliers"])}')
+
+    def _export(self, search_keyword, export_formats):
+        if not export_formats:
+            return
+        exporter = OrdinanceExporter(search_keyword, export_formats)
+        exporter.export_search_result(self.admin_ordinance_dict)
+        exporter.export_clauses(self.sorted_indices_by_name, self.admin_ordinance_clause_dict)
+
+    def _parse_search_page_dom(self, html, search_keyword):
+        # BeautifulSoup로 파싱
+        soup = ordinance_parser.make_search_soup(html)
+
+        # 페이지 내에서 조례요소 리스트로 만들기
+        ordinance_elements_list = ordinance_parser.select(soup, 'search_page_ordinance_elements_list')
+
+        ordinance_info_list = []
+        # 조례리스트 순차적으로 조회
+        for ordinance_element in ordinance_elements_list:
+            # 조례 정보 검색
+            try:
+                ordinance_info = get_ordinance_info(ordinance_element, search_keyword)
+            except (AttributeError, IndexError, TypeError) as error:
+                # 구조가 다른 요소 (선택자 불일치 등)
+                logging.warning(f'조례 정보 추출 실패 :\n{error!r}')
+                ordinance_info = None
+
+            # 제목과 키워들 불일치 None 값이므로 넘김
+            if ordinance_info is None:
+                continue
+            ordinance_info_list.append(ordinance_info)
+        return ordinance_info_list
+
+    @staticmethod
+    def _merge_ordinance_info_list(admin_ordinance_dict, ordinance_info_list):
+        for ordinance_info in ordinance_info_list:
+            # 딕녀너리 작성
+            admin_ordinance_dict[ordinance_info[0]] = {
+                'title': ordinance_info[1],
+                'update_date': ordinance_info[2],
+                'department': ordinance_info[3],
+                'page_address': ordinance_info[4]
+            }
+
+    async def _crawl_search_pages(self, search_keyword, numbers_page, concurrency):
+        """
+        검색 페이지 1..numbers_page 를 동시 요청 수 제한 하에 조회
+        :return: 페이지 순서대로 정렬된 조례정보 리스트의 리스트
+        """
+        # 동시 요청 수 제한
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(page_number):
+            # 이어서 실행 : 끝난 페이지는 기록된 조례정보 사용
+            if self.journal is not None and page_number in self.journal.pages:
+                return self.journal.pages[page_number]
+            async with semaphore:
+                logging.info(f'{page_number} 페이지 조회중')
+                # requests는 동기 라이브러리이므로 스레드에서 실행 (공용 커넥션 풀 재사용)
+                try:
+                    html = await asyncio.to_thread(ordinance_http_client.get_text,
+                                                   self.get_search_page_url(search_keyword, page_number))
+                except requests.RequestException as error:
+                    # 재시도 후에도 실패한 페이지는 기록하고 빈 결과
+                    logging.error(f'{page_number} 페이지 조회 실패 :\n{error!r}')
+                    self.failed_pages.append(page_number)
+                    return []
+            ordinance_info_list = self.parse_search_page(html, search_keyword)
+            if self.journal is not None:
+                self.journal.record_page(page_number, ordinance_info_list)
+            return ordinance_info_list
+
+        # gather는 입력 순서대로 결과를 돌려주므로 페이지 순서가 유지됨
+        return await asyncio.gather(*(fetch_page(page_number + 1) for page_number in range(numbers_page)))
+
+    def _get_numbers_page_to_find(self, search_keyword):
+        url = 'https://www.elis.go.kr/main/totSrchList?ctpvCd=&sggCd=&curPage=1&srchKwd='
+
+        # 웹페이지 요청
+        html = ordinance_http_client.get_text(url + urllib.parse.quote_plus(search_keyword))
+        sum_element_results_to_search = self.get_result_count(html)
+        if sum_element_results_to_search is None:
             logging.error('총 조례 건수 조회 실패')
             return False
-        sum_element_results_to_search = int(element.get_text().replace(',',''))
         logging.debug(f'조회된 조례 갯수 :\n{sum_element_results_to_search}')
 
         numbers_page_to_find = sum_element_results_to_search // 10
@@ -127,9 +625,15 @@ class OrdinanceScraper:
 
 if __name__ == '__main__':
     setup_logging(log_filename=f'logs.log')
-    keyword = '농어촌민박 지원'
 
+    parser = argparse.ArgumentParser(description='자치법규 조례 검색, 조항 비교')
+    parser.add_argument('keyword', nargs='?', default='농어촌민박 지원', help='검색어')
+    parser.add_argument('--resume', action='store_true',
+                        help='중단된 작업 이어서 실행 (끝난 검색 페이지, 지역은 다시 요청하지 않음)')
+    parser.add_argument('--template-families', action='store_true',
+                        help='표준안을 베낀 조례 묶음(템플릿 가족)과 outlier 를 로그에 기록')
+    args = parser.parse_args()
 
     crawler = OrdinanceScraper()
     # crawler.get_numbers_page_to_find()
-    crawler.run_process(keyword)
+    crawler.run_process(args.keyword, resume=args.resume, template_families=args.template_families)
@@ -4,10 +4,98 @@ class Constant:
     SELECTOR = {
         'searched_ordinance_count': '#container > div > div > div.list-top > div.left > p > span',
         'ordinance_elements_list': '#container > div.inner > div > div.search-result-list > div',
+        # 검색 페이지 부분 파싱(SEARCH_PAGE_PARTS)용 선택자
+        'search_page_ordinance_count': 'div.list-top > div.left > p > span',
+        'search_page_ordinance_elements_list': 'div.search-result-list > div',
+        # 검색결과 요소 내부
+        'ordinance_title': 'a > strong',
+        'ordinance_info': 'a > span',
+        'ordinance_link': 'a',
+        # 시군구 검색결과 첫 번째 조례 (검색 페이지 부분 파싱 기준)
+        'region_ordinance_title': 'div.search-result-list > div > a > strong',
+        'region_ordinance_info': 'div.search-result-list > div > a > span',
+        'region_ordinance_link': 'div.search-result-list > div > div > a',
+        # 조례 본문 페이지
+        'clause_elements_list': '#cms-lnb > ul > li > ul > li.curr > ul > li',
+        'clause_link_elements': '#cms-lnb > ul > li.curr > ul > li.curr > ul > li > a',
     }
 
+    # 검색 페이지에서 실제로 읽는 부분 (이 div 들만 트리로 만든다)
+    SEARCH_PAGE_PARTS = ['list-top', 'search-result-list']
+
     HEADERS = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                           "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/"
                           "120.0.0.0 Safari/537.36"
-    }
\ No newline at end of file
+    }
+
+    # ----- HTTP 클라이언트 설정 -----
+    HTTP_POOL_SIZE = 20  # 호스트당 유지할 keep-alive 커넥션 수
+    HTTP_TIMEOUT = 30  # 요청 타임아웃(초)
+
+    # ----- 비동기 검색 설정 -----
+    SEARCH_CONCURRENCY = 8  # 동시에 요청할 검색 페이지 수
+    REGION_WORKERS = 8  # 시군구별 조회 시 동시에 실행할 스레드 수
+
+    # ----- 시군구 코드 파일 (저장소 기준 경로) -----
+    ADMINISTRATIVE_CODE_FILE = 'before/administrative_code.json'
+
+    # ----- 응답 캐시 설정 -----
+    CACHE_DIR = 'cache'  # 캐시 저장 폴더
+    CACHE_MAX_BYTES = 512 * 1024 * 1024  # 응답 캐시 최대 크기 (넘으면 LRU 삭제)
+    CACHE_TTL = {  # URL 종류별 캐시 유효기간(초)
+        'search': 6 * 60 * 60,  # 검색 페이지
+        'detail': 7 * 24 * 60 * 60,  # 조례 본문 페이지
+        'other': 24 * 60 * 60,
+    }
+
+    # ----- 파서 설정 -----
+    PARSER_BACKEND = 'lxml'  # 기본 파서 (미설치 시 html.parser)
+
+    # ----- 전국 스냅샷 설정 -----
+    SNAPSHOT_WORKERS = 8  # 동시에 수집할 시군구 수
+
+    # ----- 스트리밍 파이프라인 설정 -----
+    PIPELINE_FETCH_WORKERS = 8  # 본문 요청 스레드 수
+    PIPELINE_PARSE_WORKERS = 2  # 조항 파싱 스레드 수
+    PIPELINE_QUEUE_SIZE = 32  # 단계 사이 큐 크기
+
+    # ----- 조항제목 정렬 설정 -----
+    CLAUSE_TITLE_SIMILARITY = 0.6  # 같은 조항으로 볼 제목 유사도 (문자 2-gram Jaccard)
+    CLAUSE_TITLE_TRUNCATED_LENGTH = 20  # 이 길이 이상인 제목은 잘린 제목일 수 있어 앞부분 일치도 같은 조항으로 봄
+
+    # ----- 유사 조례(템플릿 가족) 탐지 설정 -----
+    MINHASH_NUM_PERM = 128  # MinHash 해시 함수 수
+    MINHASH_BANDS = 32  # LSH 구간 수 (구간당 4개, 유사도 약 0.4 부터 후보가 됨)
+    MINHASH_THRESHOLD = 0.7  # 같은 가족으로 볼 추정 Jaccard 유사도
+    MINHASH_SHINGLE_SIZE = 5  # 문자 n-gram 길이
+
+    # ----- 조항 비교(차이 강조) 설정 -----
+    DIFF_ENGINE = 'myers'  # 'myers' (단어 단위), 'rapidfuzz' (단어 단위, 설치 필요), 'difflib' (기존 글자 단위)
+    DIFF_MAX_COST = 1000  # 비교 한 번의 최대 편집 거리 (넘으면 남은 부분 전체를 차이로 표시)
+
+    # ----- 조항 유사도 설정 -----
+    SIMILARITY_NGRAM_RANGE = (2, 3)  # 문자 n-gram 범위 (최대 3)
+    SIMILARITY_CLUSTER_THRESHOLD = 0.8  # 같은 군집으로 볼 코사인 유사도
+
+    # ----- 유사 조례 벡터 색인 설정 -----
+    VECTOR_DIM = 256  # 문자 n-gram 해시 벡터 차원 (전국 15만 건 기준 약 150MB)
+    VECTOR_LSH_TABLES = 12  # 근사 최근접 탐색 해시 테이블 수
+    VECTOR_LSH_BITS = 10  # 테이블당 초평면 수 (버킷 키 비트 수)
+    VECTOR_IDF_BITS = 24  # idf 표 크기 (n-gram 을 2^bits 칸에 해시, 차원으로 접기 전에 n-gram 별 idf)
+
+    # ----- 요청 속도 제한, 재시도 설정 -----
+    RATE_LIMIT_RATE = 5.0  # 시작 초당 요청 수
+    RATE_LIMIT_MAX_RATE = 20.0  # 최대 초당 요청 수
+    RATE_LIMIT_MIN_RATE = 0.5  # 최소 초당 요청 수
+    RATE_LIMIT_BURST = 5  # 한 번에 몰아서 보낼 수 있는 요청 수
+    AIMD_INITIAL_CONCURRENCY = 4  # 시작 동시 요청 수
+    AIMD_MIN_CONCURRENCY = 1  # 최소 동시 요청 수
+    AIMD_MAX_CONCURRENCY = HTTP_POOL_SIZE  # 최대 동시 요청 수 (커넥션 풀 크기)
+    AIMD_LATENCY_TARGET = 3.0  # 이보다 느린 응답은 혼잡으로 봄(초)
+    AIMD_DECREASE_FACTOR = 0.5  # 혼잡 시 감소 비율
+    AIMD_COOLDOWN = 5.0  # 연속 감소 방지 시간(초)
+    RETRY_MAX_ATTEMPTS = 5  # 최대 재시도 횟수
+    RETRY_BASE_DELAY = 1.0  # 첫 재시도 대기 상한(초, 재시도마다 2배)
+    RETRY_MAX_DELAY = 60.0  # 재시도 대기 상한(초)
+    RETRY_STATUS = {429, 500, 502, 503, 504}  # 재시도할 응답 코드
\ No newline at end of file
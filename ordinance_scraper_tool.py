@@ -1,11 +1,11 @@
-import requests
+import ordinance_http_client
 from bs4 import BeautifulSoup
 
 def get_numbers_page_to_find(self):
     # URL 구성 및 요청
     base_url = 'https://www.elis.go.kr/main/totSrchList?ctpvCd=&sggCd=&curPage=1&srchKwd='
     full_url = base_url + encode_url(self.keyword)
-    response = requests.get(full_url, headers=self.headers)
+    response = ordinance_http_client.get(full_url)
 
     # HTML 파싱
     soup = BeautifulSoup(response.text, "html.parser")
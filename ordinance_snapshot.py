@@ -0,0 +1,179 @@
+import argparse
+import logging
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+import ordinance_http_client
+from logging_config import setup_logging
+from ordinance_detail_store import get_page_parameters
+from ordinance_index import OrdinanceIndex, load_administrative_codes
+from ordinance_job_journal import JobJournal
+from ordinance_scraper import OrdinanceScraper
+from ordinance_scraper_constant import Constant
+
+
+# ------ 함수 목록 ------
+def get_region_page_url(administrative_code, page_number):
+    """
+    시군구 전체 조례목록 페이지 URL (검색어 없이 시군구 코드로만 조회)
+    :param administrative_code: (ctpvCd, sggCd)
+    :param page_number: 페이지 번호 (1부터)
+    :return: URL주소
+    """
+    return ('https://www.elis.go.kr/main/totSrchList?'
+            f'ctpvCd={administrative_code[0]}'
+            f'&sggCd={administrative_code[1]}'
+            f'&curPage={page_number}'
+            '&category=LAW'
+            '&srchKwd=')
+
+
+# ------ 클래스 선언 ------
+class OrdinanceSnapshot:
+    """
+    전국 조례 스냅샷
+    administrative_code.json 의 모든 시군구에 대해 전체 조례목록과 조항을 한 번 수집하여 OrdinanceIndex 에 저장한다
+    다시 실행하면 색인의 현재 버전(histNo, 제개정일)과 비교하여 신규/개정 조례만 본문을 요청한다 (증분 갱신)
+    이후 키워드 검색은 OrdinanceScraper.run_process(..., use_snapshot=True) 로 색인에서 바로 조회한다
+    수집 중 끝난 시군구, 목록 페이지는 작업 기록(JobJournal)에 남겨 중단되어도 이어서 실행할 수 있다
+    """
+
+    def __init__(self, ordinance_index=None, max_workers=Constant.SNAPSHOT_WORKERS):
+        self.scraper = OrdinanceScraper()  # 검색 페이지 추출, 조례 본문 저장소 재사용
+        self.ordinance_index = ordinance_index if ordinance_index is not None else OrdinanceIndex()
+        self.max_workers = max_workers
+
+    def crawl(self, regions=None, resume=False):
+        """
+        시군구별 전체 조례 수집 (시군구 단위로 병렬 수집, 색인 저장은 이 스레드에서 순차 처리)
+        :param regions: {시군구명: (ctpvCd, sggCd)}, None 이면 전체 시군구
+        :param resume: 중단된 수집 이어서 실행 (끝난 시군구, 목록 페이지는 다시 요청하지 않음)
+        :return: {'added': 저장한 조례 수, 'unchanged': 변경없는 조례 수, 'retired': 폐지 처리 수,
+                  'failed': [수집 실패 또는 본문 조회에 실패한 조례가 있는 시군구]}
+        """
+        if regions is None:
+            regions = load_administrative_codes()
+
+        # 작업 기록 (본문 요청도 scraper 를 통해 같은 기록에 남김)
+        journal = JobJournal('snapshot', resume=resume, path=Path(Constant.CACHE_DIR) / 'journal' / 'snapshot.jsonl')
+        self.scraper.journal = journal
+        pending_regions = {admin: code for admin, code in regions.items() if admin not in journal.regions}
+        logging.info(f'전국 스냅샷 수집시작 :\n{len(pending_regions)}개 시군구 '
+                     f'(이전 실행에서 완료 {len(regions) - len(pending_regions)}개)')
+
+        summary = {'added': 0, 'unchanged': 0, 'retired': 0, 'failed': []}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._crawl_region, admin, code): admin
+                       for admin, code in pending_regions.items()}
+            for future in as_completed(futures):
+                admin = futures[future]
+                try:
+                    region_result = future.result()
+                except Exception as error:
+                    logging.error(f'{admin} 수집 실패 :\n{error!r}')
+                    summary['failed'].append(admin)
+                    continue
+
+                # 색인 저장
+                for info, clause_dict in region_result['changed']:
+                    self.ordinance_index.add_ordinance(admin, info, clause_dict, commit=False)
+                self.ordinance_index.commit()
+                summary['added'] += len(region_result['changed'])
+                summary['unchanged'] += region_result['unchanged']
+
+                # 목록이 모두 조회된 경우에만 사라진 조례 폐지 처리 (추출한 조례 수가 총 건수와 다르면 넘김)
+                if region_result['listed'] == region_result['result_count']:
+                    summary['retired'] += self.ordinance_index.retire_missing(admin, region_result['alr_nos'])
+                else:
+                    logging.warning(f"{admin} 목록 추출 건수 불일치로 폐지 처리 생략 :\n"
+                                    f"추출 {region_result['listed']}건, 총 {region_result['result_count']}건")
+
+                # 본문 조회에 실패한 조례가 남아 있으면 완료로 기록하지 않음 (이어서 실행할 때 다시 수집)
+                if region_result['failed']:
+                    logging.warning(f"{admin} 본문 조회 실패 :\n{region_result['failed']}건")
+                    summary['failed'].append(admin)
+                else:
+                    journal.record_region(admin)
+                logging.info(f"{admin} 수집완료 :\n저장 {len(region_result['changed'])}건, "
+                             f"변경없음 {region_result['unchanged']}건, 실패 {region_result['failed']}건")
+
+        # 실패한 시군구가 있으면 기록을 남겨 두어 이어서 실행할 때 그 시군구만 다시 수집
+        if summary['failed']:
+            journal.close()
+        else:
+            journal.finish()
+        self.scraper.journal = None
+        logging.info(f'전국 스냅샷 수집결과 :\n{summary}')
+        return summary
+
+    # ------ 내부함수 목록 ------
+    def _crawl_region(self, admin, administrative_code):
+        """
+        시군구 한 곳의 전체 조례목록을 조회하고 신규/개정 조례의 조항 수집
+        이어서 실행하면 작업 기록에 있는 총 건수, 목록 페이지는 요청하지 않고 기록된 값 사용
+        :param admin: 시군구명 (작업 기록용)
+        :param administrative_code: (ctpvCd, sggCd)
+        :return: {'changed': [(조례정보, 조항 딕셔너리)], 'unchanged': 수, 'alr_nos': 목록의 조례번호 집합,
+                  'listed': 목록에서 추출한 조례 수, 'result_count': 총 조례 건수, 'failed': 본문 조회 실패 수}
+        """
+        journal = self.scraper.journal
+
+        # 첫 페이지로 전체 건수 구하기
+        first_page = None
+        result_count = journal.region_result_counts.get(admin)
+        if result_count is None:
+            first_page = ordinance_http_client.get_text(get_region_page_url(administrative_code, 1))
+            result_count = self.scraper.get_result_count(first_page)
+            if result_count is None:
+                raise ValueError('총 조례 건수 조회 실패')
+            journal.record_region_start(admin, result_count)
+        numbers_page = (result_count + 9) // 10
+
+        region_result = {'changed': [], 'unchanged': 0, 'alr_nos': set(), 'listed': 0, 'result_count': result_count,
+                         'failed': 0}
+        for page_number in range(1, numbers_page + 1):
+            ordinance_info_list = journal.region_pages.get((admin, page_number))
+            if ordinance_info_list is None:
+                html = first_page if page_number == 1 and first_page is not None else \
+                    ordinance_http_client.get_text(get_region_page_url(administrative_code, page_number))
+                # 검색어 없이 추출 (모든 조례)
+                ordinance_info_list = self.scraper.parse_search_page(html, '')
+                journal.record_region_page(admin, page_number, ordinance_info_list)
+
+            for ordinance_info in ordinance_info_list:
+                info = {
+                    'title': ordinance_info[1],
+                    'update_date': ordinance_info[2],
+                    'department': ordinance_info[3],
+                    'page_address': ordinance_info[4]
+                }
+                alr_no, hist_no = get_page_parameters(info['page_address'])
+                region_result['alr_nos'].add(alr_no)
+                region_result['listed'] += 1
+
+                # 색인의 현재 버전과 같으면 넘김
+                if self.ordinance_index.get_current_version(alr_no) == (hist_no, info['update_date']):
+                    region_result['unchanged'] += 1
+                    continue
+
+                # 재시도 후에도 본문 조회에 실패한 조례는 저장하지 않고 다음 실행에서 다시 조회
+                try:
+                    clause_dict = self.scraper.get_ordinance_clause_by_page(info['page_address'])
+                except requests.RequestException as error:
+                    logging.error(f"{info['title']} 조항 조회 실패 :\n{error!r}")
+                    region_result['failed'] += 1
+                    continue
+                region_result['changed'].append((info, clause_dict))
+        return region_result
+
+
+if __name__ == '__main__':
+    setup_logging(log_filename=f'logs.log')
+
+    parser = argparse.ArgumentParser(description='전국 조례 스냅샷 수집')
+    parser.add_argument('--resume', action='store_true',
+                        help='중단된 수집 이어서 실행 (끝난 시군구, 목록 페이지는 다시 요청하지 않음)')
+    args = parser.parse_args()
+
+    snapshot = OrdinanceSnapshot()
+    snapshot.crawl(resume=args.resume)
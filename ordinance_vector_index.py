@@ -0,0 +1,282 @@
+import json
+import logging
+from pathlib import Path
+import numpy as np
+from clause_similarity import get_clause_text, get_ngram_ids
+from logging_config import setup_logging
+from ordinance_index import OrdinanceIndex
+from ordinance_near_duplicate import get_ordinance_text
+from ordinance_scraper_constant import Constant
+
+# ------ 상수 선언 ------
+_BUCKET_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)  # n-gram id -> 차원 (곱셈 해시)
+_SIGN_MULTIPLIER = np.uint64(0xC2B2AE3D27D4EB4F)  # n-gram id -> 부호
+_IDF_MULTIPLIER = np.uint64(0xD6E8FEB86659FD93)  # n-gram id -> idf 표 칸
+_FORMAT_VERSION = 2  # 저장 형식 (2 : n-gram 별 idf)
+
+
+# ------ 함수 목록 ------
+def get_idf_buckets(ngram_ids, idf_bits=Constant.VECTOR_IDF_BITS):
+    """
+    n-gram id -> idf 표 칸
+    """
+    return ((ngram_ids * _IDF_MULTIPLIER) >> np.uint64(64 - idf_bits)).astype(np.intp)
+
+
+def get_ngram_counts(text, dim=Constant.VECTOR_DIM, idf_bits=Constant.VECTOR_IDF_BITS):
+    """
+    문자 n-gram 별 횟수와 해시 위치
+    :return: (횟수, idf 표 칸, 차원, 부호) numpy 배열 (고유 n-gram 마다)
+    """
+    ngram_ids, counts = np.unique(get_ngram_ids(text), return_counts=True)
+    idf_buckets = get_idf_buckets(ngram_ids, idf_bits)
+    buckets = ((ngram_ids * _BUCKET_MULTIPLIER) >> np.uint64(64 - (dim.bit_length() - 1))).astype(np.intp)
+    signs = np.where((ngram_ids * _SIGN_MULTIPLIER) >> np.uint64(63), -1.0, 1.0)
+    return counts, idf_buckets, buckets, signs
+
+
+def get_hashed_vector(text, idf, dim=Constant.VECTOR_DIM):
+    """
+    n-gram 마다 tf-idf 를 먼저 곱한 뒤 dim 차원에 부호 있는 해시로 모은 벡터 (차원은 2의 거듭제곱)
+    차원에 모은 뒤 idf 를 곱하면 차원마다 거의 모든 문서가 값을 가져 idf 가 의미 없으므로 n-gram 단위로 곱한다
+    :param idf: n-gram idf 표 (2^idf_bits)
+    :return: float32 numpy 배열 (dim)
+    """
+    counts, idf_buckets, buckets, signs = get_ngram_counts(text, dim, len(idf).bit_length() - 1)
+    weights = (1 + np.log(counts)) * idf[idf_buckets] * signs
+    return np.bincount(buckets, weights=weights, minlength=dim).astype(np.float32)
+
+
+# ------ 클래스 선언 ------
+class OrdinanceVectorIndex:
+    """
+    유사 조례 찾기 벡터 색인
+    조례(또는 조항) 본문을 문자 n-gram TF-IDF 를 해시로 접은 벡터로 한 번 계산해 파일로 보관하고
+    질의는 random hyperplane LSH 버킷(인접 버킷 포함)에서 후보를 모은 뒤 후보만 코사인 유사도로 다시 정렬한다
+    후보가 k 개보다 적으면 전체를 계산한다 (행렬-벡터 곱 한 번)
+
+    저장 파일 (cache/vector_index_{level}/)
+    - vectors.npy : 정규화한 벡터 [문서, dim] (불러올 때 memory map)
+    - idf.npy, planes.npy : 질의 벡터 계산용 n-gram idf 표 (불러올 때 memory map), LSH 초평면
+    - codes.npy : 문서별 테이블별 버킷 키
+    - meta.json : 문서 정보 (조례번호, 시군구, 조례제목, 조항제목)
+    """
+
+    def __init__(self, level='ordinance', path=None, dim=Constant.VECTOR_DIM, tables=Constant.VECTOR_LSH_TABLES,
+                 bits=Constant.VECTOR_LSH_BITS, seed=1, idf_bits=Constant.VECTOR_IDF_BITS):
+        """
+        :param level: 'ordinance' (조례 단위) 또는 'clause' (조항 단위)
+        :param path: 저장 폴더 (기본: cache/vector_index_{level})
+        """
+        if level not in ('ordinance', 'clause'):
+            raise ValueError(f'지원하지 않는 색인 단위 : {level}')
+        if dim & (dim - 1):
+            raise ValueError('dim 은 2의 거듭제곱이어야 합니다')
+        self.level = level
+        self.path = Path(path) if path is not None else Path(Constant.CACHE_DIR) / f'vector_index_{level}'
+        self.dim = dim
+        self.tables = tables
+        self.bits = bits
+        self.planes = np.random.default_rng(seed).standard_normal((tables, bits, dim)).astype(np.float32)
+
+        self.meta = []
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self.idf = np.ones(1 << idf_bits, dtype=np.float32)
+        self.codes = np.zeros((0, tables), dtype=np.int64)
+        self._order = None  # 테이블별 버킷 키 정렬 순서
+        self._sorted_codes = None
+
+    def build(self, documents):
+        """
+        색인 작성 (문서를 두 번 순회 : n-gram 문서 빈도, 벡터)
+        :param documents: (문서 정보 딕셔너리, 본문) iterable, 다시 순회할 수 없는 iterator 는 리스트로 바꿔 사용
+        :return: self
+        """
+        if iter(documents) is documents:
+            documents = list(documents)
+
+        # n-gram 별 문서 빈도 (idf 표 칸 단위, 인덱스 배열로 더하면 같은 칸은 문서마다 한 번만 더해짐)
+        document_frequency = np.zeros(len(self.idf), dtype=np.int32)
+        number_of_documents = 0
+        for _, text in documents:
+            document_frequency[get_idf_buckets(get_ngram_ids(text), len(self.idf).bit_length() - 1)] += 1
+            number_of_documents += 1
+        self.idf = (np.log((1 + number_of_documents) / (1 + document_frequency)) + 1).astype(np.float32)
+
+        self.meta = []
+        rows = []
+        for info, text in documents:
+            self.meta.append(info)
+            rows.append(get_hashed_vector(text, self.idf, self.dim))
+        self.vectors = self._normalize(np.array(rows, dtype=np.float32).reshape(len(rows), self.dim))
+        self.codes = self._get_codes(self.vectors)
+        self._sort_codes()
+        logging.info(f'유사 조례 색인 작성 :\n{len(self.meta)}건')
+        return self
+
+    def build_from_index(self, ordinance_index=None):
+        """
+        로컬 색인(OrdinanceIndex)의 현재 조례 전체로 작성
+        """
+        ordinance_index = ordinance_index if ordinance_index is not None else OrdinanceIndex()
+        return self.build(_Documents(lambda: self._iter_documents(ordinance_index.iter_current_ordinances())))
+
+    def build_from_clause_dict(self, admin_ordinance_dict, admin_clause_dict):
+        """
+        검색결과(OrdinanceScraper 의 admin_ordinance_dict, admin_ordinance_clause_dict)로 작성
+        """
+        return self.build(_Documents(lambda: self._iter_documents(
+            (None, admin, admin_ordinance_dict[admin]['title'] if admin_ordinance_dict.get(admin) else None,
+             clause_dict)
+            for admin, clause_dict in admin_clause_dict.items() if clause_dict)))
+
+    def save(self):
+        self.path.mkdir(parents=True, exist_ok=True)
+        np.save(self.path / 'vectors.npy', self.vectors)
+        np.save(self.path / 'idf.npy', self.idf)
+        np.save(self.path / 'planes.npy', self.planes)
+        np.save(self.path / 'codes.npy', self.codes)
+        with open(self.path / 'meta.json', 'w', encoding='utf-8') as file:
+            json.dump({'version': _FORMAT_VERSION, 'level': self.level, 'meta': self.meta}, file, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, level='ordinance', path=None):
+        """
+        저장한 색인 불러오기 (벡터는 다시 계산하지 않음)
+        """
+        index = cls(level, path, idf_bits=0)
+        with open(index.path / 'meta.json', 'r', encoding='utf-8') as file:
+            saved = json.load(file)
+        if saved.get('version') != _FORMAT_VERSION:
+            raise ValueError(f'저장 형식이 다른 색인입니다 (다시 작성 필요) :\n{index.path}')
+        index.vectors = np.load(index.path / 'vectors.npy', mmap_mode='r')
+        index.idf = np.load(index.path / 'idf.npy', mmap_mode='r')
+        index.planes = np.load(index.path / 'planes.npy')
+        index.codes = np.load(index.path / 'codes.npy')
+        index.dim = index.vectors.shape[1]
+        index.tables, index.bits = index.planes.shape[:2]
+        index.meta = saved['meta']
+        index._sort_codes()
+        return index
+
+    def get_vector(self, text):
+        """
+        질의 벡터 (본문 -> 정규화한 해시 TF-IDF 벡터)
+        """
+        return self._normalize(get_hashed_vector(text, self.idf, self.dim)[None, :])[0]
+
+    def query(self, text, k=10, per_region=False, exclude=None):
+        """
+        본문과 비슷한 조례(조항) 찾기
+        :param text: 본문 (조례 단위는 get_ordinance_text, 조항 단위는 get_clause_text 형식이면 가장 정확)
+        :param k: 결과 수
+        :param per_region: 시군구마다 가장 비슷한 한 건만
+        :param exclude: 제외할 문서 번호 집합
+        :return: [문서 정보 + {'score': 코사인 유사도}] (유사도 내림차순)
+        """
+        return self.query_vector(self.get_vector(text), k, per_region, exclude)
+
+    def query_clause_dict(self, clause_dict, k=10, per_region=False):
+        """
+        조항 딕셔너리(get_ordinance_clause 결과)와 비슷한 조례 찾기 (조례 단위 색인)
+        """
+        return self.query(get_ordinance_text(clause_dict), k, per_region)
+
+    def query_similar_to(self, position, k=10, per_region=False):
+        """
+        색인에 있는 문서와 비슷한 문서 찾기 (저장된 벡터 사용, 자기 자신 제외)
+        :param position: 문서 번호 (meta 의 순서)
+        """
+        return self.query_vector(np.asarray(self.vectors[position]), k, per_region, exclude={position})
+
+    def query_vector(self, vector, k=10, per_region=False, exclude=None):
+        exclude = exclude or set()
+        candidates = self._get_candidates(vector)
+        candidates = candidates[~np.isin(candidates, list(exclude))] if exclude else candidates
+        if len(candidates) < k:
+            candidates = np.setdiff1d(np.arange(len(self.meta)), list(exclude))
+        if len(candidates) == 0:
+            return []
+
+        scores = np.asarray(self.vectors[candidates]) @ vector
+        results = []
+        seen_regions = set()
+        for order in np.argsort(-scores, kind='stable'):
+            info = self.meta[candidates[order]]
+            if per_region:
+                if info['region'] in seen_regions:
+                    continue
+                seen_regions.add(info['region'])
+            results.append({**info, 'position': int(candidates[order]), 'score': float(scores[order])})
+            if len(results) == k:
+                break
+        return results
+
+    # ------ 내부함수 목록 ------
+    def _iter_documents(self, ordinances):
+        # 조례 단위는 조례 하나, 조항 단위는 조항 하나가 문서
+        for alr_no, admin, title, clause_dict in ordinances:
+            if self.level == 'ordinance':
+                yield {'alr_no': alr_no, 'region': admin, 'title': title}, get_ordinance_text(clause_dict)
+                continue
+            for clause_title, paragraphs in clause_dict.items():
+                yield ({'alr_no': alr_no, 'region': admin, 'title': title, 'clause_title': clause_title},
+                       get_clause_text(paragraphs))
+
+    @staticmethod
+    def _normalize(matrix):
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return (matrix / norms).astype(np.float32)
+
+    def _get_codes(self, vectors):
+        """
+        테이블별 버킷 키 (초평면 bits 개의 부호를 비트로)
+        :return: int64 배열 [문서, tables]
+        """
+        weights = (1 << np.arange(self.bits)).astype(np.int64)
+        signs = np.einsum('nd,tbd->ntb', np.asarray(vectors), self.planes) > 0
+        return (signs * weights).sum(axis=2)
+
+    def _sort_codes(self):
+        # 테이블마다 버킷 키 순서로 정렬해 두고 질의 때 이분탐색 (버킷 딕셔너리를 만들지 않음)
+        self._order = np.argsort(self.codes, axis=0, kind='stable').T
+        self._sorted_codes = np.take_along_axis(self.codes, self._order.T, axis=0).T
+
+    def _get_candidates(self, vector):
+        """
+        질의 벡터와 같은 버킷, 비트 하나만 다른 인접 버킷의 문서
+        """
+        codes = self._get_codes(vector[None, :])[0]
+        flips = np.concatenate(([0], 1 << np.arange(self.bits))).astype(np.int64)
+        candidates = []
+        for table in range(self.tables):
+            probes = codes[table] ^ flips
+            starts = np.searchsorted(self._sorted_codes[table], probes, side='left')
+            ends = np.searchsorted(self._sorted_codes[table], probes, side='right')
+            for start, end in zip(starts, ends):
+                if end > start:
+                    candidates.append(self._order[table][start:end])
+        if not candidates:
+            return np.zeros(0, dtype=np.intp)
+        return np.unique(np.concatenate(candidates))
+
+
+class _Documents:
+    """
+    여러 번 순회할 수 있는 문서 목록 (순회할 때마다 factory 로 새 generator, 전체 본문을 메모리에 두지 않음)
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+
+    def __iter__(self):
+        return iter(self.factory())
+
+
+if __name__ == '__main__':
+    setup_logging(log_filename=f'logs.log')
+
+    # 로컬 색인(전국 스냅샷)으로 조례 단위 벡터 색인 작성
+    vector_index = OrdinanceVectorIndex('ordinance').build_from_index()
+    vector_index.save()
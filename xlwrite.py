@@ -3,8 +3,13 @@ import json
 
 
 class XlWrite:
-    def __init__(self, xlsx_file):
-        self.xl_workbook = xlsxwriter.Workbook(f'{xlsx_file}.xlsx')
+    def __init__(self, xlsx_file, large_workbook=False):
+        """
+        :param xlsx_file: 저장할 파일명 (확장자 제외)
+        :param large_workbook: 대용량 모드 (xlsxwriter constant_memory, 행 단위로 바로 디스크에 기록)
+                               모든 시트는 위에서 아래로 한 행씩 작성하므로 두 모드 모두 같은 결과
+        """
+        self.xl_workbook = xlsxwriter.Workbook(f'{xlsx_file}.xlsx', {'constant_memory': large_workbook})
 
         # 서식지정
         # 서식 지정
@@ -19,8 +24,7 @@ class XlWrite:
 
         # 헤더 작성
         headers = ["지역", "조례명", "개정일", "담당 부서", "페이지 주소"]
-        for col, header in enumerate(headers):
-            sheet.write(0, col, header, self.header_format)
+        sheet.write_row(0, 0, headers, self.header_format)
 
         # 데이터 삽입
         row = 1
@@ -33,8 +37,8 @@ class XlWrite:
             else:
                 values = [region, '조례없음']
 
+            sheet.write_row(row, 0, values, self.cell_format)
             for col, value in enumerate(values):
-                sheet.write(row, col, value, self.cell_format)
                 column_widths[col] = max(column_widths[col], len(str(value)))  # 최대 길이 업데이트
             row += 1
 
@@ -43,31 +47,40 @@ class XlWrite:
             width = round(width * 1.2)
             sheet.set_column(col, col, width + 10)
 
-    def create_compare_clause_titles_sheet(self, sorted_indices, admin_clause_titles):
+    def create_compare_clause_titles_sheet(self, sorted_indices, admin_clause_titles, clause_matrix=None):
+        """
+        :param clause_matrix: clause_matrix.ClauseMatrix (있으면 조항 딕셔너리를 다시 보지 않고 존재 행렬로 작성)
+        """
 
         sheet = self.xl_workbook.add_worksheet('시군구 조항제목비교')
 
         # 헤더 작성
         headers = ['시군구'] + sorted_indices
-        for col, header in enumerate(headers):
-            sheet.write(0, col, header, self.header_format)
+        sheet.write_row(0, 0, headers, self.header_format)
 
-        # 데이터 삽입
+        # 조항제목 -> 열 번호 (셀마다 headers.index 로 찾지 않도록 미리 계산)
+        column_index = {title: col for col, title in enumerate(headers) if col > 0}
+
+        # 데이터 삽입 (한 행씩 완성해서 기록)
         row = 1
         column_widths = [len(header) for header in headers]  # 열 너비 저장
 
-        for region, info in admin_clause_titles.items():
-            for col in range(len(headers)):
-                sheet.write(row, col, '', self.cell_format)
-
-            sheet.write(row, 0, region, self.cell_format)
+        if clause_matrix is not None:
+            presence_rows = clause_matrix.get_presence_rows(sorted_indices)
+            for region, presence in zip(clause_matrix.regions, presence_rows):
+                sheet.write_row(row, 0, [region] + ['O' if value else '' for value in presence], self.cell_format)
+                row += 1
+        else:
+            for region, info in admin_clause_titles.items():
+                values = [''] * len(headers)
+                values[0] = region
 
-            if info:
-                for title, code in info.items():
-                    col = headers.index(title)
-                    sheet.write(row, col, 'O', self.cell_format)
+                if info:
+                    for title in info:
+                        values[column_index[title]] = 'O'
 
-            row += 1
+                sheet.write_row(row, 0, values, self.cell_format)
+                row += 1
 
         # 열 너비 자동 조정
         for col, width in enumerate(column_widths):
@@ -76,6 +89,24 @@ class XlWrite:
 
 
     def create_compare_clause_sheet(self, sorted_indices, admin_clause_dict):
+        """
+        조항제목마다 시트 하나 (시군구, 세부항목...)
+        시군구 조항 딕셔너리를 한 번씩만 읽어 모든 시트에 행을 추가한다
+        (admin_clause_dict 가 본문 저장소에서 읽는 StoredClauseDict 여도 조항마다 다시 읽지 않음)
+        각 시트는 위에서 아래로 한 행씩 작성하므로 대용량 모드에서도 같은 결과
+        :param sorted_indices: 시트 순서대로 정렬한 조항제목 리스트
+        :param admin_clause_dict: {시군구: {조항제목: [문단, ...]} 또는 None}
+        """
+        # 조항별 세부항목 수 (헤더를 첫 행에 먼저 기록하기 위해 미리 계산)
+        numbers_of_columns = dict.fromkeys(sorted_indices, 0)
+        for clause_dict in admin_clause_dict.values():
+            if not clause_dict:
+                continue
+            for clause_title, paragraphs in clause_dict.items():
+                if clause_title in numbers_of_columns:
+                    numbers_of_columns[clause_title] = max(numbers_of_columns[clause_title], len(paragraphs) + 1)
+
+        sheets = {}
         for clause_title in sorted_indices:
             sheet_title = clause_title
 
@@ -88,26 +119,31 @@ class XlWrite:
 
             sheet = self.xl_workbook.add_worksheet(sheet_title)
 
-            column_widths = []
-            row = 1
-            for clause_admin, clause_dict in admin_clause_dict.items():
-                if clause_title not in clause_dict:
+            # 헤더 작성 (가장 긴 행 기준으로 구한 세부항목 수)
+            number_of_columns = numbers_of_columns[clause_title]
+            sheet.write_row(0, 0, ['시군구'] + [f'세부항목 {col}' for col in range(1, number_of_columns)],
+                            self.header_format)
+            # [시트, 다음 행 번호, 열 너비]
+            sheets[clause_title] = [sheet, 1, [0] * number_of_columns]
+
+        # 이 조항이 있는 시군구의 행 (시군구, 세부항목...)
+        for clause_admin, clause_dict in admin_clause_dict.items():
+            if not clause_dict:
+                continue
+            for clause_title, paragraphs in clause_dict.items():
+                sheet_state = sheets.get(clause_title)
+                if sheet_state is None:
                     continue
-                write_value = [clause_admin] + clause_dict[clause_title]
+                sheet, row, column_widths = sheet_state
+                write_value = [clause_admin] + paragraphs
+                sheet.write_row(row, 0, write_value, self.clause_format)
                 for col, value in enumerate(write_value):
-                    sheet.write(row, col, value, self.clause_format)
-                    # 리스트 크기를 확장한 후 값 할당
-                    if col >= len(column_widths):
-                        column_widths.append(len(str(value)))
-                    else:
-                        column_widths[col] = max(column_widths[col], len(str(value)))
-                row += 1
-            # 열 너비 자동 조정
+                    column_widths[col] = max(column_widths[col], len(str(value)))
+                sheet_state[1] = row + 1
+
+        # 열 너비 자동 조정
+        for sheet, _, column_widths in sheets.values():
             for col, width in enumerate(column_widths):
                 width = round(width * 1.5)
                 sheet.set_column(col, col, width + 10)
 
-            sheet.write(0, 0, '시군구', self.header_format)
-            for col in range(1, len(column_widths)):
-                sheet.write(0, col, f'세부항목 {col}', self.header_format)
-